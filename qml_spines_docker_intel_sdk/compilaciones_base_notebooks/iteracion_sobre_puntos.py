@@ -1,11 +1,16 @@
 
 import os
 import gc
+import sys
 import subprocess
 import numpy as np
 import intelqsdk.cbindings
 from openqasm_bridge.v2 import translate
 
+# DRU_library está en intel_sdk_pruebas_modelo_base, junto a esta carpeta
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "intel_sdk_pruebas_modelo_base"))
+from DRU_library.artefactos import Artefactos
+
 
 # PARÁMETROS
 
@@ -13,6 +18,9 @@ parm_1, parm_2, parm_3 = 1.72, 2.24, 1.89
 name = "rotaciones_qd"
 sdk_name = "QD_SIM"
 
+# qasm, cpp, ll, qs y so van a un directorio en RAM que se borra entero al final
+art = Artefactos(prefijo=name + "_")
+
 print(f"Parámetros: RZ({parm_1}), RY({parm_2}), RZ({parm_3})")
 
 #circuito
@@ -25,15 +33,12 @@ ry({parm_2}) q[0];
 rz({parm_3}) q[0];
 """
 
-with open(name + ".qasm", "w") as f:
-    f.write(qasm_code)
+art.escribir(name + ".qasm", qasm_code)
 
 # TRADUCCION
 
 translated = translate(qasm_code, kernel_name="my_kernel")
-with open(name + ".cpp", "w") as f:
-    for line in translated:
-        f.write(line + "\n")
+art.escribir(name + ".cpp", translated)
 
 
 # COMPILACION
@@ -51,12 +56,12 @@ compile_cmd = [
 ]
 
 print("Compilando con backend QD_SIM...")
-subprocess.run(compile_cmd, check=True)
+subprocess.run(compile_cmd, check=True, cwd=art.directorio)
 
 # EJECUCION
 
 
-intelqsdk.cbindings.loadSdk(f"./{name}.so", sdk_name)
+intelqsdk.cbindings.loadSdk(art.ruta(name + ".so"), sdk_name)
 
 cfg = intelqsdk.cbindings.DeviceConfig(sdk_name)
 cfg.num_qubits = 1
@@ -90,21 +95,7 @@ for i, p in enumerate(probs):
 
 print("Limpiando archivos residuales...")
 
-# Detecta la ruta base automáticamente (funciona en notebooks y scripts)
-try:
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-except NameError:
-    base_dir = os.getcwd()
-
-extensions_to_delete = [".qasm", ".cpp", ".ll", ".so", ".qs", ".log"]
-
-for file in os.listdir(base_dir):
-    if any(file.endswith(ext) for ext in extensions_to_delete):
-        try:
-            os.remove(os.path.join(base_dir, file))
-            print(f"Eliminado: {file}")
-        except Exception as e:
-            print(f" No se pudo eliminar {file}: {e}")
+art.cerrar()
 
 del dev, cfg
 gc.collect()
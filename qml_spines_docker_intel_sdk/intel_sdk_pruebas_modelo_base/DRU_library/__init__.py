@@ -1,36 +1,95 @@
-from .base_functions import (
-    re_dim,
-    parametros,
-    phi_s,
-    phi_s_lineal,
-    circuito_parametrico,
-    generar_etiquetas,
-    flatten_params,
-    reshape_params,
-     dibujar_modelo_completo,
-
-)
-
-from .cost_functions import (
-    matrix_pow,
-    fidelity_cost,
-    Trace_Distance_v3,
-    Von_Neumman_Divergence_v2,
-    Renyi_Divergence_0_5,
-    Renyi_Divergence_2,
-)
-
-from .training import (
-    costo_batches,
-    make_cost_fn,
-    dibujar_modelo_completo,
-    accuracy,
-    fit,
-    predict,
-    predict_proba,
-)
-
-from .evaluation import (
-    evaluate_classification,
-    plot_loss_curve,
-)
+"""
+Librería del modelo DRU. Los nombres de abajo se importan al pedirlos (``DRU_library.fit``
+carga training.py): así ``import DRU_library`` no arrastra PennyLane, matplotlib ni sklearn,
+y las partes de solo NumPy (inferencia, modelo_guardado.cargar_modelo, artefactos) se
+pueden usar sin ellos.
+"""
+
+import importlib
+import importlib.util
+
+_EXPORTADOS = {
+    "base_functions": (
+        "re_dim",
+        "parametros",
+        "phi_s",
+        "phi_s_lineal",
+        "circuito_parametrico",
+        "generar_etiquetas",
+        "flatten_params",
+        "reshape_params",
+    ),
+    "cost_functions": (
+        "matrix_pow",
+        "fidelity_cost",
+        "fidelity_cost_indice",
+        "Trace_Distance_v3",
+        "Von_Neumman_Divergence_v2",
+        "Renyi_Divergence_0_5",
+        "Renyi_Divergence_2",
+    ),
+    "training": (
+        "costo_batches",
+        "make_cost_fn",
+        "dibujar_modelo_completo",
+        "accuracy",
+        "fit",
+        "predict",
+        "predict_proba",
+    ),
+    "evaluation": (
+        "evaluate_classification",
+        "plot_loss_curve",
+    ),
+    "sdk_backend": (
+        "angulos_lote",
+        "amplitudes_sdk",
+        "probabilidades_sdk",
+        "GestorSesiones",
+    ),
+    "fidelidad_medidas": (
+        "fidelidades",
+        "resumen_fidelidad",
+        "fidelidad_clasica",
+        "FidelidadAcumulada",
+    ),
+    "intel_device": ("IntelSDKDevice",),
+    "lectura": ("Lectura",),
+    "muestreo": ("conteos", "estimar_probabilidades", "histograma"),
+    "barrido_ruido": ("modelo_ruido", "rejilla_ruido", "barrido_dru", "barrido_ghz"),
+    "mps": ("MPS", "mps_angulos", "mps_dru", "probabilidades_mps", "circuito_mps"),
+    "exportar": ("exportar_cpp", "exportar_modelo", "cargar_exportado", "HostDRU"),
+    "planificador": ("Trabajo", "Planificador", "ejecutar_trabajos"),
+    "artefactos": ("Artefactos",),
+    "gradientes_sdk": ("GradienteSDK", "GradienteMPS", "desplazamientos"),
+    "vector_estado": ("estados_dru",),
+    "kernel_cuantico": ("estados_embedding", "gram", "KernelCuantico"),
+    "datos": ("ConjuntoDatos",),
+    "etiquetas": ("Etiquetas",),
+    "progresivo": ("agregar_capa", "mascara_capas", "fit_progresivo"),
+    "modelo_guardado": ("guardar_modelo", "cargar_modelo"),
+    "autoajuste": ("ajustar_kernel", "ajustar_dru"),
+    "estabilizador": ("Estabilizador",),
+    "clifford": ("ejecutar_operaciones", "ejecutar_qasm", "ejecutar_dru", "puntos_clifford"),
+    "metricas": ("RegistroMetricas",),
+}
+
+_MODULO = {nombre: modulo for modulo, nombres in _EXPORTADOS.items() for nombre in nombres}
+
+__all__ = list(_MODULO)
+
+
+def __getattr__(nombre):
+    modulo = _MODULO.get(nombre)
+    if modulo is None:
+        # ``DRU_library.training`` sin importarlo antes, como con el __init__ anterior
+        if not nombre.startswith("_") and importlib.util.find_spec(f".{nombre}", __name__) is not None:
+            return importlib.import_module(f".{nombre}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
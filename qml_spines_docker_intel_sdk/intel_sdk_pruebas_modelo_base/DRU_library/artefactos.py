@@ -0,0 +1,109 @@
+"""
+Archivos intermedios (.qasm, .cpp, .ll, .qs, .so) en un área temporal en RAM.
+
+Escribir en ``/workspace`` (volumen montado) es lento en Docker Desktop, así que los
+intermedios van a ``/dev/shm`` (o al temporal del sistema) y solo se copian al workspace los
+archivos pedidos:
+
+    with Artefactos(destino="/workspace/test_simulador") as art:
+        cpp = art.escribir("ghz.cpp", fuente)
+        ...                                  # compilar, cargar, ejecutar
+        art.conservar("ghz.cpp")             # lo único que llega al workspace
+
+Cada trabajo tiene su propio directorio y al cerrar se borra entero: no hace falta listar el
+directorio de trabajo ni borrar por extensión.
+
+``/dev/shm`` se usa solo si permite ejecutar (en Docker suele montarse ``noexec`` y entonces
+``loadSdk`` no podría cargar el .so). La variable ``DRU_TMP`` fija otra base.
+"""
+
+import os
+import atexit
+import shutil
+import tempfile
+
+RAM = "/dev/shm"
+
+
+def _ejecutable(ruta):
+    try:
+        flags = os.statvfs(ruta).f_flag
+    except OSError:
+        return False
+    return os.access(ruta, os.W_OK) and not flags & getattr(os, "ST_NOEXEC", 0)
+
+
+def base_rapida():
+    """``DRU_TMP``, ``/dev/shm`` si admite ejecutables, o el temporal del sistema."""
+    if os.environ.get("DRU_TMP"):
+        return os.environ["DRU_TMP"]
+    if os.path.isdir(RAM) and _ejecutable(RAM):
+        return RAM
+    return tempfile.gettempdir()
+
+
+def directorio_rapido(prefijo="dru_"):
+    """Directorio nuevo en ``base_rapida()``; quien lo crea lo borra."""
+    return tempfile.mkdtemp(prefix=prefijo, dir=base_rapida())
+
+
+_compartido = None
+
+
+def directorio_compartido():
+    """Directorio del proceso para kernels compilados (nombres por hash), borrado al salir."""
+    global _compartido
+    if _compartido is None or not os.path.isdir(_compartido):
+        _compartido = directorio_rapido("dru_sdk_")
+        atexit.register(shutil.rmtree, _compartido, True)
+    return _compartido
+
+
+class Artefactos:
+    """
+    Directorio de un trabajo en RAM.
+    destino : carpeta (p. ej. el workspace) donde se copian los archivos marcados con
+              ``conservar`` al cerrar
+    """
+
+    def __init__(self, destino=None, prefijo="dru_job_"):
+        self.destino = destino
+        self.directorio = directorio_rapido(prefijo)
+        self._conservar = []
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+    def escribir(self, nombre, contenido):
+        """Escribe texto (o una lista de líneas, como la salida de ``translate``)."""
+        if not isinstance(contenido, str):
+            contenido = "\n".join(contenido) + "\n"
+        with open(self.ruta(nombre), "w", encoding="utf8") as f:
+            f.write(contenido)
+        return self.ruta(nombre)
+
+    def conservar(self, *nombres):
+        self._conservar.extend(nombres)
+
+    def persistir(self):
+        """Copia al destino los archivos marcados que existan. Devuelve sus rutas nuevas."""
+        if self.destino is None:
+            return []
+        os.makedirs(self.destino, exist_ok=True)
+        copiados = []
+        for nombre in self._conservar:
+            if os.path.isfile(self.ruta(nombre)):
+                copiados.append(shutil.copyfile(self.ruta(nombre), os.path.join(self.destino, nombre)))
+        return copiados
+
+    def cerrar(self):
+        try:
+            self.persistir()
+        finally:
+            shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
@@ -0,0 +1,179 @@
+"""
+Ajuste de las opciones de ubicación (-p) y planificación (-S) de intel-quantum-compiler.
+
+Todos los scripts compilan con ``-p trivial -S greedy``. ``ajustar_kernel`` compila el mismo
+kernel con cada combinación disponible para la plataforma (el JSON que recibe el compilador
+según el backend), mide el tiempo de ``callCppFunction`` en el simulador y cuenta las puertas
+nativas del ``.qs`` que deja el compilador. La mejor opción se guarda por firma de circuito
+en ``~/.cache/dru_library/autoajuste.json`` (``sdk_backend.ruta_ajustes``; el directorio de
+kernels se borra al salir) y desde entonces ``compilar_kernel`` y el ``Planificador`` la usan
+sin que nadie la pida, también en otros procesos:
+
+    ajuste = ajustar_dru(capas=6, qubits=4, subcapas=2, entrelazamiento='full')
+    ajuste["opciones"]        # p. ej. ("-p", "local", "-S", "lookahead")
+
+    python -m DRU_library.autoajuste --capas 6 --qubits 4 --subcapas 2 --guardar ajustes.json
+
+Las opciones que el compilador rechaza (no existen en esa versión o para esa plataforma)
+quedan registradas con su error y no se eligen. El compilador de ``cbindings_local`` ignora
+-p y -S: con él solo se prueba el flujo, no las opciones.
+"""
+
+import os
+import re
+import time
+import argparse
+import subprocess
+import numpy as np
+
+from . import sdk_backend
+
+PLACEMENTS = ("trivial", "local", "global")
+SCHEDULERS = ("greedy", "lookahead")
+
+# instrucción nativa del .qs: qurotxy, qucphase, ... (con sus operandos QUBIT[i])
+_NATIVA = re.compile(r"^\s*(qu\w+)\s+(.*)$", re.M)
+_CORTE = re.compile(r"slice_idx=(\d+)")
+_INTRINSECO = re.compile(r"^\s*(\w+)\(", re.M)
+
+
+def candidatos(placements=PLACEMENTS, schedulers=SCHEDULERS):
+    """Combinaciones (-p, -S); la primera es la de ``OPCIONES_COMPILADOR``."""
+    opciones = [("-p", p, "-S", s) for p in placements for s in schedulers]
+    if sdk_backend.OPCIONES_COMPILADOR in opciones:
+        opciones.remove(sdk_backend.OPCIONES_COMPILADOR)
+        opciones.insert(0, sdk_backend.OPCIONES_COMPILADOR)
+    return opciones
+
+
+def contar_puertas(cpp_path, fuente=None):
+    """
+    Puertas del kernel compilado: instrucciones nativas del ``.qs`` junto a ``cpp_path``
+    (total, de dos qubits y cortes de planificación). Sin ``.qs`` (compilador local) cuenta
+    los intrínsecos de la fuente.
+    """
+    qs_path = os.path.splitext(cpp_path)[0] + ".qs"
+    if os.path.isfile(qs_path):
+        with open(qs_path, encoding="utf8", errors="replace") as f:
+            texto = f.read()
+        nativas = _NATIVA.findall(texto)
+        cortes = {int(c) for c in _CORTE.findall(texto)}
+        return {"puertas": len(nativas),
+                "dos_qubits": sum(operandos.count("QUBIT[") >= 2 for _, operandos in nativas),
+                "cortes": len(cortes), "origen": "qs"}
+    if fuente is None:
+        with open(cpp_path, encoding="utf8") as f:
+            fuente = f.read()
+    nombres = [n for n in _INTRINSECO.findall(fuente) if n in sdk_backend.PUERTAS.values()]
+    return {"puertas": len(nombres), "dos_qubits": sum(n in ("CNOT", "CZ", "SWAP") for n in nombres),
+            "cortes": None, "origen": "fuente"}
+
+
+def _medir(gestor, so_path, kernel, n_qubits, backend, repeticiones):
+    gestor.dispositivo(backend, n_qubits)
+    sdk_name, _ = gestor.cargar(so_path)
+    gestor.cb.callCppFunction(kernel, sdk_name)       # primera llamada fuera de la medida
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        gestor.cb.callCppFunction(kernel, sdk_name)
+        tiempos.append(time.perf_counter() - t0)
+    return float(np.median(tiempos))
+
+
+def elegir(resultados, tolerancia=0.05):
+    """
+    Mejor resultado sin error: entre los que quedan a ``tolerancia`` (relativa) del tiempo
+    mínimo gana el de menos puertas de dos qubits y luego menos puertas; en empate, el primero.
+    """
+    validos = [r for r in resultados if r.get("error") is None]
+    if not validos:
+        return None
+    minimo = min(r["tiempo"] for r in validos)
+    cercanos = [r for r in validos if r["tiempo"] <= minimo * (1 + tolerancia)]
+    return min(cercanos, key=lambda r: (r["dos_qubits"], r["puertas"]))
+
+
+def ajustar_kernel(fuente, n_qubits, kernel=sdk_backend.KERNEL, backend="QD_SIM", directorio=None,
+                   opciones=None, repeticiones=20, tolerancia=0.05, cbindings=None, guardar=True):
+    """
+    Compila ``fuente`` con cada juego de ``opciones`` (por defecto ``candidatos()``), mide la
+    mediana de ``repeticiones`` ejecuciones del kernel y cuenta sus puertas. Con ``guardar``
+    la elección queda en ``sdk_backend.ruta_ajustes()`` para la firma del circuito.
+    Devuelve {"opciones", "tiempo", "puertas", "dos_qubits", "firma", "resultados"}.
+    """
+    directorio = directorio or sdk_backend.directorio_kernels()
+    resultados = []
+    with sdk_backend.GestorSesiones(max_kernels=2, directorio=directorio, cbindings=cbindings) as gestor:
+        for op in opciones or candidatos():
+            op = tuple(op)
+            fila = {"opciones": op, "error": None}
+            try:
+                so_path = sdk_backend.compilar_kernel(fuente, directorio, backend, cbindings=gestor.cb,
+                                                      opciones=op)
+            except subprocess.CalledProcessError as e:
+                fila["error"] = f"el compilador terminó con código {e.returncode}"
+                resultados.append(fila)
+                continue
+            cpp_path, _ = sdk_backend.rutas_kernel(fuente, directorio, backend, op)
+            fila.update(contar_puertas(cpp_path, fuente))
+            fila["tiempo"] = _medir(gestor, so_path, kernel, n_qubits, backend, repeticiones)
+            resultados.append(fila)
+
+    mejor = elegir(resultados, tolerancia)
+    if mejor is None:
+        raise RuntimeError("Ninguna combinación de opciones compiló: "
+                           + "; ".join(f"{' '.join(r['opciones'])}: {r['error']}" for r in resultados))
+    ajuste = {"opciones": list(mejor["opciones"]), "tiempo": mejor["tiempo"],
+              "puertas": mejor["puertas"], "dos_qubits": mejor["dos_qubits"],
+              "n_qubits": n_qubits, "backend": backend}
+    if guardar:
+        sdk_backend.guardar_ajuste(fuente, ajuste, backend)
+    return {**ajuste, "opciones": mejor["opciones"], "firma": sdk_backend.firma_circuito(fuente, backend),
+            "resultados": resultados}
+
+
+def ajustar_dru(capas, qubits, subcapas, entrelazamiento='lineal', **opciones):
+    """``ajustar_kernel`` sobre el kernel paramétrico de ``amplitudes_sdk`` y ``SesionSDK``."""
+    ops = sdk_backend.operaciones_dru(capas, qubits, subcapas, entrelazamiento)
+    fuente = sdk_backend.kernel_cpp(ops, qubits, capas * subcapas * qubits * 3)
+    return ajustar_kernel(fuente, qubits, **opciones)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ajuste de -p/-S de intel-quantum-compiler para un kernel DRU.")
+    parser.add_argument("--capas", type=int, required=True)
+    parser.add_argument("--qubits", type=int, required=True)
+    parser.add_argument("--subcapas", type=int, default=1)
+    parser.add_argument("--entrelazamiento", choices=["No", "lineal", "full", "circular"], default="lineal")
+    parser.add_argument("--backend", choices=["QD_SIM", "IQS"], default="QD_SIM")
+    parser.add_argument("--placements", nargs="+", default=list(PLACEMENTS))
+    parser.add_argument("--schedulers", nargs="+", default=list(SCHEDULERS))
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--guardar", help="archivo de ajustes (por defecto DRU_AUTOAJUSTE o "
+                        "~/.cache/dru_library/autoajuste.json)")
+    parser.add_argument("--local", action="store_true", help="usar cbindings_local en vez del SDK")
+    args = parser.parse_args(argv)
+
+    cb = None
+    if args.local:
+        from . import cbindings_local as cb
+    if args.guardar:
+        os.environ["DRU_AUTOAJUSTE"] = os.path.abspath(args.guardar)
+
+    ajuste = ajustar_dru(args.capas, args.qubits, args.subcapas, args.entrelazamiento,
+                         backend=args.backend, opciones=candidatos(args.placements, args.schedulers),
+                         repeticiones=args.repeticiones, cbindings=cb)
+    for r in ajuste["resultados"]:
+        marca = "*" if r["opciones"] == ajuste["opciones"] else " "
+        if r["error"]:
+            print(f"{marca} {' '.join(r['opciones']):<28} {r['error']}")
+        else:
+            print(f"{marca} {' '.join(r['opciones']):<28} {r['tiempo'] * 1e3:9.3f} ms  "
+                  f"puertas={r['puertas']} (2q={r['dos_qubits']})")
+    print(f"\nElegidas: {' '.join(ajuste['opciones'])} (firma {ajuste['firma']})")
+    print(f"Guardadas en {sdk_backend.ruta_ajustes()}")
+
+
+if __name__ == "__main__":
+    main()
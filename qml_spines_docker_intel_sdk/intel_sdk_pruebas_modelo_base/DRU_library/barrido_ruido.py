@@ -0,0 +1,192 @@
+"""
+Barridos de modelos de ruido con un solo kernel compilado.
+
+El kernel (DRU o GHZ) se compila una vez por plataforma del compilador (QD_SIM usa su
+archivo de configuración, IQS no), y cada modelo de ruido de la rejilla se ejecuta en un
+proceso del pool: allí se carga el .so, se configura el simulador (noiseless, QD_SIM o IQS
+"custom" con callbacks PrepZ/RotationXY/CPhaseRotation como en ``iqs_custom_noise.cpp``) y
+se corren todos los puntos. Las fidelidades contra ``default.qubit`` quedan en una tabla.
+
+    modelos = rejilla_ruido(depolarizante=(0.001, 0.01, 0.05))
+    filas = barrido_dru(X, theta, w, capas, qubits, modelos, procesos=4, salida="ruido.csv")
+
+Con ruido, IQS simula trayectorias: la fidelidad de un punto es el promedio de
+|<ref|psi_t>|^2 sobre ``trayectorias`` corridas, es decir <ref|rho|ref>.
+"""
+
+import os
+import csv
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pennylane as qml
+
+from . import sdk_backend
+from .fidelidad_medidas import fidelidades, resumen_valores
+
+CANALES = ("desfase", "depolarizante", "amortiguamiento", "bitflip")
+
+# intrínseco del SDK -> puerta de PennyLane (para el estado de referencia)
+_PENNYLANE = {v: k for k, v in sdk_backend.PUERTAS.items()}
+
+
+# -----------------------
+# Modelos de ruido
+# -----------------------
+def modelo_ruido(nombre, backend="IQS", **intensidades):
+    """
+    Modelo como diccionario (se envía a los procesos). Con alguna intensidad distinta de
+    cero el simulador IQS usa simulation_type="custom"; el ruido se aplica antes de cada
+    RotationXY y CPhaseRotation, como el "pre-op depolarizing" del ejemplo de C++.
+    """
+    desconocidos = set(intensidades) - set(CANALES)
+    if desconocidos:
+        raise ValueError(f"Canales desconocidos: {sorted(desconocidos)}")
+    modelo = {"nombre": nombre, "backend": backend}
+    modelo.update({c: float(intensidades.get(c, 0.0)) for c in CANALES})
+    if backend != "IQS" and any(modelo[c] for c in CANALES):
+        raise ValueError("El ruido personalizado solo está disponible en IQS.")
+    return modelo
+
+
+def rejilla_ruido(depolarizante=(0.001, 0.01, 0.05), qd_sim=True, **otros):
+    """Rejilla típica: IQS sin ruido, QD_SIM y un modelo IQS por intensidad de cada canal."""
+    modelos = [modelo_ruido("noiseless")]
+    if qd_sim:
+        modelos.append(modelo_ruido("qd_sim", backend="QD_SIM"))
+    canales = {"depolarizante": depolarizante, **otros}
+    for canal, valores in canales.items():
+        modelos += [modelo_ruido(f"{canal}_{p:g}", **{canal: p}) for p in valores]
+    return modelos
+
+
+def _con_ruido(modelo):
+    return any(modelo[c] for c in CANALES)
+
+
+def _configurar(cb, modelo, n_qubits, semilla):
+    cfg = sdk_backend._configurar_dispositivo(cb, modelo["backend"], n_qubits)
+    if modelo["backend"] != "IQS" or not _con_ruido(modelo):
+        return cfg
+
+    pre = [modelo[c] for c in CANALES]
+    ruidosa = cb.IqsCustomOp(*pre, [], modelo["nombre"], 0.0, 0.0, 0.0, 0.0)
+    ideal = cb.IqsCustomOp(0.0, 0.0, 0.0, 0.0, [], "ideal", 0.0, 0.0, 0.0, 0.0)
+    cfg.simulation_type = "custom"
+    cfg.PrepZ = lambda q: ideal
+    cfg.RotationXY = lambda q, phi, gamma: ruidosa
+    cfg.CPhaseRotation = lambda q1, q2, gamma: ruidosa
+    if hasattr(cfg, "seed"):
+        cfg.seed = semilla
+    return cfg
+
+
+# -----------------------
+# Ejecución en un proceso
+# -----------------------
+def _ejecutar_modelo(tarea):
+    """Corre todas las filas de ángulos bajo un modelo. Devuelve (T, N, 2**n) en orden PennyLane."""
+    modelo, so_path, n_qubits, angulos, trayectorias, cbindings, semilla = tarea
+    cb = sdk_backend.cargar_cbindings(importlib.import_module(cbindings) if cbindings else None)
+    sdk_name = os.path.splitext(os.path.basename(so_path))[0]
+    cb.loadSdk(so_path, sdk_name)
+    try:
+        cfg = _configurar(cb, modelo, n_qubits, semilla)
+        dev = cb.FullStateSimulator(cfg)
+        sdk_backend._poner_listo(cb, dev, modelo["backend"])
+        refs = cb.RefVec()
+        for i in range(n_qubits):
+            refs.append(cb.QbitRef(sdk_backend.REGISTRO, i, sdk_name).get_ref())
+        buffer, _lib = sdk_backend._buffer_parametros(cb, so_path, sdk_backend.SIMBOLO, angulos.shape[1])
+
+        estados = np.empty((trayectorias, len(angulos), 2 ** n_qubits), dtype=complex)
+        for t in range(trayectorias):
+            for i, fila in enumerate(angulos):
+                buffer[:] = fila
+                cb.callCppFunction(sdk_backend.KERNEL, sdk_name)
+                estados[t, i] = sdk_backend._a_complejos(dev.getAmplitudes(refs))
+        dev.wait()
+    finally:
+        cb.unloadSdk(sdk_name)
+    return sdk_backend.a_orden_pennylane(estados, n_qubits)
+
+
+# -----------------------
+# Referencia en default.qubit
+# -----------------------
+def estados_referencia(operaciones, n_qubits, angulos):
+    """Estados ideales (N, 2**n) de las mismas operaciones, con broadcasting sobre las filas."""
+    angulos = np.atleast_2d(np.asarray(angulos, dtype=float))
+
+    @qml.qnode(qml.device("default.qubit", wires=n_qubits))
+    def circuito(a):
+        for puerta, qs, k in operaciones:
+            op = getattr(qml, _PENNYLANE[puerta])
+            if k is None:
+                op(wires=qs)
+            else:
+                op(a[:, k], wires=qs)
+        return qml.state()
+
+    estados = np.asarray(circuito(angulos))
+    return np.broadcast_to(estados, (len(angulos), 2 ** n_qubits))
+
+
+# -----------------------
+# Barrido
+# -----------------------
+def barrido_ruido(operaciones, n_qubits, angulos, modelos, trayectorias=20, procesos=None,
+                  directorio=None, cbindings=None, semilla=0, salida=None):
+    """
+    operaciones: lista de ``operaciones_dru``/``operaciones_ghz``; angulos: (N, n_params).
+    Devuelve una fila por modelo con sus parámetros, el resumen de fidelidades (media,
+    desviación, error, n) y el arreglo ``fidelidades`` (N,). Si se da ``salida`` escribe la
+    tabla (sin el arreglo) en CSV. ``procesos=0`` ejecuta todo en el proceso actual.
+    """
+    angulos = np.atleast_2d(np.asarray(angulos, dtype=float))
+    cb = sdk_backend.cargar_cbindings(cbindings)
+    directorio = directorio or sdk_backend.directorio_kernels()
+    fuente = sdk_backend.kernel_cpp(operaciones, n_qubits, angulos.shape[1])
+
+    # un .so por plataforma del compilador, compartido por todos los modelos de ese backend
+    bibliotecas = {}
+    for backend in {m["backend"] for m in modelos}:
+        bibliotecas[backend] = sdk_backend.compilar_kernel(fuente, directorio, backend=backend,
+                                                           cbindings=cb)
+
+    tareas = [(m, bibliotecas[m["backend"]], n_qubits, angulos,
+               trayectorias if _con_ruido(m) else 1, cb.__name__, semilla + i)
+              for i, m in enumerate(modelos)]
+    if procesos == 0:
+        resultados = map(_ejecutar_modelo, tareas)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_ejecutar_modelo, tareas))
+
+    referencia = estados_referencia(operaciones, n_qubits, angulos)
+    filas = []
+    for modelo, estados in zip(modelos, resultados):
+        T, N, d = estados.shape
+        F = fidelidades(np.tile(referencia, (T, 1)), estados.reshape(T * N, d)).reshape(T, N).mean(axis=0)
+        filas.append({**modelo, "trayectorias": T, **resumen_valores(F)})
+
+    if salida is not None:
+        columnas = [c for c in filas[0] if c != "fidelidades"]
+        with open(salida, "w", newline="", encoding="utf8") as f:
+            escritor = csv.DictWriter(f, fieldnames=columnas, extrasaction="ignore")
+            escritor.writeheader()
+            escritor.writerows(filas)
+    return filas
+
+
+def barrido_dru(X, theta, w, capas, qubits, modelos, entrelazamiento='lineal', **opciones):
+    """``barrido_ruido`` para el modelo DRU sobre todas las filas de X."""
+    angulos, subcapas = sdk_backend.angulos_lote(X, theta, w)
+    ops = sdk_backend.operaciones_dru(capas, qubits, subcapas, entrelazamiento)
+    return barrido_ruido(ops, qubits, angulos, modelos, **opciones)
+
+
+def barrido_ghz(n_qubits, modelos, **opciones):
+    """``barrido_ruido`` para el estado GHZ de ``n_qubits`` (un solo punto, sin ángulos)."""
+    return barrido_ruido(sdk_backend.operaciones_ghz(n_qubits), n_qubits, np.zeros((1, 0)),
+                         modelos, **opciones)
@@ -1,6 +1,8 @@
 import pennylane as qml
 from pennylane import numpy as np
 import math
+from .etiquetas import Etiquetas
+from .vector_estado import tipo_complejo
 import matplotlib.pyplot as plt
 
 # -----------------------
@@ -59,13 +61,42 @@ def phi_s_lineal(arr, theta, w):
     return phi
 
 
-def circuito_parametrico(capas, qubits, entrelazamiento='lineal'):
-    dev = qml.device("default.qubit", wires=qubits)
+def _crear_dispositivo(device, qubits, precision="double"):
+    """Dispositivo de PennyLane por nombre; "intel.qd_sim" / "intel.iqs" usan el Intel SDK."""
+    if not isinstance(device, str):
+        return device
+    if device.startswith("intel."):
+        from .intel_device import IntelSDKDevice
+        return IntelSDKDevice(wires=qubits, backend=device)
+    if device.startswith("lightning."):
+        # lightning admite el tipo del estado; default.qubit siempre simula en complex128
+        return qml.device(device, wires=qubits, c_dtype=tipo_complejo(precision))
+    return qml.device(device, wires=qubits)
+
+
+# dispositivos cuyo resultado coincide con vector_estado.estados_dru
+SIMULADORES_IDEALES = ("default.qubit", "lightning.qubit")
+
+
+def circuito_parametrico(capas, qubits, entrelazamiento='lineal', device="default.qubit", lectura=None,
+                         precision="double"):
+    """
+    QNode del modelo DRU. Devuelve qml.state(), o solo las probabilidades marginales de
+    ``lectura.qubits`` si se pasa una ``Lectura`` (ver lectura.py).
+    precision: "double" o "single" (complex64) para la simulación en lote de accuracy/predict
+               (solo inferencia: el QNode de fit/costo_batches sigue en complex128, salvo en
+               los dispositivos lightning, que simulan en la precisión pedida).
+    """
+    tipo_complejo(precision)
+    dev = _crear_dispositivo(device, qubits, precision)
 
     @qml.qnode(dev, interface="autograd")
     def modelo(x, theta, w):
-        # re-dimensionar datos
-        caracteristicas, subcapas = re_dim(x)
+        # re-dimensionar datos (salvo que ya vengan codificados, ver datos.ConjuntoDatos)
+        if qml.math.ndim(x) == 2:
+            caracteristicas, subcapas = x, len(x)
+        else:
+            caracteristicas, subcapas = re_dim(x)
         phi = phi_s(caracteristicas, theta, w)
         # phi ahora tiene forma: (subcapas * capas * qubits, 3)
 
@@ -100,22 +131,27 @@ def circuito_parametrico(capas, qubits, entrelazamiento='lineal'):
 
             idx += subcapas * qubits
 
+        if lectura is not None:
+            return lectura.medida()
         return qml.state()
 
+    # en simuladores ideales de vector de estado el mismo modelo se puede simular en lote
+    # (vector_estado.estados_dru); se decide por el dispositivo creado, no por el argumento
+    if getattr(dev, "name", None) in SIMULADORES_IDEALES:
+        modelo.arquitectura = {"capas": capas, "qubits": qubits, "entrelazamiento": entrelazamiento,
+                               "lectura": lectura, "precision": precision}
     return modelo
 
-def generar_etiquetas(C):
-    n_qubits = int(math.ceil(math.log2(C)))
-    dim = 2 ** n_qubits
-    etiquetas_ket = []
-    etiquetas_dm = []
-    print(f'NUMERO SUGERIDO DE QUBITS {n_qubits}')
-    for c in range(C):
-        estado = np.zeros(dim, dtype=complex)
-        estado[c] = 1
-        etiquetas_ket.append(estado)
-        etiquetas_dm.append(np.outer(estado, np.conj(estado)))
-    return etiquetas_ket, etiquetas_dm
+def generar_etiquetas(C, n_qubits=None, mostrar=False, precision="double"):
+    """
+    Etiquetas |c> y |c><c| de las C clases (ver etiquetas.Etiquetas): guardan solo C y el
+    tamaño del registro; ``etiquetas[c]`` arma la matriz o el ket al pedirlo (en complex64
+    con precision="single", para costos con un modelo de precisión simple).
+    """
+    etiquetas_dm = Etiquetas(C, n_qubits, dtype=tipo_complejo(precision))
+    if mostrar:
+        print(f'NUMERO SUGERIDO DE QUBITS {etiquetas_dm.n_qubits}')
+    return etiquetas_dm.kets, etiquetas_dm
 
 
 def flatten_params(params):
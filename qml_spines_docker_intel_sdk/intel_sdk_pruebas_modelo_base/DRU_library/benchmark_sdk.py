@@ -0,0 +1,162 @@
+"""
+Latencia por etapa del flujo QASM -> C++ -> .so -> simulador -> lectura.
+
+Etapas medidas en cada repetición (mismo orden que los scripts de ``test_simulador``):
+translate, compilar, loadSdk, ready (config + FullStateSimulator + ready), callCppFunction,
+lectura (getAmplitudes o getProbabilities) y limpieza (unloadSdk + borrado de archivos).
+
+    python -m DRU_library.benchmark_sdk --qubits 1 2 4 --profundidades 1 4 --salida bench.csv
+    python -m DRU_library.benchmark_sdk --local --retardos compilar=0.8,ready=0.05
+
+Con ``--local`` se usan el compilador y el runtime de ``cbindings_local`` (con retardos
+sintéticos opcionales), así que corre en cualquier Linux sin el SDK.
+"""
+
+import os
+import csv
+import time
+import shutil
+import argparse
+import subprocess
+import numpy as np
+
+from . import sdk_backend
+from .artefactos import directorio_rapido
+
+ETAPAS = ("translate", "compilar", "loadSdk", "ready", "callCppFunction", "lectura", "limpieza")
+PERCENTILES = (50, 90, 99)
+
+
+def qasm_capas(n_qubits, profundidad, rng):
+    """Circuito tipo DRU: por capa RZ-RY-RZ en cada qubit y CNOT en cadena."""
+    lineas = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{n_qubits}];"]
+    for _ in range(profundidad):
+        for q in range(n_qubits):
+            a, b, c = rng.uniform(0, np.pi, 3)
+            lineas += [f"rz({a}) q[{q}];", f"ry({b}) q[{q}];", f"rz({c}) q[{q}];"]
+        lineas += [f"cx q[{q}],q[{q + 1}];" for q in range(n_qubits - 1)]
+    return "\n".join(lineas) + "\n"
+
+
+def medir_una(cb, qasm, n_qubits, directorio, backend="QD_SIM", lectura="amplitudes", nombre="bench"):
+    """Ejecuta el flujo completo una vez y devuelve {etapa: segundos}."""
+    t = {}
+    cpp_path = os.path.join(directorio, nombre + ".cpp")
+    so_path = os.path.join(directorio, nombre + ".so")
+
+    t0 = time.perf_counter()
+    traducido = sdk_backend.traductor(cb)(qasm, kernel_name="my_kernel")
+    with open(cpp_path, "w", encoding="utf8") as f:
+        for line in traducido:
+            f.write(line + "\n")
+    t["translate"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    subprocess.run(sdk_backend.comando_compilador(cpp_path, so_path, backend, cbindings=cb),
+                   check=True, cwd=directorio, stdout=subprocess.DEVNULL)
+    t["compilar"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cb.loadSdk(so_path, nombre)
+    t["loadSdk"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cfg = sdk_backend._configurar_dispositivo(cb, backend, n_qubits)
+    dev = cb.FullStateSimulator(cfg)
+    sdk_backend._poner_listo(cb, dev, backend)
+    t["ready"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cb.callCppFunction("my_kernel", nombre)
+    t["callCppFunction"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    qbits = cb.RefVec()
+    for i in range(n_qubits):
+        qbits.append(cb.QbitRef("q", i, nombre).get_ref())
+    if lectura == "amplitudes":
+        dev.getAmplitudes(qbits)
+    else:
+        dev.getProbabilities(qbits)
+    t["lectura"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    dev.wait()
+    cb.unloadSdk(nombre)
+    del dev, cfg
+    for ruta in (cpp_path, so_path):
+        os.remove(ruta)
+    t["limpieza"] = time.perf_counter() - t0
+    return t
+
+
+def resumir(muestras):
+    """Media, percentiles y máximo de una lista de tiempos (segundos)."""
+    m = np.asarray(muestras)
+    fila = {"n": len(m), "media": float(m.mean()), "max": float(m.max())}
+    for p, v in zip(PERCENTILES, np.percentile(m, PERCENTILES)):
+        fila[f"p{p}"] = float(v)
+    return fila
+
+
+def ejecutar_benchmark(qubits=(1, 2, 4), profundidades=(1, 4), repeticiones=10, backend="QD_SIM",
+                       lectura="amplitudes", cbindings=None, salida=None, semilla=0):
+    """
+    Mide todas las combinaciones (qubits, profundidad) y devuelve una fila por etapa con sus
+    percentiles. Si se da ``salida`` escribe las filas en CSV.
+    """
+    cb = sdk_backend.cargar_cbindings(cbindings)
+    rng = np.random.default_rng(semilla)
+    directorio = directorio_rapido("dru_bench_")
+    filas = []
+    try:
+        for n in qubits:
+            for d in profundidades:
+                tiempos = {etapa: [] for etapa in ETAPAS}
+                for r in range(repeticiones):
+                    t = medir_una(cb, qasm_capas(n, d, rng), n, directorio, backend, lectura,
+                                  nombre=f"bench_{n}_{d}_{r}")
+                    for etapa in ETAPAS:
+                        tiempos[etapa].append(t[etapa])
+                for etapa in ETAPAS:
+                    filas.append({"backend": backend, "qubits": n, "profundidad": d, "etapa": etapa,
+                                  **resumir(tiempos[etapa])})
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+    if salida is not None:
+        with open(salida, "w", newline="", encoding="utf8") as f:
+            escritor = csv.DictWriter(f, fieldnames=list(filas[0]))
+            escritor.writeheader()
+            escritor.writerows(filas)
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia por etapa del flujo del Intel Quantum SDK.")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--profundidades", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--backend", choices=["QD_SIM", "IQS"], default="QD_SIM")
+    parser.add_argument("--lectura", choices=["amplitudes", "probabilidades"], default="amplitudes")
+    parser.add_argument("--salida", default="benchmark_sdk.csv")
+    parser.add_argument("--local", action="store_true", help="usar cbindings_local en vez del SDK")
+    parser.add_argument("--retardos", default="", help="retardos sintéticos, p. ej. compilar=0.5,ready=0.02")
+    args = parser.parse_args(argv)
+
+    cb = None
+    if args.local:
+        from . import cbindings_local as cb
+        cb.configurar_retardos(**{k: v for k, v in cb._leer_retardos(args.retardos).items() if v})
+
+    filas = ejecutar_benchmark(args.qubits, args.profundidades, args.repeticiones, args.backend,
+                               args.lectura, cb, args.salida)
+    for fila in filas:
+        print(f"{fila['qubits']:>3}q d={fila['profundidad']:<3} {fila['etapa']:<16} "
+              f"p50={fila['p50'] * 1e3:9.3f} ms  p90={fila['p90'] * 1e3:9.3f} ms  "
+              f"p99={fila['p99'] * 1e3:9.3f} ms")
+    print(f"\nResultados guardados en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,603 @@
+"""
+Sustituto local de ``intelqsdk.cbindings`` para correr el flujo del SDK fuera del contenedor.
+
+Implementa el subconjunto de la API que usan los scripts de ``test_simulador`` y
+``fidelidad_medidas`` (loadSdk, callCppFunction, FullStateSimulator, RefVec, QbitRef, ...)
+sobre un simulador de vector de estado en NumPy, y un ``CliffordSimulator`` sobre la tabla
+de ``estabilizador``. El "compilador" local solo copia la fuente C++ en el archivo de
+salida; ``loadSdk`` interpreta los ``quantum_kernel`` de línea recta
+(los que generan ``openqasm_bridge`` y ``sdk_backend``).
+
+Para medir el flujo sin el SDK, cada etapa puede simular una latencia fija con
+``configurar_retardos`` o con la variable ``DRU_RETARDOS="compilar=0.5,ready=0.02"`` (que
+también hereda el proceso del compilador).
+
+Uso:
+    export DRU_CBINDINGS=DRU_library.cbindings_local
+    python DRU_library/cbindings_local.py -s kernel.cpp -o kernel.so
+"""
+
+import os
+import re
+import sys
+import math
+import time
+import shutil
+import numpy as np
+
+QRT_ERROR_SUCCESS = 0
+QRT_ERROR_FAIL = 1
+
+# argv del compilador local (lo usa sdk_backend cuando se eligen estos bindings); se ejecuta el
+# archivo directamente para no importar el paquete (y PennyLane) en cada compilación
+COMPILADOR = [sys.executable, os.path.abspath(__file__)]
+
+_programas = {}      # sdk_name -> _Programa
+_por_ruta = {}       # ruta absoluta del .so -> _Programa
+_activo = None       # último FullStateSimulator listo
+
+
+# -----------------------
+# Retardos sintéticos
+# -----------------------
+ETAPAS = ("translate", "compilar", "loadSdk", "ready", "callCppFunction", "lectura", "unloadSdk")
+
+
+def _leer_retardos(texto):
+    retardos = dict.fromkeys(ETAPAS, 0.0)
+    for par in filter(None, texto.split(",")):
+        etapa, valor = par.split("=")
+        if etapa.strip() not in retardos:
+            raise ValueError(f"Etapa desconocida: {etapa}")
+        retardos[etapa.strip()] = float(valor)
+    return retardos
+
+
+RETARDOS = _leer_retardos(os.environ.get("DRU_RETARDOS", ""))
+
+
+def configurar_retardos(**retardos):
+    """Fija la latencia (segundos) de cada etapa, p. ej. configurar_retardos(compilar=0.3)."""
+    for etapa, valor in retardos.items():
+        if etapa not in RETARDOS:
+            raise ValueError(f"Etapa desconocida: {etapa}")
+        RETARDOS[etapa] = float(valor)
+    os.environ["DRU_RETARDOS"] = ",".join(f"{k}={v}" for k, v in RETARDOS.items() if v)
+
+
+def _esperar(etapa):
+    if RETARDOS[etapa]:
+        time.sleep(RETARDOS[etapa])
+
+
+# -----------------------
+# Matrices de puertas
+# -----------------------
+_S2 = 1 / math.sqrt(2)
+_FIJAS = {
+    "H": np.array([[_S2, _S2], [_S2, -_S2]], dtype=complex),
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+    "S": np.array([[1, 0], [0, 1j]], dtype=complex),
+    "Sdag": np.array([[1, 0], [0, -1j]], dtype=complex),
+    "T": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+    "Tdag": np.array([[1, 0], [0, np.exp(-1j * np.pi / 4)]], dtype=complex),
+    "CNOT": np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex),
+    "CZ": np.diag([1, 1, 1, -1]).astype(complex),
+    "SWAP": np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex),
+}
+
+
+def _rotacion(nombre, a):
+    c, s = math.cos(a / 2), math.sin(a / 2)
+    if nombre == "RX":
+        return np.array([[c, -1j * s], [-1j * s, c]])
+    if nombre == "RY":
+        return np.array([[c, -s], [s, c]], dtype=complex)
+    return np.array([[c - 1j * s, 0], [0, c + 1j * s]])
+
+
+def _toffoli():
+    m = np.eye(8, dtype=complex)
+    m[[6, 7]] = m[[7, 6]]
+    return m
+
+
+_FIJAS["Toffoli"] = _toffoli()
+_ROTACIONES = ("RX", "RY", "RZ")
+
+# puerta de un qubit -> (phi, gamma) de la RotationXY nativa (gamma None = ángulo de la puerta)
+_EJE_XY = {"RX": (0.0, None), "RY": (math.pi / 2, None), "X": (0.0, math.pi),
+           "Y": (math.pi / 2, math.pi), "H": (math.pi / 2, math.pi / 2)}
+
+
+# -----------------------
+# Lectura de la fuente C++
+# -----------------------
+_RE_QBIT = re.compile(r"^\s*qbit\s+(\w+)\s*\[\s*(\d+)\s*\]\s*;", re.M)
+_RE_CBIT = re.compile(r"^\s*cbit\s+(\w+)\s*\[\s*(\d+)\s*\]\s*;", re.M)
+_RE_DOUBLE = re.compile(r"double\s+(\w+)\s*\[\s*(\d+)\s*\]\s*;")
+_RE_KERNEL = re.compile(r"quantum_kernel\s+void\s+(\w+)\s*\(\s*\)\s*\{(.*?)\n\}", re.S)
+_RE_LLAMADA = re.compile(r"^(\w+)\s*\((.*)\)$", re.S)
+_RE_REF = re.compile(r"^(\w+)\s*\[\s*(\d+)\s*\]$")
+
+
+def _separar_argumentos(texto):
+    args, nivel, actual = [], 0, ""
+    for ch in texto:
+        if ch in "([":
+            nivel += 1
+        elif ch in ")]":
+            nivel -= 1
+        if ch == "," and nivel == 0:
+            args.append(actual.strip())
+            actual = ""
+        else:
+            actual += ch
+    if actual.strip():
+        args.append(actual.strip())
+    return args
+
+
+class _Programa:
+    """Fuente C++ interpretada: registros, arreglos de parámetros y kernels."""
+
+    def __init__(self, fuente):
+        self.qubits = {}
+        total = 0
+        for nombre, n in _RE_QBIT.findall(fuente):
+            self.qubits[nombre] = (total, int(n))
+            total += int(n)
+        self.n_qubits = total
+        self.cbits = {nombre: np.zeros(int(n), dtype=bool) for nombre, n in _RE_CBIT.findall(fuente)}
+        self.arreglos = {nombre: np.zeros(int(n)) for nombre, n in _RE_DOUBLE.findall(fuente)}
+        self.kernels = {}
+        for nombre, cuerpo in _RE_KERNEL.findall(fuente):
+            self.kernels[nombre] = self._leer_kernel(nombre, cuerpo)
+
+    def indice(self, registro, i):
+        inicio, n = self.qubits[registro]
+        if i >= n:
+            raise IndexError(f"{registro}[{i}] fuera de rango")
+        return inicio + i
+
+    def _qubit(self, arg):
+        m = _RE_REF.match(arg)
+        if m is None or m.group(1) not in self.qubits:
+            raise NotImplementedError(f"Referencia de qubit no soportada: {arg!r}")
+        return self.indice(m.group(1), int(m.group(2)))
+
+    def _angulo(self, expr):
+        expr = re.sub(r"(\w+)\s*\[", lambda m: f"_p['{m.group(1)}'][" if m.group(1) in self.arreglos
+                      else m.group(0), expr)
+        return compile(expr, "<angulo>", "eval")
+
+    def _leer_kernel(self, nombre, cuerpo):
+        pasos = []
+        cuerpo = re.sub(r"//[^\n]*", "", cuerpo)
+        for sentencia in cuerpo.split(";"):
+            sentencia = sentencia.strip()
+            if not sentencia:
+                continue
+            m = _RE_LLAMADA.match(sentencia)
+            if m is None:
+                raise NotImplementedError(f"Sentencia no soportada en {nombre}: {sentencia!r}")
+            puerta, args = m.group(1), _separar_argumentos(m.group(2))
+            if puerta in _ROTACIONES:
+                pasos.append((puerta, (self._qubit(args[0]),), self._angulo(args[1])))
+            elif puerta in _FIJAS or puerta == "PrepZ":
+                pasos.append((puerta, tuple(self._qubit(a) for a in args), None))
+            elif puerta == "MeasZ":
+                m_c = _RE_REF.match(args[1])
+                pasos.append((puerta, (self._qubit(args[0]),), (m_c.group(1), int(m_c.group(2)))))
+            elif puerta in self.kernels:
+                pasos.extend(self.kernels[puerta])
+            else:
+                raise NotImplementedError(f"Puerta no soportada en {nombre}: {puerta}")
+        return pasos
+
+
+def _evaluar(programa, angulo):
+    return float(eval(angulo, {"__builtins__": {}}, {"_p": programa.arreglos, "pi": math.pi, "M_PI": math.pi}))
+
+
+# -----------------------
+# Compilación y carga
+# -----------------------
+def compilar(argv):
+    """Compilador local: acepta las opciones de intel-quantum-compiler y copia la fuente."""
+    fuente = salida = None
+    i = 0
+    while i < len(argv):
+        if argv[i] in ("-c", "-p", "-S", "-o", "-O"):
+            if argv[i] == "-o":
+                salida = argv[i + 1]
+            i += 2
+            continue
+        if argv[i] == "-s":
+            i += 1
+            continue
+        fuente = argv[i]
+        i += 1
+    if fuente is None:
+        raise SystemExit("cbindings_local: falta el archivo fuente")
+    if salida is None:
+        salida = os.path.splitext(fuente)[0] + ".so"
+    _esperar("compilar")
+    with open(fuente, encoding="utf8") as f:
+        _Programa(f.read())  # valida la fuente como lo haría el compilador
+    shutil.copyfile(fuente, salida)
+    return salida
+
+
+def loadSdk(ruta, sdk_name):
+    _esperar("loadSdk")
+    with open(ruta, encoding="utf8") as f:
+        programa = _Programa(f.read())
+    _programas[sdk_name] = programa
+    _por_ruta[os.path.abspath(ruta)] = programa
+
+
+def unloadSdk(sdk_name):
+    _esperar("unloadSdk")
+    programa = _programas.pop(sdk_name, None)
+    for ruta in [r for r, p in _por_ruta.items() if p is programa]:
+        del _por_ruta[ruta]
+
+
+def compileProgram(compiler_path, source, *flags):
+    sdk_name = flags[flags.index("-s") + 1] if "-s" in flags else os.path.splitext(os.path.basename(source))[0]
+    salida = compilar([source, "-o", os.path.splitext(source)[0] + ".so"])
+    loadSdk(salida, sdk_name)
+
+
+def parameterBuffer(ruta, simbolo, n):
+    """Vista escribible del arreglo global ``simbolo`` (equivale a ctypes.in_dll en el .so real)."""
+    return _por_ruta[os.path.abspath(ruta)].arreglos[simbolo][:n]
+
+
+def callCppFunction(nombre, sdk_name):
+    programa = _programas[sdk_name]
+    if _activo is None:
+        raise RuntimeError("No hay un FullStateSimulator listo (falta ready()).")
+    _esperar("callCppFunction")
+    _activo._ejecutar(programa, programa.kernels[nombre])
+
+
+# -----------------------
+# Traducción OpenQASM 2 -> C++
+# -----------------------
+_QASM_PUERTAS = {
+    "h": "H", "x": "X", "y": "Y", "z": "Z", "s": "S", "sdg": "Sdag", "t": "T", "tdg": "Tdag",
+    "rx": "RX", "ry": "RY", "rz": "RZ", "cx": "CNOT", "cz": "CZ", "swap": "SWAP", "ccx": "Toffoli",
+    "reset": "PrepZ",
+}
+_RE_QASM = re.compile(r"^(\w+)\s*(?:\((.*)\))?\s+(.*)$")
+
+
+def translate(qasm, kernel_name="my_kernel"):
+    """Sustituto de ``openqasm_bridge.v2.translate`` para el subconjunto de puertas de arriba."""
+    _esperar("translate")
+    registros, cuerpo = [], []
+    for linea in qasm.split(";"):
+        linea = re.sub(r"//[^\n]*", "", linea).strip()
+        if not linea or linea.startswith(("OPENQASM", "include")):
+            continue
+        m = _RE_QASM.match(linea)
+        if m is None:
+            raise NotImplementedError(f"Instrucción QASM no soportada: {linea!r}")
+        nombre, parametros, args = m.groups()
+        if nombre == "qreg":
+            registros.append(f"qbit {args.strip()};")
+        elif nombre == "creg":
+            registros.append(f"cbit {args.strip()};")
+        elif nombre == "measure":
+            q, c = (a.strip() for a in args.split("->"))
+            cuerpo.append(f"    MeasZ({q}, {c});")
+        elif nombre in _QASM_PUERTAS:
+            qargs = [a.strip() for a in args.split(",")]
+            if parametros is not None:
+                qargs.append(parametros.strip())
+            cuerpo.append(f"    {_QASM_PUERTAS[nombre]}({', '.join(qargs)});")
+        else:
+            raise NotImplementedError(f"Puerta QASM no soportada: {nombre}")
+    return ["#include <clang/Quantum/quintrinsics.h>", "#include <cmath>", "",
+            "// The value of 'PI', to the maximum machine precision.",
+            "const double pi = std::acos(-1.0);", "", "", *registros, "",
+            "// Quantum main", f"quantum_kernel void {kernel_name}()", "{", *cuerpo, "}"]
+
+
+# -----------------------
+# Referencias e índices
+# -----------------------
+class RefVec(list):
+    pass
+
+
+class QssIndexVec(list):
+    pass
+
+
+class QbitRef:
+    def __init__(self, registro, i, sdk_name):
+        self._ref = _programas[sdk_name].indice(registro, i)
+
+    def get_ref(self):
+        return self._ref
+
+
+class QssIndex:
+    """Estado base como cadena de bits; el carácter j corresponde al qubit j de la referencia."""
+
+    def __init__(self, bits):
+        self.bits = str(bits)
+
+    def entero(self):
+        return sum(1 << j for j, b in enumerate(self.bits) if b == "1")
+
+    def __repr__(self):
+        return f"|{self.bits}>"
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __eq__(self, otro):
+        return isinstance(otro, QssIndex) and otro.bits == self.bits
+
+
+# -----------------------
+# Configuración y simulador
+# -----------------------
+class DeviceConfig:
+    def __init__(self, device_id="QD_SIM"):
+        self.device_type = device_id
+        self.num_qubits = 0
+        self.synchronous = True
+
+
+class IqsCustomOp:
+    """
+    Acción de una operación con ruido (mismo orden que el agregado de C++): intensidades de
+    desfase, despolarización, amortiguamiento y bitflip antes y después de la puerta ideal.
+    La matriz de proceso no se simula: si se da, se aplica la puerta ideal.
+    """
+
+    def __init__(self, pre_dephasing=0.0, pre_depolarizing=0.0, pre_amplitude_damping=0.0,
+                 pre_bitflip=0.0, process_matrix=(), label="", post_dephasing=0.0,
+                 post_depolarizing=0.0, post_amplitude_damping=0.0, post_bitflip=0.0):
+        self.pre = (pre_dephasing, pre_depolarizing, pre_amplitude_damping, pre_bitflip)
+        self.process_matrix = list(process_matrix)
+        self.label = label
+        self.post = (post_dephasing, post_depolarizing, post_amplitude_damping, post_bitflip)
+
+
+k_iqs_ideal_op = IqsCustomOp(label="ideal")
+
+
+class IqsConfig:
+    def __init__(self, num_qubits=0, simulation_type="noiseless", verbose=False, seed=None):
+        self.num_qubits = num_qubits
+        self.simulation_type = simulation_type
+        self.verbose = verbose
+        self.seed = seed
+        # callbacks del modo "custom"; None = operación ideal
+        self.PrepZ = None
+        self.RotationXY = None
+        self.CPhaseRotation = None
+
+
+class FullStateSimulator:
+    def __init__(self, config):
+        self.config = config
+        self._rng = np.random.default_rng(getattr(config, "seed", None))
+        self._estado = None
+
+    def ready(self):
+        global _activo
+        _esperar("ready")
+        n = int(self.config.num_qubits)
+        if n <= 0:
+            return QRT_ERROR_FAIL
+        self._estado = np.zeros((2,) * n, dtype=complex)
+        self._estado[(0,) * n] = 1
+        _activo = self
+        return QRT_ERROR_SUCCESS
+
+    def wait(self):
+        return QRT_ERROR_SUCCESS
+
+    # ---- evolución ----
+    def _aplicar(self, matriz, qubits):
+        k = len(qubits)
+        m = matriz.reshape((2,) * (2 * k))
+        est = np.tensordot(m, self._estado, axes=(list(range(k, 2 * k)), list(qubits)))
+        self._estado = np.moveaxis(est, list(range(k)), list(qubits))
+
+    def _medir(self, q):
+        p1 = float(np.sum(np.abs(np.take(self._estado, 1, axis=q)) ** 2))
+        resultado = int(self._rng.random() < p1)
+        sl = [slice(None)] * self._estado.ndim
+        sl[q] = 1 - resultado
+        self._estado[tuple(sl)] = 0
+        self._estado /= math.sqrt(p1 if resultado else 1 - p1)
+        return resultado
+
+    # ---- ruido (modo "custom" de IQS, por trayectorias) ----
+    def _operacion_ruido(self, puerta, qubits, angulo):
+        """IqsCustomOp que devuelve el callback de la operación nativa equivalente, o None."""
+        if getattr(self.config, "simulation_type", None) != "custom":
+            return None
+        if puerta == "PrepZ":
+            callback, args = getattr(self.config, "PrepZ", None), (qubits[0],)
+        elif len(qubits) == 2:
+            callback, args = getattr(self.config, "CPhaseRotation", None), (qubits[0], qubits[1], math.pi)
+        elif puerta in _EJE_XY:
+            phi, gamma = _EJE_XY[puerta]
+            callback, args = getattr(self.config, "RotationXY", None), (qubits[0], phi, angulo if gamma is None else gamma)
+        else:
+            return None   # rotaciones en Z: virtuales, sin ruido
+        return None if callback is None else callback(*args)
+
+    def _canales(self, intensidades, qubits):
+        desfase, despolarizante, amortiguamiento, bitflip = intensidades
+        for q in qubits:
+            if desfase and self._rng.random() < desfase:
+                self._aplicar(_FIJAS["Z"], (q,))
+            if despolarizante and self._rng.random() < despolarizante:
+                self._aplicar(_FIJAS["XYZ"[self._rng.integers(3)]], (q,))
+            if amortiguamiento:
+                p1 = float(np.sum(np.abs(np.take(self._estado, 1, axis=q)) ** 2))
+                salto = self._rng.random() < amortiguamiento * p1
+                k = (np.array([[0, math.sqrt(amortiguamiento)], [0, 0]]) if salto
+                     else np.diag([1, math.sqrt(1 - amortiguamiento)]))
+                self._aplicar(k.astype(complex), (q,))
+                self._estado /= np.linalg.norm(self._estado)
+            if bitflip and self._rng.random() < bitflip:
+                self._aplicar(_FIJAS["X"], (q,))
+
+    def _ejecutar(self, programa, pasos):
+        if programa.n_qubits > self._estado.ndim:
+            raise RuntimeError("El kernel usa más qubits que los configurados en el dispositivo.")
+        for puerta, qubits, extra in pasos:
+            a = _evaluar(programa, extra) if puerta in _ROTACIONES else None
+            op = self._operacion_ruido(puerta, qubits, a) if puerta != "MeasZ" else None
+            if op is not None:
+                self._canales(op.pre, qubits)
+            self._operacion(programa, puerta, qubits, extra, a)
+            if op is not None:
+                self._canales(op.post, qubits)
+
+    def _operacion(self, programa, puerta, qubits, extra, a):
+        if puerta in _ROTACIONES:
+            self._aplicar(_rotacion(puerta, a), qubits)
+        elif puerta == "PrepZ":
+            if self._medir(qubits[0]):
+                self._aplicar(_FIJAS["X"], qubits)
+        elif puerta == "MeasZ":
+            programa.cbits[extra[0]][extra[1]] = self._medir(qubits[0])
+        else:
+            self._aplicar(_FIJAS[puerta], qubits)
+
+    # ---- lectura ----
+    def _probabilidades(self, refs):
+        refs = list(refs)
+        resto = tuple(q for q in range(self._estado.ndim) if q not in refs)
+        p = np.sum(np.abs(self._estado) ** 2, axis=resto) if resto else np.abs(self._estado) ** 2
+        orden = np.argsort(np.argsort(refs))
+        # índice little-endian: el qubit refs[j] es el bit j
+        return np.transpose(p, orden[::-1]).reshape(-1)
+
+    def getAmplitudes(self, refs):
+        _esperar("lectura")
+        refs = list(refs)
+        if sorted(refs) != list(range(self._estado.ndim)):
+            raise ValueError("getAmplitudes requiere referencias a todos los qubits.")
+        return list(np.transpose(self._estado, refs[::-1]).reshape(-1))
+
+    def getProbabilities(self, refs, indices=None, tolerancia=None):
+        _esperar("lectura")
+        p = self._probabilidades(refs)
+        if indices is None:
+            return list(p)
+        return {idx: float(p[idx.entero()]) for idx in indices}
+
+    def getSamples(self, n, refs):
+        """n muestras del estado actual; cada una es la lista de bits de ``refs`` en orden."""
+        _esperar("lectura")
+        p = self._probabilidades(refs)
+        idx = self._rng.choice(len(p), size=int(n), p=p / p.sum())
+        return ((idx[:, None] >> np.arange(len(list(refs)))) & 1).astype(bool).tolist()
+
+    @staticmethod
+    def samplesToHistogram(muestras):
+        hist = {}
+        for m in muestras:
+            idx = QssIndex("".join("1" if b else "0" for b in m))
+            hist[idx] = hist.get(idx, 0) + 1
+        return hist
+
+    @staticmethod
+    def displayAmplitudes(amps, refs=None):
+        n = int(round(math.log2(len(amps)))) if len(amps) else 0
+        for i, a in enumerate(amps):
+            print(f"|{format(i, f'0{n}b')[::-1]}> : {complex(a)}")
+
+    @staticmethod
+    def displayProbabilities(probs, refs=None):
+        if isinstance(probs, dict):
+            for idx, p in probs.items():
+                print(f"{idx} : {p}")
+            return
+        n = int(round(math.log2(len(probs)))) if len(probs) else 0
+        for i, p in enumerate(probs):
+            print(f"|{format(i, f'0{n}b')[::-1]}> : {p}")
+
+
+# -----------------------
+# Simulador Clifford
+# -----------------------
+class CliffordSimulatorConfig:
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.synchronous = True
+        self.verbose = False
+
+
+class CliffordSimulator:
+    """
+    Backend de estabilizadores sobre ``estabilizador.Estabilizador``: solo puertas Clifford
+    (las rotaciones deben caer en múltiplos de pi/2). La tabla se dimensiona con el primer
+    kernel que se ejecuta después de ``ready``.
+    """
+
+    def __init__(self, config=None):
+        self.config = config
+        self._tabla = None
+
+    def initialize(self, config):
+        self.config = config
+        return QRT_ERROR_SUCCESS
+
+    def isValid(self):
+        return self.config is not None
+
+    def printVerbose(self, verbose):
+        if self.config is not None:
+            self.config.verbose = bool(verbose)
+
+    def ready(self):
+        global _activo
+        _esperar("ready")
+        if self.config is None:
+            return QRT_ERROR_FAIL
+        self._tabla = None
+        _activo = self
+        return QRT_ERROR_SUCCESS
+
+    def wait(self):
+        return QRT_ERROR_SUCCESS
+
+    def _ejecutar(self, programa, pasos):
+        from .estabilizador import Estabilizador
+        if self._tabla is None or self._tabla.n < programa.n_qubits:
+            self._tabla = Estabilizador(programa.n_qubits, getattr(self.config, "seed", None))
+        for puerta, qubits, extra in pasos:
+            if puerta == "MeasZ":
+                programa.cbits[extra[0]][extra[1]] = self._tabla.medir(qubits[0])
+            else:
+                a = _evaluar(programa, extra) if puerta in _ROTACIONES else None
+                self._tabla.aplicar(puerta, qubits, a)
+
+    def getExpectationValue(self, refs, pauli):
+        _esperar("lectura")
+        return self._tabla.esperado(pauli, list(refs))
+
+    def getSamples(self, n, refs):
+        """Igual que ``FullStateSimulator.getSamples``: n listas de bits de ``refs``."""
+        _esperar("lectura")
+        return self._tabla.muestrear(n)[:, list(refs)].tolist()
+
+
+if __name__ == "__main__":
+    compilar(sys.argv[1:])
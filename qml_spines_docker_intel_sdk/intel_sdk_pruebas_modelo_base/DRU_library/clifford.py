@@ -0,0 +1,158 @@
+"""
+Ejecución de circuitos Clifford en el simulador de estabilizadores.
+
+Los GHZ de ``test_simulador`` y los códigos de repetición solo usan H, CNOT, S, Paulis (y
+rotaciones en múltiplos de pi/2), pero corren en IQS, que guarda 2^n amplitudes. Estas
+funciones detectan esos circuitos y los mandan al ``CliffordSimulator`` de los bindings
+(memoria O(n^2)); el resto sigue en IQS:
+
+    res = ejecutar_qasm(qasm_ghz, shots=1000)                     # backend "CLIFFORD"
+    res["conteos"]                                                 # {"00000": 497, "11111": 503}
+    res = ejecutar_operaciones(sdk_backend.operaciones_ghz(300), 300, shots=1000)
+    res = ejecutar_qasm(qasm_ghz, verificar=True)                 # + comparación con IQS
+    res = ejecutar_dru(angulos, capas=2, qubits=3, subcapas=1)    # si los ángulos son Clifford
+
+Con ``verificar=True`` (y a lo sumo ``max_qubits_verificacion`` qubits) el mismo circuito
+corre también en IQS y se compara la distribución de las muestras con las probabilidades
+exactas, como ``ejemplos_cpp/iqs_vs_clifford_comparison.cpp``. Si los bindings no traen
+``CliffordSimulator`` se usa ``estabilizador.Estabilizador`` en el proceso; ``cbindings_local``
+trae un ``CliffordSimulator`` sobre esa misma tabla.
+"""
+
+import numpy as np
+
+from . import sdk_backend
+from .estabilizador import Estabilizador, es_clifford, cuartos, rotacion_clifford, leer_qasm
+
+
+def puntos_clifford(angulos, tol=1e-9):
+    """(N,) True en las filas de ángulos (N, P) que caen todas en múltiplos de pi/2."""
+    k = np.atleast_2d(angulos) / (np.pi / 2)
+    return np.all(np.abs(k - np.round(k)) <= tol, axis=1)
+
+
+def a_clifford(operaciones):
+    """Operaciones con las rotaciones reescritas en H y S (solo para circuitos Clifford)."""
+    ops = []
+    for puerta, qubits, angulo in operaciones:
+        if puerta in ("RX", "RY", "RZ"):
+            ops += [(p, qubits, None) for p in rotacion_clifford(puerta, cuartos(angulo))]
+        else:
+            ops.append((puerta, qubits, None))
+    return ops
+
+
+def _bits(indices, n):
+    """Índices (PennyLane: qubit 0 el más significativo) -> (shots, n) bits."""
+    return ((np.asarray(indices)[:, None] >> np.arange(n - 1, -1, -1)) & 1).astype(bool)
+
+
+def _conteos(muestras):
+    filas, cuantas = np.unique(np.packbits(muestras, axis=1), axis=0, return_counts=True)
+    n = muestras.shape[1]
+    return {"".join("1" if b else "0" for b in np.unpackbits(f)[:n]): int(c) for f, c in zip(filas, cuantas)}
+
+
+def _fuente(operaciones, n_qubits):
+    ops = [(p, q, None if a is None else repr(float(a))) for p, q, a in operaciones]
+    return sdk_backend.kernel_cpp(ops, n_qubits, 0)
+
+
+def _muestras_clifford(operaciones, n_qubits, shots, semilla, gestor):
+    cb = gestor.cb
+    if not hasattr(cb, "CliffordSimulator"):
+        tabla = Estabilizador(n_qubits, semilla)
+        for puerta, qubits, _ in operaciones:
+            tabla.aplicar(puerta, qubits)
+        return tabla.muestrear(shots)
+    so_path = sdk_backend.compilar_kernel(_fuente(operaciones, n_qubits), gestor.directorio,
+                                          backend="CLIFFORD", cbindings=cb)
+    sdk_name, _ = gestor.cargar(so_path)
+    dev = cb.CliffordSimulator(cb.CliffordSimulatorConfig(semilla))
+    sdk_backend._poner_listo(cb, dev, "CLIFFORD")
+    cb.callCppFunction(sdk_backend.KERNEL, sdk_name)
+    refs = cb.RefVec()
+    for i in range(n_qubits):
+        refs.append(cb.QbitRef(sdk_backend.REGISTRO, i, sdk_name).get_ref())
+    muestras = np.asarray(dev.getSamples(int(shots), refs), dtype=bool)
+    dev.wait()
+    return muestras
+
+
+def _probabilidades_iqs(operaciones, n_qubits, gestor):
+    so_path = sdk_backend.compilar_kernel(_fuente(operaciones, n_qubits), gestor.directorio,
+                                          backend="IQS", cbindings=gestor.cb)
+    amps = gestor.ejecutar_kernel(so_path, sdk_backend.KERNEL, n_qubits, backend="IQS")
+    return np.abs(amps) ** 2
+
+
+def distancia_muestras(muestras, probs):
+    """Distancia de variación total entre las frecuencias de ``muestras`` y ``probs``."""
+    n = muestras.shape[1]
+    frec = np.bincount(muestras.astype(np.int64) @ (1 << np.arange(n - 1, -1, -1)),
+                       minlength=len(probs)) / len(muestras)
+    return 0.5 * float(np.abs(frec - probs).sum())
+
+
+def ejecutar_operaciones(operaciones, n_qubits, shots=1000, backend="auto", verificar=False,
+                         max_qubits_verificacion=20, tolerancia=None, semilla=None, directorio=None,
+                         cbindings=None, gestor=None):
+    """
+    Ejecuta (puerta, qubits, ángulo) desde |0...0> y mide todos los qubits ``shots`` veces.
+    backend    : "auto" (CLIFFORD si todas las puertas son Clifford, si no IQS), "CLIFFORD" o "IQS"
+    verificar  : compara con IQS cuando el circuito fue a CLIFFORD y tiene a lo sumo
+                 ``max_qubits_verificacion`` qubits
+    tolerancia : distancia de variación total admitida; por defecto sqrt(k / shots), con k los
+                 resultados de probabilidad no nula
+    Devuelve {"backend", "muestras" (shots, n_qubits) bits (qubit 0 primero), "conteos",
+    "verificacion"}.
+    """
+    clifford = es_clifford(operaciones)
+    if backend == "auto":
+        backend = "CLIFFORD" if clifford else "IQS"
+    if backend == "CLIFFORD" and not clifford:
+        raise ValueError("El circuito tiene puertas que no son Clifford.")
+    if backend not in ("CLIFFORD", "IQS"):
+        raise ValueError(f"Backend no soportado: {backend}")
+
+    propio = gestor is None
+    if propio:
+        gestor = sdk_backend.GestorSesiones(directorio=directorio, cbindings=cbindings)
+    try:
+        verificacion = None
+        if backend == "CLIFFORD":
+            muestras = _muestras_clifford(a_clifford(operaciones), n_qubits, shots, semilla, gestor)
+            if verificar and n_qubits <= max_qubits_verificacion:
+                probs = _probabilidades_iqs(operaciones, n_qubits, gestor)
+                distancia = distancia_muestras(muestras, probs)
+                tol = tolerancia if tolerancia is not None else np.sqrt(np.count_nonzero(probs > 1e-12) / shots)
+                verificacion = {"distancia": distancia, "tolerancia": float(tol), "ok": bool(distancia <= tol)}
+        else:
+            probs = _probabilidades_iqs(operaciones, n_qubits, gestor)
+            rng = np.random.default_rng(semilla)
+            muestras = _bits(rng.choice(len(probs), size=int(shots), p=probs / probs.sum()), n_qubits)
+    finally:
+        if propio:
+            gestor.cerrar()
+    return {"backend": backend, "muestras": muestras, "conteos": _conteos(muestras),
+            "verificacion": verificacion}
+
+
+def ejecutar_qasm(qasm, shots=1000, **opciones):
+    """``ejecutar_operaciones`` sobre un circuito OpenQASM 2 de un solo ``qreg``."""
+    registros, ops = leer_qasm(qasm)
+    if len(registros) != 1:
+        raise ValueError("Solo se admiten circuitos con un único qreg.")
+    (_, n_qubits), = registros.values()
+    return ejecutar_operaciones(ops, n_qubits, shots, **opciones)
+
+
+def ejecutar_dru(angulos, capas, qubits, subcapas, entrelazamiento='lineal', shots=1000, **opciones):
+    """
+    Un punto del modelo DRU con sus ángulos ya calculados (una fila de
+    ``sdk_backend.angulos_lote``); va a CLIFFORD si todos caen en múltiplos de pi/2.
+    """
+    angulos = np.asarray(angulos, dtype=float).reshape(-1)
+    ops = [(p, q, None if k is None else angulos[k])
+           for p, q, k in sdk_backend.operaciones_dru(capas, qubits, subcapas, entrelazamiento)]
+    return ejecutar_operaciones(ops, qubits, shots, **opciones)
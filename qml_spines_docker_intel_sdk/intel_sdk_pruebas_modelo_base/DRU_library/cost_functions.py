@@ -13,6 +13,10 @@ def fidelity_cost(dm_pred, dm_true):
     F = qml.math.fidelity(dm_pred, dm_true)
     return 1 - F
 
+def fidelity_cost_indice(probs, indice):
+    """fidelity_cost contra |indice><indice| sin matrices: 1 - <indice|rho|indice> = 1 - p[indice]."""
+    return 1 - probs[indice]
+
 def Trace_Distance_v3(dm_pred, dm_true):
     condicion_1 = np.count_nonzero(dm_true) == 1
     condicion_2 = np.array_equal(np.diag(np.diag(dm_true)), dm_true)
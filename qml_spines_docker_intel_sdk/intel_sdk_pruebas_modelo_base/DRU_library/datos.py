@@ -0,0 +1,89 @@
+"""
+Conjunto de datos ya codificado para el modelo DRU.
+
+``re_dim`` (relleno con ceros y reshape a (subcapas, target_dim)) se aplica una vez a todo el
+conjunto y el resultado queda contiguo en memoria, o en un .npy mapeado a disco:
+
+    train = ConjuntoDatos(X_train, y_train)                  # en memoria
+    train = ConjuntoDatos(X_train, y_train, ruta="x.npy")   # memmap
+    best_params, historia = fit(modelo, etiquetas, train, None, val, None, params_flat, ...)
+    acc = accuracy(val, None, modelo, best_params, shape_flat)
+
+Los mini-batches se arman indexando con una permutación: por época solo se reservan arreglos
+del tamaño del batch, nunca una copia barajada del conjunto. ``circuito_parametrico``,
+``angulos_lote`` y ``estados_dru`` aceptan las muestras ya codificadas.
+"""
+
+import numpy as np
+
+
+class ConjuntoDatos:
+    """
+    X      : (N, d) características
+    y      : (N,) clases (opcional)
+    ruta   : .npy donde guardar las características codificadas (se abre mapeado)
+    bloque : filas que se codifican a la vez al escribir en ``ruta``
+    """
+
+    def __init__(self, X, y=None, target_dim=3, ruta=None, bloque=4096):
+        X = X if hasattr(X, "shape") else np.asarray(X, dtype=float)
+        N, d = X.shape
+        self.target_dim = target_dim
+        self.subcapas = -(-d // target_dim)
+        forma = (N, self.subcapas, target_dim)
+        if ruta is None:
+            self.caracteristicas = np.zeros(forma)
+        else:
+            self.caracteristicas = np.lib.format.open_memmap(ruta, mode="w+", dtype=float, shape=forma)
+        plano = self.caracteristicas.reshape(N, -1)
+        for i in range(0, N, bloque):
+            plano[i:i + bloque, :d] = X[i:i + bloque]
+            plano[i:i + bloque, d:] = 0
+        if ruta is not None:
+            self.caracteristicas.flush()
+        self.y = None if y is None else np.ascontiguousarray(y, dtype=int)
+
+    @classmethod
+    def abrir(cls, ruta, y=None):
+        """Conjunto ya codificado en ``ruta`` (solo lectura, mapeado)."""
+        datos = cls.__new__(cls)
+        datos.caracteristicas = np.load(ruta, mmap_mode="r")
+        _, datos.subcapas, datos.target_dim = datos.caracteristicas.shape
+        datos.y = None if y is None else np.ascontiguousarray(y, dtype=int)
+        return datos
+
+    def __len__(self):
+        return len(self.caracteristicas)
+
+    def __getitem__(self, indices):
+        """Muestras codificadas (y sus clases, si hay) de ``indices``."""
+        x = self.caracteristicas[indices]
+        return x if self.y is None else (x, self.y[indices])
+
+    def lotes(self, batch_size, barajar=True, rng=None):
+        """Genera (x_batch, y_batch) en orden permutado; cada batch es lo único que se copia."""
+        orden = (rng or np.random).permutation(len(self)) if barajar else np.arange(len(self))
+        for inicio in range(0, len(self), batch_size):
+            idx = orden[inicio:inicio + batch_size]
+            if barajar:
+                # índices ordenados: lectura secuencial si el arreglo está mapeado a disco
+                idx = np.sort(idx)
+            yield self.caracteristicas[idx], None if self.y is None else self.y[idx]
+
+
+def lotes(X, y, batch_size, barajar=True, rng=None):
+    """Mini-batches de un ``ConjuntoDatos`` o de arreglos (X, y), sin copiar todo el conjunto."""
+    if isinstance(X, ConjuntoDatos):
+        yield from X.lotes(batch_size, barajar, rng)
+        return
+    orden = (rng or np.random).permutation(len(X)) if barajar else np.arange(len(X))
+    for inicio in range(0, len(X), batch_size):
+        idx = orden[inicio:inicio + batch_size]
+        yield X[idx], y[idx]
+
+
+def separar(X, y=None):
+    """(muestras, clases): las de un ``ConjuntoDatos`` o los arreglos tal cual."""
+    if isinstance(X, ConjuntoDatos):
+        return X.caracteristicas, X.y if y is None else y
+    return X, y
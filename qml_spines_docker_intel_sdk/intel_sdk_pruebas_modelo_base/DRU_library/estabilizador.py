@@ -0,0 +1,334 @@
+"""
+Simulador de estabilizadores (tabla de Aaronson-Gottesman) y detección de circuitos Clifford.
+
+Un circuito con solo H, S, X, Y, Z, CNOT, CZ, SWAP (y rotaciones en múltiplos de pi/2) se
+simula en O(n^2) memoria en vez de 2^n, así que un GHZ o un código de repetición de cientos
+de qubits corre en segundos. Es el sustituto en Python del ``CliffordSimulator`` del SDK
+(``cbindings_local`` lo usa para ese backend):
+
+    est = Estabilizador(300)
+    est.h(0)
+    for q in range(299):
+        est.cnot(q, q + 1)
+    est.muestrear(1000)                 # (1000, 300) bits, solo 000... y 111...
+    est.esperado("ZZ" + "I" * 298)      # 1.0
+
+La distribución en la base Z de un estado estabilizador es uniforme sobre un subespacio
+afín: ``distribucion`` lo calcula una vez y muestrear es un producto de matrices en GF(2).
+"""
+
+import re
+import ast
+import math
+import operator
+import numpy as np
+
+# puertas Clifford del SDK (nombres de sdk_backend.PUERTAS) y su descomposición en H/S
+CLIFFORD = ("H", "X", "Y", "Z", "S", "Sdag", "CNOT", "CZ", "SWAP")
+_ROTACIONES = ("RX", "RY", "RZ")
+
+
+def cuartos(angulo, tol=1e-9):
+    """Múltiplo k (0..3) de pi/2 que es ``angulo``, o None si no es un punto Clifford."""
+    k = angulo / (math.pi / 2)
+    r = round(k)
+    return int(r) % 4 if abs(k - r) <= tol else None
+
+
+def rotacion_clifford(puerta, k):
+    """RX/RY/RZ(k pi/2) como secuencia de H y S (salvo fase global), en orden de aplicación."""
+    if puerta == "RZ":
+        return ["S"] * k
+    if puerta == "RX":
+        return ["H"] + ["S"] * k + ["H"] if k else []
+    # RY(a) = S RX(a) S^dagger
+    return ["Sdag", "H"] + ["S"] * k + ["H", "S"] if k else []
+
+
+def es_clifford(operaciones, tol=1e-9):
+    """True si todas las (puerta, qubits, ángulo) son Clifford (rotaciones en múltiplos de pi/2)."""
+    for puerta, _, angulo in operaciones:
+        if puerta in _ROTACIONES:
+            if cuartos(angulo, tol) is None:
+                return False
+        elif puerta not in CLIFFORD and puerta not in ("PrepZ", "MeasZ"):
+            return False
+    return True
+
+
+# -----------------------
+# Lectura de OpenQASM 2
+# -----------------------
+_QASM = {
+    "h": "H", "x": "X", "y": "Y", "z": "Z", "s": "S", "sdg": "Sdag", "t": "T", "tdg": "Tdag",
+    "rx": "RX", "ry": "RY", "rz": "RZ", "p": "RZ", "u1": "RZ", "cx": "CNOT", "CX": "CNOT",
+    "cz": "CZ", "swap": "SWAP", "ccx": "Toffoli", "reset": "PrepZ",
+}
+_RE_INSTRUCCION = re.compile(r"^(\w+)\s*(?:\((.*)\))?\s+(.*)$", re.S)
+_RE_REF = re.compile(r"^(\w+)\s*\[\s*(\d+)\s*\]$")
+
+
+_OPERADORES = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+               ast.Div: operator.truediv}
+
+
+def _angulo(expr):
+    """Ángulo de una puerta QASM: números, ``pi``, + - * / y signo (sin evaluar código)."""
+    def valor(nodo):
+        if isinstance(nodo, ast.Constant) and type(nodo.value) in (int, float):
+            return float(nodo.value)
+        if isinstance(nodo, ast.Name) and nodo.id == "pi":
+            return math.pi
+        if isinstance(nodo, ast.BinOp) and type(nodo.op) in _OPERADORES:
+            return _OPERADORES[type(nodo.op)](valor(nodo.left), valor(nodo.right))
+        if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, (ast.USub, ast.UAdd)):
+            v = valor(nodo.operand)
+            return -v if isinstance(nodo.op, ast.USub) else v
+        raise ValueError(f"Ángulo QASM no soportado: {expr!r}")
+
+    try:
+        arbol = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Ángulo QASM no soportado: {expr!r}") from None
+    return valor(arbol.body)
+
+
+def leer_qasm(qasm):
+    """
+    Circuito OpenQASM 2 como (registros, operaciones): registros {nombre: (inicio, n)} y
+    operaciones (puerta del SDK, índices globales, ángulo o None). Las mediciones se omiten:
+    el que ejecuta el circuito lee todos los qubits.
+    """
+    registros, ops, total = {}, [], 0
+    for linea in qasm.split(";"):
+        linea = re.sub(r"//[^\n]*", "", linea).strip()
+        if not linea or linea.startswith(("OPENQASM", "include", "barrier", "creg", "measure")):
+            continue
+        m = _RE_INSTRUCCION.match(linea)
+        if m is None:
+            raise NotImplementedError(f"Instrucción QASM no soportada: {linea!r}")
+        nombre, parametros, args = m.groups()
+        if nombre == "qreg":
+            r = _RE_REF.match(args.strip())
+            registros[r.group(1)] = (total, int(r.group(2)))
+            total += int(r.group(2))
+            continue
+        if nombre == "id":
+            continue
+        if nombre not in _QASM:
+            raise NotImplementedError(f"Puerta QASM no soportada: {nombre}")
+        qubits = []
+        for a in args.split(","):
+            r = _RE_REF.match(a.strip())
+            if r is None or r.group(1) not in registros:
+                raise NotImplementedError(f"Referencia de qubit no soportada: {a.strip()!r}")
+            qubits.append(registros[r.group(1)][0] + int(r.group(2)))
+        ops.append((_QASM[nombre], tuple(qubits), None if parametros is None else _angulo(parametros)))
+    return registros, ops
+
+
+# -----------------------
+# Tabla de estabilizadores
+# -----------------------
+class Estabilizador:
+    """
+    Estado estabilizador de n qubits en |0...0>. Filas 0..n-1: desestabilizadores; filas
+    n..2n-1: estabilizadores; cada fila es un Pauli (x, z) con signo (-1)^r.
+    """
+
+    def __init__(self, n, semilla=None):
+        self.n = int(n)
+        self.x = np.zeros((2 * self.n, self.n), dtype=bool)
+        self.z = np.zeros((2 * self.n, self.n), dtype=bool)
+        self.r = np.zeros(2 * self.n, dtype=bool)
+        self.x[np.arange(self.n), np.arange(self.n)] = True
+        self.z[self.n + np.arange(self.n), np.arange(self.n)] = True
+        self.rng = semilla if isinstance(semilla, np.random.Generator) else np.random.default_rng(semilla)
+        self._distribucion = None
+
+    def copia(self):
+        otro = Estabilizador.__new__(Estabilizador)
+        otro.n, otro.rng, otro._distribucion = self.n, self.rng, self._distribucion
+        otro.x, otro.z, otro.r = self.x.copy(), self.z.copy(), self.r.copy()
+        return otro
+
+    # ---- puertas ----
+    def h(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+        self._distribucion = None
+
+    def s(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+        self._distribucion = None
+
+    def sdg(self, a):
+        for _ in range(3):
+            self.s(a)
+
+    def x_(self, a):
+        self.r ^= self.z[:, a]
+        self._distribucion = None
+
+    def y_(self, a):
+        self.r ^= self.x[:, a] ^ self.z[:, a]
+        self._distribucion = None
+
+    def z_(self, a):
+        self.r ^= self.x[:, a]
+        self._distribucion = None
+
+    def cnot(self, a, b):
+        self.r ^= self.x[:, a] & self.z[:, b] & ~(self.x[:, b] ^ self.z[:, a])
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+        self._distribucion = None
+
+    def cz(self, a, b):
+        self.h(b)
+        self.cnot(a, b)
+        self.h(b)
+
+    def swap(self, a, b):
+        self.cnot(a, b)
+        self.cnot(b, a)
+        self.cnot(a, b)
+
+    def aplicar(self, puerta, qubits, angulo=None):
+        """
+        Puerta con el nombre del SDK; las rotaciones deben estar en múltiplos de pi/2. PrepZ
+        reinicia el qubit a |0> y MeasZ lo mide (colapsa) y devuelve el resultado.
+        """
+        if puerta in _ROTACIONES:
+            k = cuartos(angulo)
+            if k is None:
+                raise ValueError(f"{puerta}({angulo}) no es Clifford.")
+            for p in rotacion_clifford(puerta, k):
+                self.aplicar(p, qubits)
+            return
+        metodo = {"H": self.h, "S": self.s, "Sdag": self.sdg, "X": self.x_, "Y": self.y_,
+                  "Z": self.z_, "CNOT": self.cnot, "CZ": self.cz, "SWAP": self.swap}.get(puerta)
+        if metodo is None:
+            if puerta == "PrepZ":
+                if self.medir(qubits[0]):
+                    self.x_(qubits[0])
+                return
+            if puerta == "MeasZ":
+                return self.medir(qubits[0])
+            raise ValueError(f"La puerta {puerta} no es Clifford.")
+        metodo(*qubits)
+
+    # ---- medición ----
+    def _fase(self, xi, zi, xh, zh):
+        """Exponente de i (mod 4) al multiplicar la fila i por las filas h (función g)."""
+        xi, zi = xi.astype(np.int8), zi.astype(np.int8)
+        xh, zh = xh.astype(np.int8), zh.astype(np.int8)
+        g = np.where(xi & zi, zh - xh, 0)
+        g += np.where(xi & ~zi & 1, zh * (2 * xh - 1), 0)
+        g += np.where(~xi & zi & 1, xh * (1 - 2 * zh), 0)
+        return g.sum(axis=-1)
+
+    def _sumar_filas(self, h, i):
+        """Filas h <- filas h * fila i (con signo)."""
+        fase = 2 * self.r[h].astype(int) + 2 * int(self.r[i]) + self._fase(self.x[i], self.z[i], self.x[h], self.z[h])
+        self.r[h] = (fase % 4) == 2
+        self.x[h] ^= self.x[i]
+        self.z[h] ^= self.z[i]
+
+    def _producto(self, filas):
+        """
+        (x, z, r) del producto de las filas dadas, de una vez: con P_k = (-1)^r_k i^(x_k.z_k)
+        X^x_k Z^z_k, reordenar el producto agrega (-1)^(z_j.x_k) por cada j < k.
+        """
+        x, z = self.x[filas].astype(np.int64), self.z[filas].astype(np.int64)
+        X, Z = x.sum(axis=0) % 2, z.sum(axis=0) % 2
+        previos = (np.cumsum(z, axis=0) - z) % 2
+        e = (x * z).sum() - (X * Z).sum() + 2 * (int(self.r[filas].sum()) + int((previos * x).sum()))
+        return X.astype(bool), Z.astype(bool), int(e % 4 == 2)
+
+    def medir(self, a, forzar=None):
+        """Mide el qubit ``a`` en Z y colapsa. Con ``forzar`` un resultado aleatorio toma ese valor."""
+        n = self.n
+        candidatos = np.flatnonzero(self.x[n:, a])
+        if len(candidatos) == 0:
+            _, _, r = self._producto(n + np.flatnonzero(self.x[:n, a]))
+            return r
+        p = n + candidatos[0]
+        filas = np.flatnonzero(self.x[:, a])
+        filas = filas[filas != p]
+        if len(filas):
+            self._sumar_filas(filas, p)
+        self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+        self.x[p], self.z[p] = False, False
+        self.z[p, a] = True
+        self.r[p] = bool(self.rng.integers(2)) if forzar is None else bool(forzar)
+        self._distribucion = None
+        return int(self.r[p])
+
+    # ---- lectura ----
+    def distribucion(self):
+        """
+        (b0, G): los resultados posibles de medir todo son b0 ^ (G @ u) mod 2 con u uniforme
+        en GF(2)^k, cada uno con probabilidad 2^-k.
+        """
+        if self._distribucion is None:
+            b0, libres = self._pasada({})
+            columnas = [self._pasada({j: 1})[0] ^ b0 for j in libres]
+            G = np.stack(columnas, axis=1) if columnas else np.zeros((self.n, 0), dtype=np.uint8)
+            self._distribucion = (b0, G)
+        return self._distribucion
+
+    def _pasada(self, forzados):
+        """
+        Mide todos los qubits en orden sobre una copia; los resultados aleatorios valen 0 salvo
+        los de ``forzados``. Devuelve (bits, qubits con resultado aleatorio).
+        """
+        copia = self.copia()
+        bits = np.zeros(self.n, dtype=np.uint8)
+        libres = []
+        for a in range(self.n):
+            if copia.x[self.n:, a].any():
+                libres.append(a)
+            bits[a] = copia.medir(a, forzar=forzados.get(a, 0))
+        return bits, libres
+
+    def muestrear(self, shots, rng=None):
+        """(shots, n) bits de medir todos los qubits; el estado no cambia."""
+        b0, G = self.distribucion()
+        u = (rng or self.rng).integers(0, 2, size=(int(shots), G.shape[1]), dtype=np.uint8)
+        return (b0[None] ^ ((u.astype(np.int64) @ G.T.astype(np.int64)) % 2).astype(np.uint8)).astype(bool)
+
+    def probabilidad(self, bits):
+        """Probabilidad exacta de medir ``bits`` (un bit por qubit)."""
+        b0, G = self.distribucion()
+        objetivo = (np.asarray(bits, dtype=np.uint8) ^ b0).astype(bool)
+        # objetivo en el espacio columna de G (eliminación en GF(2))
+        M = np.concatenate([G.astype(bool), objetivo[:, None]], axis=1)
+        fila = 0
+        for c in range(G.shape[1]):
+            pivotes = np.flatnonzero(M[fila:, c])
+            if len(pivotes) == 0:
+                continue
+            p = fila + pivotes[0]
+            M[[fila, p]] = M[[p, fila]]
+            otras = np.flatnonzero(M[:, c])
+            otras = otras[otras != fila]
+            M[otras] ^= M[fila]
+            fila += 1
+        return 0.0 if M[fila:, -1].any() else 2.0 ** -G.shape[1]
+
+    def esperado(self, pauli, qubits=None):
+        """<P> para una cadena de Pauli ("XZI...", el carácter j sobre ``qubits[j]``): 0 o ±1."""
+        qubits = range(self.n) if qubits is None else qubits
+        px, pz = np.zeros(self.n, dtype=bool), np.zeros(self.n, dtype=bool)
+        for q, c in zip(qubits, pauli.upper()):
+            px[q], pz[q] = c in "XY", c in "ZY"
+        n = self.n
+        anticonmuta = ((self.x & pz).sum(axis=1) + (self.z & px).sum(axis=1)) % 2 == 1
+        # anticonmuta con algún estabilizador -> 0
+        if anticonmuta[n:].any():
+            return 0.0
+        # si no, P = ± producto de los estabilizadores cuyo desestabilizador anticonmuta con P
+        _, _, r = self._producto(n + np.flatnonzero(anticonmuta[:n]))
+        return -1.0 if r else 1.0
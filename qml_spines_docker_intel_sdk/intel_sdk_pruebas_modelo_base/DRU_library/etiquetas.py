@@ -0,0 +1,84 @@
+"""
+Etiquetas de clase como estados base, sin matrices densas.
+
+La etiqueta de la clase c es |c><c| sobre ceil(log2 C) qubits: basta guardar C y el tamaño
+del registro. ``etiquetas[c]`` arma la matriz (o el ket) solo cuando alguien la pide, así que
+el código que indexa listas de matrices sigue funcionando, y los costos con forma nativa
+(ver ``training.costo_batches``) usan directamente el índice:
+
+    _, etiquetas = generar_etiquetas(C)      # Etiquetas, no una lista de C matrices 2^n x 2^n
+    etiquetas[2]                              # densa, recién creada
+    etiquetas.densa(2, suavizado=0.999)       # 0.999 en la diagonal de c, el resto repartido
+"""
+
+import math
+import numpy as np
+
+
+class Etiquetas:
+    """
+    C        : número de clases
+    n_qubits : qubits del registro de etiquetas (por defecto ceil(log2 C))
+    forma    : "dm" (``[c]`` devuelve |c><c|) o "ket" (``[c]`` devuelve |c>)
+    dtype    : tipo de las matrices y kets que se arman
+    """
+
+    def __init__(self, C, n_qubits=None, forma="dm", dtype=complex):
+        if forma not in ("dm", "ket"):
+            raise ValueError(f"Forma desconocida: {forma}")
+        self.C = int(C)
+        self.n_qubits = int(math.ceil(math.log2(C))) if n_qubits is None else int(n_qubits)
+        if self.C > 2 ** self.n_qubits:
+            raise ValueError(f"{C} clases no caben en {self.n_qubits} qubits.")
+        self.forma = forma
+        self.dtype = dtype
+
+    @property
+    def dim(self):
+        return 2 ** self.n_qubits
+
+    @property
+    def kets(self):
+        return Etiquetas(self.C, self.n_qubits, "ket", self.dtype)
+
+    @property
+    def matrices(self):
+        return Etiquetas(self.C, self.n_qubits, "dm", self.dtype)
+
+    def __len__(self):
+        return self.C
+
+    def __getitem__(self, c):
+        return self.ket(c) if self.forma == "ket" else self.densa(c)
+
+    def __iter__(self):
+        return (self[c] for c in range(self.C))
+
+    def indice(self, c):
+        """Estado base de la clase ``c`` (comprueba el rango)."""
+        c = int(c)
+        if not 0 <= c < self.C:
+            raise IndexError(f"Clase {c} fuera de rango (C = {self.C}).")
+        return c
+
+    def ket(self, c):
+        estado = np.zeros(self.dim, dtype=self.dtype)
+        estado[self.indice(c)] = 1
+        return estado
+
+    def densa(self, c, suavizado=None):
+        """
+        |c><c| como matriz densa nueva. Con ``suavizado`` la diagonal de c vale ese número y
+        el resto de la diagonal reparte 1 - suavizado (como hacen Trace_Distance_v3 y Renyi).
+        """
+        i = self.indice(c)
+        dm = np.zeros((self.dim, self.dim), dtype=self.dtype)
+        if suavizado is None:
+            dm[i, i] = 1
+        else:
+            dm[np.diag_indices(self.dim)] = (1 - suavizado) / (self.dim - 1)
+            dm[i, i] = suavizado
+        return dm
+
+    def __repr__(self):
+        return f"Etiquetas(C={self.C}, n_qubits={self.n_qubits}, forma={self.forma!r})"
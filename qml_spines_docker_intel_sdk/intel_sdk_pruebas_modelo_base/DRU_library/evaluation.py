@@ -1,8 +1,10 @@
+import os
 
 import matplotlib.pyplot as plt
 from sklearn.metrics import confusion_matrix, ConfusionMatrixDisplay, classification_report
-from .training import predict, accuracy,predict_proba
+from .training import predict_proba as _predict_proba
 from sklearn.metrics import confusion_matrix, classification_report, roc_auc_score, roc_curve
+from .metricas import RegistroMetricas, reducir_minmax, media_movil_en
 
 from pennylane import numpy as np
 # -------------------------
@@ -10,43 +12,73 @@ from pennylane import numpy as np
 # -------------------------
 def evaluate_classification(modelo, best_params, shape_flat,
                             X_train, y_train, X_val, y_val,
-                            predict, predict_proba=None):
+                            predict=None, predict_proba=None, lectura=None,
+                            probs_train=None, probs_val=None):
     """
     Calcula y muestra las métricas de clasificación (confusion matrix, report y ROC).
     Admite binario o multiclase.
-    """
 
-    # ---- predicciones ----
-    num_classes = len(np.unique(np.concatenate((y_train, y_val))))
-    y_pred_train = predict(X_train, modelo, best_params, shape_flat)
-    y_pred_val   = predict(X_val, modelo, best_params, shape_flat)
+    Cada conjunto se simula una sola vez: se piden sus probabilidades (con ``predict_proba``,
+    por defecto la de training) y de ahí salen predicciones, accuracy, reportes y ROC.
+    ``probs_train`` / ``probs_val`` (N, k) ya calculadas evitan la simulación. Sin ``predict``
+    la clase es el argmax de las probabilidades; con ``predict`` (misma firma que la de
+    training) las clases salen de esa función, lo que cuesta otra pasada por conjunto.
+    Devuelve un diccionario con las métricas.
+    """
+    if predict_proba is None:
+        predict_proba = _predict_proba
+    opciones = {} if lectura is None else {"lectura": lectura}
+
+    # ---- probabilidades (una pasada por conjunto) ----
+    if probs_train is None:
+        probs_train = predict_proba(X_train, modelo, best_params, shape_flat, **opciones)
+    if probs_val is None:
+        probs_val = predict_proba(X_val, modelo, best_params, shape_flat, **opciones)
+    probs_train = np.asarray(probs_train, dtype=float)
+    probs_val = np.asarray(probs_val, dtype=float)
 
     # ---- asegurar etiquetas consistentes ----
     y_train = np.array(y_train, dtype=int)
     y_val   = np.array(y_val, dtype=int)
-    y_pred_train = np.array(y_pred_train, dtype=int)
-    y_pred_val   = np.array(y_pred_val, dtype=int)
+    if predict is None:
+        y_pred_train = np.argmax(probs_train, axis=1)
+        y_pred_val   = np.argmax(probs_val, axis=1)
+    else:
+        y_pred_train = np.array(predict(X_train, modelo, best_params, shape_flat, **opciones), dtype=int)
+        y_pred_val   = np.array(predict(X_val, modelo, best_params, shape_flat, **opciones), dtype=int)
 
     # ---- filtrar clases válidas ----
     clases_reales = np.unique(np.concatenate((y_train, y_val)))
     classes = np.array([c for c in np.unique(np.concatenate((y_train, y_val, y_pred_train, y_pred_val)))
                         if c in clases_reales])
 
+    metricas = {
+        "acc_train": float(np.mean(y_pred_train == y_train)),
+        "acc_val": float(np.mean(y_pred_val == y_val)),
+        "cm_train": confusion_matrix(y_train, y_pred_train, labels=classes),
+        "cm_val": confusion_matrix(y_val, y_pred_val, labels=classes),
+        "report_train": classification_report(y_train, y_pred_train, labels=classes, digits=2),
+        "report_val": classification_report(y_val, y_pred_val, labels=classes, digits=2),
+        "auc": None,
+    }
+
     print("=== Métricas en conjunto de entrenamiento ===")
-    print(confusion_matrix(y_train, y_pred_train, labels=classes))
-    print(classification_report(y_train, y_pred_train, labels=classes, digits=2))
+    print(f"Accuracy: {metricas['acc_train']*100:.2f}%")
+    print(metricas["cm_train"])
+    print(metricas["report_train"])
 
     print("\n=== Métricas en conjunto de validación ===")
-    print(confusion_matrix(y_val, y_pred_val, labels=classes))
-    print(classification_report(y_val, y_pred_val, labels=classes, digits=2))
+    print(f"Accuracy: {metricas['acc_val']*100:.2f}%")
+    print(metricas["cm_val"])
+    print(metricas["report_val"])
 
     # ---- curva ROC (solo binaria) ----
-    if predict_proba is not None and len(clases_reales) == 2:
-        probs = predict_proba(X_val, modelo, best_params, shape_flat)
-        probs_pos = probs[:, 1] if probs.shape[1] > 1 else probs.ravel()
+    if len(clases_reales) == 2:
+        probs_pos = probs_val[:, 1] if probs_val.shape[1] > 1 else probs_val.ravel()
 
         auc = roc_auc_score(y_val, probs_pos)
         fpr, tpr, _ = roc_curve(y_val, probs_pos)
+        metricas["auc"] = float(auc)
 
         plt.figure(figsize=(6, 6))
         plt.plot(fpr, tpr, label=f"AUC = {auc:.3f}")
@@ -58,27 +90,41 @@ def evaluate_classification(modelo, best_params, shape_flat,
         plt.grid(True)
         plt.show()
     else:
-        print("\nCurva ROC no disponible (multiclase o falta de predict_proba).")
+        print("\nCurva ROC no disponible (multiclase).")
+
+    return metricas
 
 
 # -------------------------
 # Curva de pérdida
 # -------------------------
-def plot_loss_curve(batch_loss_mean, window=20, title="Pérdida con media móvil"):
-    """Grafica la pérdida por batch y una versión suavizada con media móvil."""
-    if len(batch_loss_mean) == 0:
+def plot_loss_curve(batch_loss_mean, window=20, title="Pérdida con media móvil", puntos=2000,
+                    columna="loss"):
+    """
+    Grafica la pérdida por batch y una versión suavizada con media móvil.
+    ``batch_loss_mean`` es la lista de pérdidas, un ``RegistroMetricas`` o la carpeta de uno
+    (se lee la columna ``columna`` del nivel "batch" sin cargarla entera). Se dibujan a lo
+    sumo ``puntos`` puntos: mínimo y máximo de cada tramo, y la media móvil en ``puntos // 2``
+    posiciones.
+    """
+    if isinstance(batch_loss_mean, (str, os.PathLike)):
+        batch_loss_mean = RegistroMetricas.abrir(batch_loss_mean)
+    if isinstance(batch_loss_mean, RegistroMetricas):
+        loss_array = batch_loss_mean.columna("batch", columna)
+    else:
+        loss_array = np.array(batch_loss_mean, dtype=float)
+    if len(loss_array) == 0:
         print("No hay datos de pérdida para graficar.")
         return
 
-    loss_array = np.array(batch_loss_mean)
-    def moving_average(x, window):
-        return np.convolve(x, np.ones(window) / window, mode='valid')
-
-    loss_smooth = moving_average(loss_array, window)
-
+    x, y = reducir_minmax(loss_array, puntos)
     plt.figure(figsize=(10, 5))
-    plt.plot(loss_array, alpha=0.3, label="Pérdida por batch")
-    plt.plot(range(window - 1, len(loss_array)), loss_smooth, color='red', label=f"Media móvil (window={window})")
+    plt.plot(x, y, alpha=0.3, label="Pérdida por batch")
+    if len(loss_array) >= window:
+        n_media = min(max(puntos // 2, 1), len(loss_array) - window + 1)
+        centros = np.unique(np.linspace(window - 1, len(loss_array) - 1, n_media).astype(int))
+        plt.plot(centros, media_movil_en(loss_array, window, centros), color='red',
+                 label=f"Media móvil (window={window})")
     plt.xlabel("Batch")
     plt.ylabel("Loss")
     plt.title(title)
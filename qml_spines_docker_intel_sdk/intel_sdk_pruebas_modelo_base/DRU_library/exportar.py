@@ -0,0 +1,141 @@
+"""
+Exportación de un modelo DRU entrenado a un kernel C++ del Intel Quantum SDK.
+
+El ángulo de cada rotación es ``x_v[j] * w[i, j] + theta[i, j]`` (ver ``phi_s``): ``theta`` y
+``w`` entrenados quedan como constantes en la fuente y solo las características de la
+muestra (``re_dim(x)`` aplanado) son parámetros de ejecución, en el arreglo ``dru_x``. Un
+mismo ``.so`` sirve para cualquier entrada, sin QASM ni recompilación por punto:
+
+    exportar_modelo("modelo_dru", capas, qubits, best_params, shape_flat)   # .cpp + .json
+    with cargar_exportado("modelo_dru.json") as host:
+        y_pred = host.predict(X_test, Lectura.clasificacion(C))
+"""
+
+import os
+import json
+import numpy as np
+
+from . import sdk_backend
+from .base_functions import reshape_params
+
+SIMBOLO_ENTRADA = "dru_x"
+KERNEL_EXPORTADO = "dru_modelo"
+
+
+# -----------------------
+# Generación de la fuente
+# -----------------------
+def _subcapas(capas, qubits, vectores):
+    if vectores % (capas * qubits):
+        raise ValueError(f"{vectores} vectores de parámetros no encajan en {capas} capas x {qubits} qubits.")
+    return vectores // (capas * qubits)
+
+
+def exportar_cpp(capas, qubits, params_flat, shape_flat, entrelazamiento='lineal',
+                 kernel=KERNEL_EXPORTADO, simbolo=SIMBOLO_ENTRADA):
+    """Fuente C++ del modelo con theta/w como constantes y las características en ``simbolo``."""
+    theta, w = (np.asarray(p, dtype=float) for p in reshape_params(np.asarray(params_flat), shape_flat))
+    subcapas = _subcapas(capas, qubits, len(w))
+    por_subvector = len(w) // subcapas     # filas de theta/w que usa cada subvector (phi_s)
+
+    operaciones = []
+    for puerta, qs, k in sdk_backend.operaciones_dru(capas, qubits, subcapas, entrelazamiento):
+        if k is None:
+            operaciones.append((puerta, qs, None))
+            continue
+        fila, j = divmod(k, 3)
+        entrada = (fila // por_subvector) * 3 + j
+        expr = f"{simbolo}[{entrada}] * {w[fila, j]:.17g} + {theta[fila, j]:.17g}"
+        operaciones.append((puerta, qs, expr))
+    return sdk_backend.kernel_cpp(operaciones, qubits, subcapas * 3, kernel=kernel, simbolo=simbolo)
+
+
+def exportar_modelo(ruta, capas, qubits, params_flat, shape_flat, entrelazamiento='lineal'):
+    """
+    Escribe ``ruta.cpp`` y ``ruta.json`` (configuración que usa ``cargar_exportado``).
+    Devuelve la ruta del .json.
+    """
+    fuente = exportar_cpp(capas, qubits, params_flat, shape_flat, entrelazamiento)
+    with open(ruta + ".cpp", "w", encoding="utf8") as f:
+        f.write(fuente)
+    meta = {
+        "fuente": os.path.basename(ruta) + ".cpp",
+        "capas": capas,
+        "qubits": qubits,
+        "entrelazamiento": entrelazamiento,
+        "subcapas": _subcapas(capas, qubits, shape_flat[1][0]),
+        "kernel": KERNEL_EXPORTADO,
+        "simbolo": SIMBOLO_ENTRADA,
+    }
+    with open(ruta + ".json", "w", encoding="utf8") as f:
+        json.dump(meta, f, indent=2)
+    return ruta + ".json"
+
+
+# -----------------------
+# Host en Python
+# -----------------------
+def entradas_lote(X, subcapas, target_dim=3):
+    """``re_dim(x)[0].reshape(-1)`` para todas las filas de X: (N, subcapas * target_dim)."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    if X.ndim == 3:     # ya codificado
+        X = X.reshape(len(X), -1)
+    if X.shape[1] > subcapas * target_dim:
+        raise ValueError(f"El modelo admite hasta {subcapas * target_dim} características, no {X.shape[1]}.")
+    entradas = np.zeros((len(X), subcapas * target_dim))
+    entradas[:, :X.shape[1]] = X
+    return entradas
+
+
+class HostDRU:
+    """
+    Ejecuta un modelo exportado: compila la fuente una vez (caché por hash), la carga en una
+    ``SesionSDK`` y por cada muestra solo escribe sus características.
+    """
+
+    def __init__(self, fuente, qubits, subcapas, kernel=KERNEL_EXPORTADO, simbolo=SIMBOLO_ENTRADA,
+                 backend="QD_SIM", directorio=None, cbindings=None, gestor=None):
+        self.qubits = qubits
+        self.subcapas = subcapas
+        if gestor is not None:
+            directorio, cbindings = directorio or gestor.directorio, gestor.cb
+        so_path = sdk_backend.compilar_kernel(fuente, directorio or sdk_backend.directorio_kernels(),
+                                              backend=backend, cbindings=cbindings)
+        self.sesion = sdk_backend.SesionSDK(so_path, qubits, subcapas * 3, backend=backend,
+                                            kernel=kernel, simbolo=simbolo, cbindings=cbindings,
+                                            gestor=gestor).abrir()
+
+    def amplitudes(self, X):
+        """(N, 2**qubits) en el orden de PennyLane."""
+        return self.sesion.ejecutar_lote(entradas_lote(X, self.subcapas))
+
+    def probabilidades(self, X, lectura=None, shots=None, semilla=None):
+        """(N, k) probabilidades de ``lectura`` (todo el registro si no se da)."""
+        entradas = entradas_lote(X, self.subcapas)
+        if shots is not None:
+            return self.sesion.muestrear_lote(entradas, shots, lectura, semilla=semilla) / float(shots)
+        if lectura is None:
+            return np.abs(self.sesion.ejecutar_lote(entradas)) ** 2
+        return self.sesion.ejecutar_lote(entradas, lectura=lectura)
+
+    def predict(self, X, lectura=None, shots=None, semilla=None):
+        return np.argmax(self.probabilidades(X, lectura, shots, semilla), axis=1)
+
+    def cerrar(self):
+        self.sesion.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def cargar_exportado(ruta_json, backend="QD_SIM", directorio=None, cbindings=None, gestor=None):
+    """HostDRU a partir del .json de ``exportar_modelo``."""
+    with open(ruta_json, encoding="utf8") as f:
+        meta = json.load(f)
+    with open(os.path.join(os.path.dirname(os.path.abspath(ruta_json)), meta["fuente"]), encoding="utf8") as f:
+        fuente = f.read()
+    return HostDRU(fuente, meta["qubits"], meta["subcapas"], meta["kernel"], meta["simbolo"],
+                   backend=backend, directorio=directorio, cbindings=cbindings, gestor=gestor)
@@ -0,0 +1,97 @@
+"""
+Fidelidad entre estados puros de dos backends (p. ej. default.qubit vs QD_SIM).
+
+Para estados puros F(a, b) = |<a|b>|^2, así que no hace falta construir matrices densidad
+ni raíces matriciales: todo el lote se resuelve con un producto interno por fila, O(N·d).
+"""
+
+import numpy as np
+
+
+# -----------------------
+# Cálculo vectorizado
+# -----------------------
+def fidelidades(estados_a, estados_b):
+    """
+    estados_a, estados_b: (N, d) o (d,). Devuelve las N fidelidades |<a_i|b_i>|^2.
+    """
+    a = np.atleast_2d(np.asarray(estados_a, dtype=complex))
+    b = np.atleast_2d(np.asarray(estados_b, dtype=complex))
+    if a.shape != b.shape:
+        raise ValueError(f"Formas incompatibles: {a.shape} y {b.shape}")
+    return np.abs(np.einsum("nd,nd->n", a.conj(), b)) ** 2
+
+
+def fidelidad_clasica(p, q):
+    """
+    p, q: (N, k) o (k,) probabilidades (p. ej. lecturas parciales). Devuelve las N
+    fidelidades de Bhattacharyya (sum_i sqrt(p_i q_i))^2.
+    """
+    p = np.atleast_2d(np.asarray(p, dtype=float))
+    q = np.atleast_2d(np.asarray(q, dtype=float))
+    if p.shape != q.shape:
+        raise ValueError(f"Formas incompatibles: {p.shape} y {q.shape}")
+    return np.sum(np.sqrt(np.clip(p, 0, None) * np.clip(q, 0, None)), axis=1) ** 2
+
+
+def resumen_fidelidad(estados_a, estados_b):
+    """Fidelidades, media, desviación estándar (ddof=1) y error estándar de la media."""
+    return resumen_valores(fidelidades(estados_a, estados_b))
+
+
+def resumen_valores(F):
+    """Como ``resumen_fidelidad`` a partir de fidelidades ya calculadas."""
+    F = np.atleast_1d(np.asarray(F, dtype=float))
+    n = len(F)
+    desviacion = float(np.std(F, ddof=1)) if n > 1 else 0.0
+    return {
+        "fidelidades": F,
+        "media": float(np.mean(F)),
+        "desviacion": desviacion,
+        "error": desviacion / np.sqrt(n),
+        "n": n,
+    }
+
+
+# -----------------------
+# Estadística en streaming
+# -----------------------
+class FidelidadAcumulada:
+    """
+    Media y varianza de las fidelidades con el algoritmo de Welford (memoria constante).
+    ``agregar`` acepta lotes; cada lote se combina con la fórmula de Chan et al.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self._m2 = 0.0
+
+    def agregar(self, estados_a, estados_b):
+        self.agregar_valores(fidelidades(estados_a, estados_b))
+        return self
+
+    def agregar_valores(self, F):
+        F = np.atleast_1d(np.asarray(F, dtype=float))
+        n_b = len(F)
+        if n_b == 0:
+            return self
+        media_b = float(np.mean(F))
+        m2_b = float(np.sum((F - media_b) ** 2))
+        n = self.n + n_b
+        delta = media_b - self.media
+        self.media += delta * n_b / n
+        self._m2 += m2_b + delta ** 2 * self.n * n_b / n
+        self.n = n
+        return self
+
+    @property
+    def desviacion(self):
+        return float(np.sqrt(self._m2 / (self.n - 1))) if self.n > 1 else 0.0
+
+    @property
+    def error(self):
+        return self.desviacion / np.sqrt(self.n) if self.n else 0.0
+
+    def resumen(self):
+        return {"media": self.media, "desviacion": self.desviacion, "error": self.error, "n": self.n}
@@ -0,0 +1,217 @@
+"""
+Gradientes por desplazamiento de parámetros (parameter-shift) del modelo DRU en el Intel SDK.
+
+Todas las rotaciones del ansatz son RZ/RY, así que para cada ángulo phi_k
+
+    dp/dphi_k = [p(phi + pi/2 e_k) - p(phi - pi/2 e_k)] / 2
+
+es exacto. Por cada paso se arma un solo lote con las 2P + 1 filas de ángulos (sin desplazar,
++pi/2 y -pi/2 en cada uno de los P ángulos) de todas las muestras del mini-batch y se ejecuta
+con ``SesionSDK.ejecutar_lote`` sobre un único kernel paramétrico compilado. La regla de la
+cadena con ``phi = x_v * w + theta`` (ver ``phi_s``) da el gradiente de theta y w:
+
+    with GradienteSDK(capas, qubits, Lectura.clasificacion(C)) as grad:
+        best_params, historia = fit(modelo, etiquetas, X_train, y_train, X_val, y_val,
+                                    params_flat, shape_flat, fidelity_cost, gradiente=grad)
+
+El costo se evalúa sobre las probabilidades de la lectura: con estados etiqueta de
+``generar_etiquetas``, ``fidelity_cost`` vale 1 - p_y, que es el costo "fidelidad". ``fit``
+comprueba que su ``cost_function`` corresponda al costo del proveedor (ver ``EQUIVALENTES``).
+"""
+
+import numpy as np
+
+from . import sdk_backend
+from .exportar import entradas_lote
+from .base_functions import reshape_params
+from .datos import separar
+from .cost_functions import fidelity_cost
+from .mps import mps_angulos
+
+
+# -----------------------
+# Costos sobre probabilidades
+# -----------------------
+def costo_fidelidad(p, y):
+    """1 - p_y por muestra y su derivada respecto de p."""
+    filas = np.arange(len(y))
+    dp = np.zeros_like(p)
+    dp[filas, y] = -1.0
+    return 1.0 - p[filas, y], dp
+
+
+def costo_entropia(p, y, eps=1e-12):
+    """-log p_y por muestra y su derivada respecto de p."""
+    filas = np.arange(len(y))
+    py = np.maximum(p[filas, y], eps)
+    dp = np.zeros_like(p)
+    dp[filas, y] = -1.0 / py
+    return -np.log(py), dp
+
+
+COSTOS = {"fidelidad": costo_fidelidad, "entropia": costo_entropia}
+# cost_function de fit -> costo equivalente sobre probabilidades
+EQUIVALENTES = {fidelity_cost: "fidelidad"}
+
+
+def desplazamientos(n_params):
+    """(2P + 1, P): fila 0 sin desplazar, luego +pi/2 y -pi/2 en cada ángulo."""
+    d = np.zeros((2 * n_params + 1, n_params))
+    k = np.arange(n_params)
+    d[1 + k, k] = np.pi / 2
+    d[1 + n_params + k, k] = -np.pi / 2
+    return d
+
+
+# -----------------------
+# Proveedor de costo y gradiente
+# -----------------------
+class GradienteSDK:
+    """
+    Costo y gradiente de un mini-batch en el Intel SDK, para ``fit(..., gradiente=...)``.
+    lectura : Lectura con los estados etiqueta (None = todo el registro)
+    costo   : "fidelidad", "entropia", una cost_function de ``EQUIVALENTES`` (p. ej.
+              fidelity_cost) o función (p, y) -> (costos (N,), dcosto/dp (N, k))
+
+    El kernel se compila la primera vez que se ve un número de subcapas y la sesión queda
+    abierta entre pasos.
+    """
+
+    def __init__(self, capas, qubits, lectura=None, costo="fidelidad", entrelazamiento='lineal',
+                 backend="QD_SIM", directorio=None, cbindings=None, gestor=None):
+        self.capas = capas
+        self.qubits = qubits
+        self.lectura = lectura
+        costo = EQUIVALENTES.get(costo, costo)
+        self.nombre_costo = costo if isinstance(costo, str) else None
+        self.costo = COSTOS[costo] if isinstance(costo, str) else costo
+        self.entrelazamiento = entrelazamiento
+        self.backend = backend
+        if gestor is not None:
+            directorio, cbindings = directorio or gestor.directorio, gestor.cb
+        self.directorio = directorio
+        self.cbindings = cbindings
+        self.gestor = gestor
+        self.sesion = None
+        self._subcapas = None
+        self.ejecuciones = 0
+
+    def _sesion(self, subcapas, n_params):
+        if self.sesion is not None and self._subcapas == subcapas:
+            return self.sesion
+        self.cerrar()
+        ops = sdk_backend.operaciones_dru(self.capas, self.qubits, subcapas, self.entrelazamiento)
+        fuente = sdk_backend.kernel_cpp(ops, self.qubits, n_params)
+        so_path = sdk_backend.compilar_kernel(fuente, self.directorio or sdk_backend.directorio_kernels(),
+                                              backend=self.backend, cbindings=self.cbindings)
+        self.sesion = sdk_backend.SesionSDK(so_path, self.qubits, n_params, backend=self.backend,
+                                            cbindings=self.cbindings, gestor=self.gestor).abrir()
+        self._subcapas = subcapas
+        return self.sesion
+
+    def _probabilidades(self, sesion, angulos):
+        if self.lectura is None:
+            return np.abs(sesion.ejecutar_lote(angulos)) ** 2
+        return sesion.ejecutar_lote(angulos, lectura=self.lectura)
+
+    def probabilidades(self, X, params_flat, shape_flat):
+        """(N, k) probabilidades de la lectura para X (sin desplazamientos)."""
+        X, _ = separar(X)
+        theta, w = reshape_params(np.asarray(params_flat, dtype=float), shape_flat)
+        angulos, subcapas = sdk_backend.angulos_lote(X, theta, w)
+        return self._probabilidades(self._sesion(subcapas, angulos.shape[1]), angulos)
+
+    def accuracy(self, X, y, params_flat, shape_flat):
+        X, y = separar(X, y)
+        probs = self.probabilidades(X, params_flat, shape_flat)
+        return float(np.mean(np.argmax(probs, axis=1) == np.asarray(y)))
+
+    def __call__(self, params_flat, shape_flat, x_batch, y_batch, entrenables=None):
+        """
+        Costo medio del batch y su gradiente respecto de ``params_flat`` (mismo orden). Con
+        ``entrenables`` (máscara sobre ``params_flat``) solo se desplazan los ángulos que
+        dependen de algún parámetro entrenable; el resto del gradiente es cero.
+        """
+        theta, w = reshape_params(np.asarray(params_flat, dtype=float), shape_flat)
+        angulos, subcapas = sdk_backend.angulos_lote(x_batch, theta, w)
+        N, P = angulos.shape
+        sesion = self._sesion(subcapas, P)
+        if entrenables is None:
+            activos = np.arange(P)
+        else:
+            m_theta, m_w = reshape_params(np.asarray(entrenables, dtype=bool), shape_flat)
+            activos = np.flatnonzero(m_theta.ravel() | m_w.ravel())
+        K = len(activos)
+
+        # un solo trabajo: (N, 2K + 1, P) filas de ángulos
+        filas = (angulos[:, None, :] + desplazamientos(P)[np.r_[0, 1 + activos, 1 + P + activos]])
+        probs = self._probabilidades(sesion, filas.reshape(-1, P)).reshape(N, 2 * K + 1, -1)
+        self.ejecuciones += N * (2 * K + 1)
+
+        costos, dcosto = self.costo(probs[:, 0], np.asarray(y_batch, dtype=int))
+        dp = (probs[:, 1:K + 1] - probs[:, K + 1:]) / 2           # (N, K, k)
+        dphi = np.zeros((N, P))
+        dphi[:, activos] = np.einsum("npk,nk->np", dp, dcosto)
+        dphi = dphi.reshape(N, len(w), -1)
+
+        # phi[n, r] = x_v[n, r] * w[r] + theta[r], con x_v repetido como en angulos_lote
+        x_rep = np.repeat(entradas_lote(x_batch, subcapas).reshape(N, subcapas, -1),
+                          len(w) // subcapas, axis=1)
+        grad_theta = dphi.mean(axis=0)
+        grad_w = (dphi * x_rep).mean(axis=0)
+        if entrenables is not None:
+            grad_theta, grad_w = grad_theta * m_theta, grad_w * m_w
+        return float(costos.mean()), np.concatenate([grad_theta.ravel(), grad_w.ravel()])
+
+    def comprobar_costo(self, cost_function):
+        """ValueError si ``cost_function`` (la de fit) no es el costo que se deriva aquí."""
+        if self.nombre_costo is None:
+            return    # función (p, y) propia: no hay con qué compararla
+        if EQUIVALENTES.get(cost_function) != self.nombre_costo:
+            nombre = getattr(cost_function, "__name__", repr(cost_function))
+            raise ValueError(f"El gradiente deriva el costo '{self.nombre_costo}' pero fit recibió "
+                             f"cost_function={nombre}; con el gradiente por probabilidades solo "
+                             f"{[f.__name__ for f in EQUIVALENTES]} tienen equivalente.")
+
+    def cerrar(self):
+        if self.sesion is not None:
+            self.sesion.cerrar()
+            self.sesion = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class GradienteMPS(GradienteSDK):
+    """
+    Igual que ``GradienteSDK`` pero simulando las 2P + 1 filas con el motor MPS (mps.py), en
+    bloques de ``lote`` filas: el costo sale de las amplitudes de los estados etiqueta (o de
+    sus marginales), sin construir las 2**n amplitudes. Con ``max_enlace`` el gradiente es el
+    del estado truncado. Solo admite entrelazamiento 'lineal' o 'No'.
+    """
+
+    def __init__(self, capas, qubits, lectura=None, costo="fidelidad", entrelazamiento='lineal',
+                 max_enlace=32, lote=256):
+        if entrelazamiento not in ('lineal', 'No'):
+            raise ValueError("El motor MPS solo admite entrelazamiento 'lineal' o 'No'.")
+        super().__init__(capas, qubits, lectura, costo, entrelazamiento)
+        self.max_enlace = max_enlace
+        self.lote = lote
+
+    def _sesion(self, subcapas, n_params):
+        # no hay kernel que compilar: la "sesión" es el número de subcapas
+        return subcapas
+
+    def _probabilidades(self, subcapas, angulos):
+        bloques = []
+        for i in range(0, len(angulos), self.lote):
+            estado = mps_angulos(angulos[i:i + self.lote], self.capas, subcapas, self.qubits,
+                                 self.entrelazamiento, self.max_enlace)
+            if self.lectura is None:
+                bloques.append(estado.marginales(range(self.qubits)))
+            else:
+                bloques.append(estado.probabilidades(self.lectura))
+        return np.concatenate(bloques, axis=0)
@@ -0,0 +1,146 @@
+"""
+Motor de inferencia del modelo DRU que solo depende de NumPy.
+
+Lee el artefacto que escribe ``modelo_guardado.guardar_modelo`` (un .npz con theta, w y la
+configuración en JSON) y evalúa el modelo en lote, sin PennyLane, matplotlib ni sklearn.
+Este archivo no importa nada del paquete: ``guardar_modelo`` lo copia junto al artefacto
+como ``dru_inferencia.py`` para que un proceso de scoring lo use sin instalar DRU_library:
+
+    import dru_inferencia
+    modelo = dru_inferencia.cargar_modelo("modelo_iris.npz")
+    etiquetas = modelo.predict(X)            # ya en las clases originales
+    probs = modelo.predict_proba(X)
+
+La simulación es la misma que ``vector_estado.estados_dru`` (rotaciones RZ RY RZ fusionadas
+y CNOT como permutaciones), con el wire 0 como bit más significativo.
+"""
+
+import json
+import numpy as np
+
+FORMATO = 1
+
+
+# -----------------------
+# Simulación
+# -----------------------
+def _rotaciones(a):
+    """a: (..., 3) -> RZ(a2) RY(a1) RZ(a0), (..., 2, 2)."""
+    c, s = np.cos(a[..., 1] / 2), np.sin(a[..., 1] / 2)
+    suma, resta = (a[..., 0] + a[..., 2]) / 2, (a[..., 0] - a[..., 2]) / 2
+    U = np.empty(a.shape[:-1] + (2, 2), dtype=complex)
+    U[..., 0, 0] = np.exp(-1j * suma) * c
+    U[..., 0, 1] = -np.exp(1j * resta) * s
+    U[..., 1, 0] = np.exp(-1j * resta) * s
+    U[..., 1, 1] = np.exp(1j * suma) * c
+    return U
+
+
+def _cnots(qubits, entrelazamiento):
+    if entrelazamiento == 'lineal':
+        return [(q, q + 1) for q in range(qubits - 1)]
+    if entrelazamiento == 'full':
+        return [(i, j) for i in range(qubits) for j in range(i + 1, qubits)]
+    if entrelazamiento == 'circular':
+        return [(q, q + 1) for q in range(qubits - 1)] + [(qubits - 1, 0)]
+    return []
+
+
+def estados(entradas, theta, w, capas, qubits, entrelazamiento='lineal'):
+    """entradas: (N, subcapas, 3) ya codificadas. Devuelve (N, 2**qubits)."""
+    N, subcapas, _ = entradas.shape
+    phi = np.repeat(entradas, len(w) // subcapas, axis=1) * w + theta
+    U = _rotaciones(phi).reshape(N, capas, subcapas, qubits, 2, 2)
+    psi = np.zeros((N,) + (2,) * qubits, dtype=complex)
+    psi[(slice(None),) + (0,) * qubits] = 1
+    cnots = _cnots(qubits, entrelazamiento)
+    for capa in range(capas):
+        for s in range(subcapas):
+            for q in range(qubits):
+                psi = np.moveaxis(np.einsum("nij,n...j->n...i", U[:, capa, s, q],
+                                            np.moveaxis(psi, q + 1, -1)), -1, q + 1)
+        for c, t in cnots:
+            idx = [slice(None)] * psi.ndim
+            idx[c + 1] = 1
+            psi[tuple(idx)] = np.flip(psi[tuple(idx)], axis=t + 1 if t < c else t).copy()
+    return psi.reshape(N, -1)
+
+
+def marginales(psi, qubits, wires):
+    """(N, 2**m) probabilidades de ``wires`` (el primero es el bit más significativo)."""
+    N = len(psi)
+    p = (psi.real ** 2 + psi.imag ** 2).reshape((N,) + (2,) * qubits)
+    resto = tuple(1 + q for q in range(qubits) if q not in wires)
+    if resto:
+        p = p.sum(axis=resto)
+    orden = np.argsort(np.argsort(wires))
+    return p.transpose([0] + [1 + o for o in orden]).reshape(N, -1)
+
+
+# -----------------------
+# Preprocesamiento
+# -----------------------
+def preprocesar(X, pasos):
+    """Aplica los pasos guardados: "afin" (X * escala + desplazamiento) o "lineal"
+    ((X - media) @ matriz.T)."""
+    for paso in pasos:
+        if paso["tipo"] == "afin":
+            X = X * np.asarray(paso["escala"]) + np.asarray(paso["desplazamiento"])
+        elif paso["tipo"] == "lineal":
+            X = (X - np.asarray(paso["media"])) @ np.asarray(paso["matriz"]).T
+        else:
+            raise ValueError(f"Paso de preprocesamiento desconocido: {paso['tipo']}")
+    return X
+
+
+# -----------------------
+# Modelo cargado
+# -----------------------
+class ModeloDRU:
+    """Modelo guardado: arquitectura, parámetros, clases y preprocesamiento."""
+
+    def __init__(self, meta, theta, w):
+        if meta.get("formato", FORMATO) > FORMATO:
+            raise ValueError(f"Artefacto de formato {meta['formato']}; este motor lee hasta {FORMATO}.")
+        self.meta = meta
+        self.theta = theta
+        self.w = w
+        self.capas = meta["capas"]
+        self.qubits = meta["qubits"]
+        self.entrelazamiento = meta["entrelazamiento"]
+        self.target_dim = meta["target_dim"]
+        self.clases = np.asarray(meta["clases"]) if meta.get("clases") is not None else None
+        lectura = meta.get("lectura") or {}
+        self.wires = lectura.get("qubits") or list(range(self.qubits))
+        self.estados_lectura = lectura.get("estados")
+
+    def codificar(self, X):
+        """Preprocesamiento guardado + relleno/reshape de ``re_dim``: (N, subcapas, target_dim)."""
+        X = preprocesar(np.atleast_2d(np.asarray(X, dtype=float)), self.meta.get("preprocesamiento", []))
+        subcapas = -(-X.shape[1] // self.target_dim)
+        entradas = np.zeros((len(X), subcapas * self.target_dim))
+        entradas[:, :X.shape[1]] = X
+        return entradas.reshape(len(X), subcapas, self.target_dim)
+
+    def predict_proba(self, X, lote=1024):
+        """(N, k) probabilidades de la lectura guardada (o de todo el registro)."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        salida = []
+        for i in range(0, len(X), lote):
+            psi = estados(self.codificar(X[i:i + lote]), self.theta, self.w, self.capas, self.qubits,
+                          self.entrelazamiento)
+            p = marginales(psi, self.qubits, self.wires)
+            salida.append(p if self.estados_lectura is None else p[:, self.estados_lectura])
+        return np.concatenate(salida, axis=0)
+
+    def predict(self, X, lote=1024):
+        """Clases predichas, traducidas a las etiquetas originales si se guardaron."""
+        indices = np.argmax(self.predict_proba(X, lote), axis=1)
+        return indices if self.clases is None else self.clases[indices]
+
+
+def cargar_modelo(ruta):
+    """``ModeloDRU`` desde el .npz de ``guardar_modelo``."""
+    with np.load(ruta, allow_pickle=False) as datos:
+        meta = json.loads(str(datos["meta"]))
+        return ModeloDRU(meta, datos["theta"], datos["w"])
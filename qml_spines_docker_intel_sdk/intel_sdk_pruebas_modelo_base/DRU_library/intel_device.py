@@ -0,0 +1,154 @@
+"""
+Dispositivo de PennyLane que ejecuta los circuitos en los simuladores del Intel Quantum SDK.
+
+    modelo = circuito_parametrico(capas, qubits, device="intel.qd_sim")   # o "intel.iqs"
+
+Cada tape se reduce a RZ/RY/RX + CNOT (y demás puertas de ``sdk_backend.PUERTAS``). Los tapes
+con la misma estructura comparten un kernel paramétrico compilado una sola vez: un
+``qml.execute`` con muchos tapes, o llamadas sucesivas al QNode, solo escriben ángulos en la
+sesión abierta. Devuelve ``qml.state()`` o ``qml.probs()`` (modo analítico); si todos los
+tapes solo piden ``qml.probs(wires)`` se lee únicamente esa marginal del simulador.
+"""
+
+import pennylane as qml
+import numpy as np
+from pennylane.devices import Device, ExecutionConfig
+from pennylane.devices.modifiers import single_tape_support
+from pennylane.devices.preprocess import decompose, validate_device_wires, validate_measurements
+from pennylane.measurements import StateMP, ProbabilityMP
+
+from . import sdk_backend
+from .lectura import Lectura
+
+try:
+    from pennylane.transforms.core import CompilePipeline as _Programa
+except ImportError:  # PennyLane < 0.44
+    from pennylane.transforms.core import TransformProgram as _Programa
+
+BACKENDS = {"intel.qd_sim": "QD_SIM", "intel.iqs": "IQS"}
+
+
+def _soportada(op):
+    return op.name in sdk_backend.PUERTAS
+
+
+def _analitica(mp):
+    return isinstance(mp, (StateMP, ProbabilityMP))
+
+
+@single_tape_support
+class IntelSDKDevice(Device):
+    """
+    wires      : número de qubits (o etiquetas)
+    backend    : "intel.qd_sim" / "QD_SIM" o "intel.iqs" / "IQS"
+    cbindings  : módulo de bindings (por defecto ``intelqsdk.cbindings``)
+    directorio : carpeta para las fuentes y los .so compilados
+    gestor     : GestorSesiones compartido (simulador y kernels cargados entre dispositivos)
+    """
+
+    def __init__(self, wires=None, shots=None, backend="intel.qd_sim", cbindings=None,
+                 directorio=None, gestor=None):
+        if wires is None:
+            raise ValueError("IntelSDKDevice necesita el número de qubits (wires).")
+        super().__init__(wires=wires, shots=shots)
+        self.backend = BACKENDS.get(backend, backend)
+        self._propio = gestor is None
+        self.gestor = gestor or sdk_backend.GestorSesiones(directorio=directorio, cbindings=cbindings)
+        self._kernels = {}      # estructura -> ruta del .so
+        self._sesion = None     # (estructura, SesionSDK)
+
+    @property
+    def name(self):
+        return "intel." + self.backend.lower()
+
+    def preprocess(self, execution_config=None):
+        if execution_config is None:
+            execution_config = ExecutionConfig()
+        programa = _Programa()
+        programa.add_transform(validate_device_wires, wires=self.wires, name=self.name)
+        programa.add_transform(decompose, stopping_condition=_soportada, name=self.name)
+        programa.add_transform(validate_measurements, analytic_measurements=_analitica, name=self.name)
+        return programa, execution_config
+
+    # -----------------------
+    # Reducción del tape
+    # -----------------------
+    def _reducir(self, tape):
+        """Estructura del tape (puertas y qubits) y su fila de ángulos."""
+        ops, angulos = [], []
+        for op in tape.operations:
+            qs = tuple(self.wires.index(w) for w in op.wires)
+            if op.num_params:
+                ops.append((sdk_backend.PUERTAS[op.name], qs, len(angulos)))
+                angulos.append(float(qml.math.toarray(op.parameters[0])))
+            else:
+                ops.append((sdk_backend.PUERTAS[op.name], qs, None))
+        return tuple(ops), np.array(angulos, dtype=float)
+
+    def _sesion_para(self, estructura, n_params):
+        if self._sesion is not None and self._sesion[0] == estructura:
+            return self._sesion[1]
+        if self._sesion is not None:
+            # el kernel anterior queda cargado en el gestor por si vuelve a usarse
+            self._sesion[1].cerrar()
+        if estructura not in self._kernels:
+            fuente = sdk_backend.kernel_cpp(estructura, len(self.wires), n_params)
+            self._kernels[estructura] = sdk_backend.compilar_kernel(
+                fuente, self.gestor.directorio, backend=self.backend, cbindings=self.gestor.cb)
+        sesion = sdk_backend.SesionSDK(self._kernels[estructura], len(self.wires), n_params,
+                                       backend=self.backend, gestor=self.gestor).abrir()
+        self._sesion = (estructura, sesion)
+        return sesion
+
+    def cerrar(self):
+        """Cierra la sesión activa; si el gestor es propio, descarga kernels y simuladores."""
+        if self._sesion is not None:
+            self._sesion[1].cerrar()
+            self._sesion = None
+        if self._propio:
+            self.gestor.cerrar()
+
+    def _lectura(self, tapes):
+        """Lectura si todos los tapes solo piden ``qml.probs`` sobre los mismos wires."""
+        wires = set()
+        for tape in tapes:
+            mps = tape.measurements
+            if len(mps) != 1 or not isinstance(mps[0], ProbabilityMP) or mps[0].obs is not None:
+                return None
+            wires.add(tuple(mps[0].wires) or tuple(self.wires))
+        if len(wires) != 1:
+            return None
+        return Lectura([self.wires.index(w) for w in wires.pop()])
+
+    # -----------------------
+    # Ejecución
+    # -----------------------
+    def execute(self, circuits, execution_config=None):
+        reducidos = [self._reducir(tape) for tape in circuits]
+        resultados = [None] * len(circuits)
+
+        # agrupar por estructura: un kernel compilado por grupo
+        grupos = {}
+        for i, (estructura, _) in enumerate(reducidos):
+            grupos.setdefault(estructura, []).append(i)
+
+        for estructura, indices in grupos.items():
+            sesion = self._sesion_para(estructura, len(reducidos[indices[0]][1]))
+            angulos = np.stack([reducidos[i][1] for i in indices])
+            lectura = self._lectura([circuits[i] for i in indices])
+            if lectura is not None:
+                # solo la marginal pedida: el simulador no devuelve las 2**n amplitudes
+                for i, p in zip(indices, sesion.ejecutar_lote(angulos, lectura=lectura)):
+                    resultados[i] = p
+                continue
+            estados = sesion.ejecutar_lote(angulos)
+            for i, estado in zip(indices, estados):
+                res = tuple(mp.process_state(estado, self.wires) for mp in circuits[i].measurements)
+                resultados[i] = res[0] if len(res) == 1 else res
+        return tuple(resultados)
+
+    def __del__(self):
+        try:
+            self.cerrar()
+        except Exception:
+            pass
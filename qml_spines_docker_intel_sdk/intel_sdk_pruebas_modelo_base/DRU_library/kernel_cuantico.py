@@ -0,0 +1,158 @@
+"""
+Clasificador de kernel cuántico sobre los estados del modelo DRU.
+
+El kernel de solapamiento k(x, x') = |<psi(x)|psi(x')>|^2 sale de los estados, que se
+calculan una sola vez por muestra (en lote) y se guardan. La matriz de Gram es entonces
+|A B^H|^2, un producto de matrices por bloques, en lugar de N^2 circuitos por pares:
+
+    clf = KernelCuantico(capas=2, qubits=3, modelo="svm").fit(X_train, y_train)
+    y_pred = clf.predict(X_val)
+    print(clf.score(X_val, y_val))
+
+Sin parámetros, el embedding es ``theta = 0, w = 1`` (los ángulos son las características);
+también se pueden pasar ``params_flat``/``shape_flat`` de un modelo entrenado con ``fit``.
+Con ``salida`` la Gram se escribe por teselas en un .npy mapeado a disco.
+"""
+
+import hashlib
+import numpy as np
+from sklearn.svm import SVC
+from sklearn.kernel_ridge import KernelRidge
+
+from . import sdk_backend
+from .base_functions import reshape_params
+from .vector_estado import estados_dru
+
+
+# -----------------------
+# Estados y matriz de Gram
+# -----------------------
+def parametros_embedding(n_caracteristicas, capas, qubits, target_dim=3):
+    """theta = 0, w = 1 con la forma de ``parametros``: el embedding es la entrada misma."""
+    vectores = -(-n_caracteristicas // target_dim) * capas * qubits
+    return np.zeros((vectores, target_dim)), np.ones((vectores, target_dim))
+
+
+def estados_embedding(X, theta, w, capas, qubits, entrelazamiento='lineal', motor="numpy",
+                      lote=256, precision="double", **opciones_sdk):
+    """
+    (N, 2**qubits) estados del embedding. motor="numpy" usa ``estados_dru`` (en complex64 con
+    precision="single"); motor="sdk" ejecuta el lote en el Intel SDK con ``amplitudes_sdk``
+    (acepta backend, gestor, ...).
+    """
+    if motor == "numpy":
+        return estados_dru(X, theta, w, capas, qubits, entrelazamiento, lote, precision)
+    if motor == "sdk":
+        return sdk_backend.amplitudes_sdk(X, theta, w, capas, qubits, entrelazamiento, **opciones_sdk)
+    raise ValueError(f"Motor desconocido: {motor}")
+
+
+def gram(A, B=None, bloque=1024, salida=None):
+    """
+    K[i, j] = |<A_i|B_j>|^2 por teselas de ``bloque`` x ``bloque``. A y B pueden ser memmaps.
+    salida: ruta de un .npy (se crea mapeado a disco) o arreglo (N, M) donde escribir.
+    """
+    simetrica = B is None
+    B = A if simetrica else B
+    N, M = len(A), len(B)
+    if isinstance(salida, str):
+        K = np.lib.format.open_memmap(salida, mode="w+", dtype=float, shape=(N, M))
+    elif salida is not None:
+        K = salida
+    else:
+        K = np.empty((N, M))
+
+    for i in range(0, N, bloque):
+        Ai = np.asarray(A[i:i + bloque])
+        # en la simétrica solo se calculan las teselas j >= i y se copia la transpuesta
+        for j in range(i if simetrica else 0, M, bloque):
+            Bj = Ai if simetrica and j == i else np.asarray(B[j:j + bloque])
+            S = Ai.conj() @ Bj.T
+            K[i:i + bloque, j:j + bloque] = S.real ** 2 + S.imag ** 2
+            if simetrica and j != i:
+                K[j:j + bloque, i:i + bloque] = K[i:i + bloque, j:j + bloque].T
+    if hasattr(K, "flush"):
+        K.flush()
+    return K
+
+
+# -----------------------
+# Clasificador
+# -----------------------
+class KernelCuantico:
+    """
+    modelo : "svm" (SVC con kernel precalculado) o "ridge" (KernelRidge sobre etiquetas
+             one-hot; la clase es la columna mayor)
+    C, alpha : regularización de SVC y de KernelRidge
+    motor  : "numpy" o "sdk" (ver ``estados_embedding``); ``opciones_sdk`` se le pasan al SDK
+    precision : "double" o "single" para el motor numpy
+    """
+
+    def __init__(self, capas, qubits, params_flat=None, shape_flat=None, entrelazamiento='lineal',
+                 modelo="svm", C=1.0, alpha=1e-3, motor="numpy", bloque=1024, precision="double",
+                 **opciones_sdk):
+        if modelo not in ("svm", "ridge"):
+            raise ValueError(f"Modelo desconocido: {modelo}")
+        self.capas = capas
+        self.qubits = qubits
+        self.params_flat = params_flat
+        self.shape_flat = shape_flat
+        self.entrelazamiento = entrelazamiento
+        self.modelo = modelo
+        self.C = C
+        self.alpha = alpha
+        self.motor = motor
+        self.bloque = bloque
+        self.precision = precision
+        self.opciones_sdk = opciones_sdk
+        self._cache = {}
+
+    def _parametros(self, d):
+        if self.params_flat is None:
+            return parametros_embedding(d, self.capas, self.qubits)
+        return reshape_params(np.asarray(self.params_flat, dtype=float), self.shape_flat)
+
+    def estados(self, X):
+        """Estados de X; se calculan una vez por conjunto (clave: hash de los datos)."""
+        X = np.ascontiguousarray(X, dtype=float)
+        clave = hashlib.sha1(X.tobytes() + str(X.shape).encode()).hexdigest()
+        if clave not in self._cache:
+            theta, w = self._parametros(X.shape[1])
+            self._cache[clave] = estados_embedding(X, theta, w, self.capas, self.qubits,
+                                                   self.entrelazamiento, self.motor,
+                                                   precision=self.precision, **self.opciones_sdk)
+        return self._cache[clave]
+
+    def fit(self, X, y, salida=None):
+        """Calcula los estados de entrenamiento, su Gram y ajusta el modelo clásico."""
+        y = np.asarray(y, dtype=int)
+        self.estados_train = self.estados(X)
+        K = gram(self.estados_train, bloque=self.bloque, salida=salida)
+        self.clases = np.unique(y)
+        if self.modelo == "svm":
+            self.estimador = SVC(C=self.C, kernel="precomputed").fit(K, y)
+        else:
+            objetivo = (y[:, None] == self.clases[None, :]).astype(float)
+            self.estimador = KernelRidge(alpha=self.alpha, kernel="precomputed").fit(K, objetivo)
+        return self
+
+    def gram_prueba(self, X, salida=None):
+        """(M, N_train) kernel entre X y los datos de entrenamiento."""
+        return gram(self.estados(X), self.estados_train, bloque=self.bloque, salida=salida)
+
+    def decision_function(self, X):
+        K = self.gram_prueba(X)
+        if self.modelo == "svm":
+            return self.estimador.decision_function(K)
+        return self.estimador.predict(K)
+
+    def predict(self, X):
+        if self.modelo == "svm":
+            return self.estimador.predict(self.gram_prueba(X))
+        return self.clases[np.argmax(self.decision_function(X), axis=1)]
+
+    def score(self, X, y):
+        return float(np.mean(self.predict(X) == np.asarray(y)))
+
+    def limpiar_cache(self):
+        self._cache.clear()
@@ -0,0 +1,97 @@
+"""
+Lectura parcial del estado: solo los qubits y estados base que necesita la tarea.
+
+Para clasificar con C clases basta la probabilidad de los C estados etiqueta de
+``generar_etiquetas`` sobre ceil(log2 C) qubits, en vez de las 2**n amplitudes:
+
+    lect = Lectura.clasificacion(C)
+    modelo = circuito_parametrico(capas, qubits, lectura=lect)   # QNode -> qml.probs(wires)
+    y_pred = predict(X, modelo, params_flat, shape_flat, lectura=lect)
+
+Los índices de ``estados`` siguen la convención de PennyLane: el primer qubit de ``qubits``
+es el bit más significativo.
+
+Para entrenar con más qubits de trabajo que de etiqueta, ``reducida`` da la matriz densidad
+de los qubits de etiqueta con un reshape y un producto (2**m x 2**(n-m)), sin formar la de
+4**n; ``costo_batches(..., lectura=lect)`` la compara con las etiquetas de m qubits.
+"""
+
+import math
+import numpy as np
+
+
+class Lectura:
+    """
+    qubits  : wires que se leen (None = todos)
+    estados : índices de estados base sobre esos qubits (None = la marginal completa)
+    """
+
+    def __init__(self, qubits=None, estados=None):
+        self.qubits = None if qubits is None else [int(q) for q in qubits]
+        self.estados = None if estados is None else np.asarray(estados, dtype=int)
+
+    @classmethod
+    def clasificacion(cls, C, qubits_etiqueta=None):
+        """Estados etiqueta 0..C-1 sobre los primeros ceil(log2 C) qubits (o los indicados)."""
+        n = max(int(math.ceil(math.log2(C))), 1)
+        return cls(range(n) if qubits_etiqueta is None else qubits_etiqueta, range(C))
+
+    def wires(self, n_qubits):
+        return list(range(n_qubits)) if self.qubits is None else self.qubits
+
+    # -----------------------
+    # Aplicación
+    # -----------------------
+    def medida(self):
+        """Medida de PennyLane equivalente (marginal sobre ``qubits``)."""
+        import pennylane as qml
+        return qml.probs(wires=self.qubits)
+
+    def seleccionar(self, marginales):
+        """(N, 2**m) probabilidades marginales -> (N, k) de los estados pedidos."""
+        marginales = np.asarray(marginales, dtype=float)
+        return marginales if self.estados is None else marginales[..., self.estados]
+
+    def de_estados(self, estados):
+        """(N, 2**n) vectores de estado -> (N, k) probabilidades leídas."""
+        estados = np.asarray(estados)
+        lote = estados.shape[:-1]
+        n = int(round(math.log2(estados.shape[-1])))
+        p = (estados.real ** 2 + estados.imag ** 2).reshape(lote + (2,) * n)
+        wires = self.wires(n)
+        ejes_lote = len(lote)
+        resto = tuple(ejes_lote + q for q in range(n) if q not in wires)
+        if resto:
+            p = p.sum(axis=resto)
+        # tras sumar, los qubits leídos quedan en orden creciente; se reordenan como en ``qubits``
+        orden = np.argsort(np.argsort(wires))
+        p = p.transpose(list(range(ejes_lote)) + [ejes_lote + o for o in orden])
+        return self.seleccionar(p.reshape(lote + (2 ** len(wires),)))
+
+    def _matriz(self, estado):
+        """Vector de estado -> M (2**m, 2**(n-m)) con los qubits leídos como filas."""
+        import pennylane as qml
+        n = int(round(math.log2(qml.math.shape(estado)[-1])))
+        wires = self.wires(n)
+        resto = [q for q in range(n) if q not in wires]
+        t = qml.math.transpose(qml.math.reshape(estado, (2,) * n), wires + resto)
+        return qml.math.reshape(t, (2 ** len(wires), 2 ** len(resto)))
+
+    def reducida(self, estado):
+        """Matriz densidad reducida de ``qubits`` (traza parcial del resto); admite autograd."""
+        import pennylane as qml
+        M = self._matriz(estado)
+        return qml.math.dot(M, qml.math.conj(qml.math.transpose(M)))
+
+    def marginal(self, estado):
+        """Diagonal de ``reducida`` (probabilidades de ``qubits``) sin formarla; admite autograd."""
+        import pennylane as qml
+        M = self._matriz(estado)
+        return qml.math.sum(qml.math.real(M * qml.math.conj(M)), axis=1)
+
+    def probabilidades(self, salida):
+        """Acepta la salida del modelo: estado (complejo) o marginal de ``medida`` (real)."""
+        salida = np.asarray(salida)
+        if np.iscomplexobj(salida):
+            return self.de_estados(salida)
+        return self.seleccionar(salida)
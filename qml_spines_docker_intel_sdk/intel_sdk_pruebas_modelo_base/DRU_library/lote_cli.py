@@ -0,0 +1,236 @@
+"""
+Evaluación por lotes reanudable de un conjunto de puntos en el Intel SDK.
+
+    # características + modelo exportado (exportar_modelo)
+    python -m DRU_library.lote_cli X.npy --modelo modelo_dru.json --salida resultados/
+    # filas de ángulos del kernel DRU (como angulos_lote)
+    python -m DRU_library.lote_cli angulos.csv --capas 2 --qubits 3 --salida resultados/ --workers 4
+
+La entrada (.npy se abre con mmap, .csv se lee entera) se procesa en bloques de ``--bloque``
+filas con un único kernel compilado. Con ``--workers`` > 1 cada proceso abre la entrada por su
+cuenta y recibe solo (ruta, inicio, fin); hay como mucho 2 bloques por worker en vuelo. El
+almacén de resultados en ``--salida`` contiene:
+
+    amplitudes.npy   (N, 2**qubits) complejos, en el orden de PennyLane
+    tiempos.npy      (N,) segundos de ejecución por fila
+    completados.npy  (N,) índice de filas terminadas
+    errores.jsonl    un registro por bloque fallido
+    meta.json        configuración (una reanudación debe coincidir con ella)
+
+Los tres .npy son memmaps: cada bloque se escribe y se sincroniza antes de marcarse como
+completado, así que si el proceso muere en el punto 73, volver a lanzar el mismo comando
+retoma desde los bloques pendientes.
+"""
+
+import os
+import json
+import importlib
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+
+from . import sdk_backend
+from .exportar import entradas_lote
+
+ARCHIVOS = ("amplitudes.npy", "tiempos.npy", "completados.npy")
+VENTANA_POR_WORKER = 2   # bloques enviados al pool por cada worker y aún sin guardar
+
+
+# -----------------------
+# Entrada
+# -----------------------
+def leer_entrada(ruta):
+    """(N, d) con mmap para .npy; CSV con una fila por punto (se ignoran líneas con #)."""
+    if ruta.endswith(".npy"):
+        datos = np.load(ruta, mmap_mode="r")
+    else:
+        datos = np.loadtxt(ruta, delimiter=",", ndmin=2)
+    if datos.ndim != 2:
+        raise ValueError(f"Se esperaba una matriz (N, d) en {ruta}, no {datos.shape}.")
+    return datos
+
+
+def _plan_modelo(args, d):
+    """Fuente del kernel y cómo convertir cada fila de la entrada en sus parámetros."""
+    if args.modelo:
+        with open(args.modelo, encoding="utf8") as f:
+            meta = json.load(f)
+        with open(os.path.join(os.path.dirname(os.path.abspath(args.modelo)), meta["fuente"]), encoding="utf8") as f:
+            fuente = f.read()
+        return {"fuente": fuente, "qubits": meta["qubits"], "n_params": meta["subcapas"] * 3,
+                "kernel": meta["kernel"], "simbolo": meta["simbolo"], "subcapas": meta["subcapas"]}
+
+    if args.capas is None or args.qubits is None:
+        raise SystemExit("Sin --modelo hacen falta --capas y --qubits (entrada = ángulos).")
+    por_subcapa = args.capas * args.qubits * 3
+    if d % por_subcapa:
+        raise SystemExit(f"{d} ángulos por fila no encajan en {args.capas} capas x {args.qubits} qubits.")
+    ops = sdk_backend.operaciones_dru(args.capas, args.qubits, d // por_subcapa, args.entrelazamiento)
+    return {"fuente": sdk_backend.kernel_cpp(ops, args.qubits, d), "qubits": args.qubits,
+            "n_params": d, "kernel": sdk_backend.KERNEL, "simbolo": sdk_backend.SIMBOLO,
+            "subcapas": None}
+
+
+# -----------------------
+# Almacén de resultados
+# -----------------------
+def abrir_almacen(salida, n, n_qubits, meta):
+    """Crea (o reabre, si ``meta`` coincide) los memmaps de resultados."""
+    os.makedirs(salida, exist_ok=True)
+    ruta_meta = os.path.join(salida, "meta.json")
+    if os.path.isfile(ruta_meta):
+        with open(ruta_meta, encoding="utf8") as f:
+            anterior = json.load(f)
+        if anterior != meta:
+            raise SystemExit(f"{salida} contiene otra corrida ({anterior}); use otra --salida.")
+        modo = "r+"
+    else:
+        modo = "w+"
+    formas = {"amplitudes.npy": ((n, 2 ** n_qubits), complex), "tiempos.npy": ((n,), float),
+              "completados.npy": ((n,), bool)}
+    almacen = {}
+    for nombre in ARCHIVOS:
+        forma, tipo = formas[nombre]
+        almacen[nombre] = np.lib.format.open_memmap(os.path.join(salida, nombre), mode=modo,
+                                                    dtype=tipo, shape=forma)
+    if modo == "w+":
+        with open(ruta_meta, "w", encoding="utf8") as f:
+            json.dump(meta, f, indent=2)
+    return almacen
+
+
+def _guardar_bloque(almacen, inicio, amplitudes, tiempos):
+    fin = inicio + len(amplitudes)
+    almacen["amplitudes.npy"][inicio:fin] = amplitudes
+    almacen["tiempos.npy"][inicio:fin] = tiempos
+    almacen["amplitudes.npy"].flush()
+    almacen["tiempos.npy"].flush()
+    # se marca después de sincronizar los datos: una fila completada siempre tiene resultado
+    almacen["completados.npy"][inicio:fin] = True
+    almacen["completados.npy"].flush()
+
+
+def bloques_pendientes(completados, bloque):
+    """Inicios de los bloques con alguna fila sin completar."""
+    return [i for i in range(0, len(completados), bloque) if not completados[i:i + bloque].all()]
+
+
+# -----------------------
+# Ejecución de un bloque
+# -----------------------
+_sesion = None    # sesión abierta del proceso (se reutiliza entre bloques)
+_entrada = None   # (ruta, datos) de la entrada abierta por el proceso
+
+
+def _filas(ruta, inicio, fin):
+    """Filas [inicio, fin) de la entrada; cada proceso la abre una sola vez."""
+    global _entrada
+    if _entrada is None or _entrada[0] != ruta:
+        _entrada = (ruta, leer_entrada(ruta))
+    return np.asarray(_entrada[1][inicio:fin], dtype=float)
+
+
+def _procesar_bloque(tarea):
+    global _sesion
+    plan, so_path, backend, cbindings, ruta, inicio, fin = tarea
+    filas = _filas(ruta, inicio, fin)
+    if _sesion is None or _sesion.so_path != so_path:
+        cb = sdk_backend.cargar_cbindings(importlib.import_module(cbindings) if cbindings else None)
+        _sesion = sdk_backend.SesionSDK(so_path, plan["qubits"], plan["n_params"], backend=backend,
+                                        kernel=plan["kernel"], simbolo=plan["simbolo"], cbindings=cb).abrir()
+    if plan["subcapas"] is not None:
+        filas = entradas_lote(filas, plan["subcapas"])
+    t0 = time.perf_counter()
+    amplitudes = _sesion.ejecutar_lote(filas)
+    return inicio, amplitudes, np.full(len(filas), (time.perf_counter() - t0) / len(filas))
+
+
+def procesar(entrada, salida, plan, bloque=64, workers=1, backend="QD_SIM", cbindings=None,
+             registro=print):
+    """Procesa los bloques pendientes de ``entrada`` y devuelve (completadas, total, errores)."""
+    global _sesion, _entrada
+    datos = leer_entrada(entrada)
+    _entrada = (os.path.abspath(entrada), datos)
+    cb = sdk_backend.cargar_cbindings(cbindings)
+    meta = {"entrada": os.path.abspath(entrada), "forma": list(datos.shape), "backend": backend,
+            "bloque": bloque, "qubits": plan["qubits"],
+            "kernel": os.path.basename(sdk_backend.rutas_kernel(plan["fuente"], ".", backend)[1])}
+    almacen = abrir_almacen(salida, len(datos), plan["qubits"], meta)
+    pendientes = bloques_pendientes(almacen["completados.npy"], bloque)
+    registro(f"{len(datos)} filas, {len(pendientes)} bloques pendientes de {bloque} filas")
+
+    so_path = sdk_backend.compilar_kernel(plan["fuente"], sdk_backend.directorio_kernels(),
+                                          backend=backend, cbindings=cb)
+    tareas = ((plan, so_path, backend, cb.__name__, _entrada[0], i, min(i + bloque, len(datos)))
+              for i in pendientes)
+    errores = 0
+
+    def fallo(inicio, error):
+        nonlocal errores
+        errores += 1
+        with open(os.path.join(salida, "errores.jsonl"), "a", encoding="utf8") as f:
+            f.write(json.dumps({"inicio": inicio, "bloque": bloque, "error": error}) + "\n")
+        registro(f"  bloque {inicio}: error ({error.splitlines()[-1] if error else ''})")
+
+    if workers <= 1:
+        for tarea in tareas:
+            try:
+                _guardar_bloque(almacen, *_procesar_bloque(tarea))
+            except Exception:
+                fallo(tarea[5], traceback.format_exc())
+        if _sesion is not None:
+            _sesion.cerrar()
+            _sesion = None
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            en_vuelo = {}
+
+            def enviar():
+                tarea = next(tareas, None)
+                if tarea is not None:
+                    en_vuelo[pool.submit(_procesar_bloque, tarea)] = tarea[5]
+
+            for _ in range(VENTANA_POR_WORKER * workers):
+                enviar()
+            while en_vuelo:
+                hechos, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                for futuro in hechos:
+                    inicio = en_vuelo.pop(futuro)
+                    try:
+                        _guardar_bloque(almacen, *futuro.result())
+                    except Exception:
+                        fallo(inicio, traceback.format_exc())
+                    enviar()
+
+    completadas = int(almacen["completados.npy"].sum())
+    registro(f"{completadas}/{len(datos)} filas completadas, {errores} bloques con error")
+    return completadas, len(datos), errores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluación por lotes reanudable en el Intel Quantum SDK.")
+    parser.add_argument("entrada", help=".npy (mmap) o .csv con una fila por punto")
+    parser.add_argument("--salida", required=True, help="directorio del almacén de resultados")
+    parser.add_argument("--modelo", help=".json de exportar_modelo (la entrada son características)")
+    parser.add_argument("--capas", type=int)
+    parser.add_argument("--qubits", type=int)
+    parser.add_argument("--entrelazamiento", default="lineal", choices=["lineal", "full", "circular", "No"])
+    parser.add_argument("--bloque", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--backend", choices=["QD_SIM", "IQS"], default="QD_SIM")
+    parser.add_argument("--local", action="store_true", help="usar cbindings_local en vez del SDK")
+    args = parser.parse_args(argv)
+
+    cb = None
+    if args.local:
+        from . import cbindings_local as cb
+    plan = _plan_modelo(args, leer_entrada(args.entrada).shape[1])
+    completadas, total, errores = procesar(args.entrada, args.salida, plan, args.bloque, args.workers,
+                                           args.backend, cb)
+    return 0 if completadas == total else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
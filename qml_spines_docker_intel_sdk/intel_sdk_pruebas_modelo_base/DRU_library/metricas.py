@@ -0,0 +1,223 @@
+"""
+Registro de métricas de entrenamiento en disco, con memoria acotada.
+
+Cada nivel ("batch", "epoca") es una tabla de columnas float64; cada columna es un archivo
+binario al que solo se le agregan filas, así que leer una columna es un ``np.memmap`` y no
+hace falta cargar (ni picklear) millones de pérdidas. ``metricas.json`` guarda el número de
+filas y los agregados de cada columna (n, media, desviación, mínimo, máximo, último), que se
+actualizan al vaciar el búfer sin releer lo ya escrito:
+
+    with RegistroMetricas("runs/iris") as registro:
+        best_params, historia = fit(..., registro=registro)
+    registro.resumen("batch")["loss"]          # {"n": ..., "media": ..., "min": ..., ...}
+    plot_loss_curve("runs/iris")               # a lo sumo ``puntos`` puntos, dure lo que dure
+
+Si el proceso muere, al reabrir la carpeta se descartan las filas que no alcanzaron a quedar
+en ``metricas.json`` y el registro sigue agregando desde ahí.
+"""
+
+import os
+import json
+import numpy as np
+
+META = "metricas.json"
+FORMATO = 1
+
+
+def _agregados_vacios():
+    return {"n": 0, "media": 0.0, "m2": 0.0, "min": None, "max": None, "ultimo": None}
+
+
+def _combinar(agregado, valores):
+    """Agrega ``valores`` (sin NaN) a los agregados corrientes (fórmula de Chan para la varianza)."""
+    valores = valores[~np.isnan(valores)]
+    if len(valores) == 0:
+        return agregado
+    n_a, n_b = agregado["n"], len(valores)
+    media_b = float(valores.mean())
+    m2_b = float(((valores - media_b) ** 2).sum())
+    n = n_a + n_b
+    delta = media_b - agregado["media"]
+    agregado["media"] += delta * n_b / n
+    agregado["m2"] += m2_b + delta ** 2 * n_a * n_b / n
+    agregado["n"] = n
+    minimo, maximo = float(valores.min()), float(valores.max())
+    agregado["min"] = minimo if agregado["min"] is None else min(agregado["min"], minimo)
+    agregado["max"] = maximo if agregado["max"] is None else max(agregado["max"], maximo)
+    agregado["ultimo"] = float(valores[-1])
+    return agregado
+
+
+class RegistroMetricas:
+    """
+    ruta  : carpeta del registro (se crea; si ya tiene un registro, se sigue agregando)
+    bufer : filas por nivel que se juntan en memoria antes de escribir
+    """
+
+    def __init__(self, ruta, bufer=4096):
+        self.ruta = ruta
+        self.bufer = bufer
+        self.solo_lectura = False
+        os.makedirs(ruta, exist_ok=True)
+        self._niveles = self._leer_meta(ruta)   # nivel -> {"columnas", "filas", "agregados"}
+        self._pendientes = {}                   # nivel -> lista de filas (dict)
+        for nivel, info in self._niveles.items():
+            # descarta lo escrito después del último metricas.json (proceso interrumpido)
+            for columna in info["columnas"]:
+                with open(self._archivo(nivel, columna), "r+b") as f:
+                    f.truncate(info["filas"] * 8)
+
+    @classmethod
+    def abrir(cls, ruta):
+        """Registro existente en ``ruta``, solo lectura (se puede leer mientras otro proceso escribe)."""
+        if not os.path.isfile(os.path.join(ruta, META)):
+            raise FileNotFoundError(f"No hay un registro de métricas en {ruta}")
+        registro = cls.__new__(cls)
+        registro.ruta, registro.bufer, registro.solo_lectura = ruta, 0, True
+        registro._niveles = cls._leer_meta(ruta)
+        registro._pendientes = {}
+        return registro
+
+    @staticmethod
+    def _leer_meta(ruta):
+        meta = os.path.join(ruta, META)
+        if not os.path.isfile(meta):
+            return {}
+        with open(meta, encoding="utf8") as f:
+            return json.load(f)["niveles"]
+
+    def _archivo(self, nivel, columna):
+        return os.path.join(self.ruta, nivel, columna + ".f64")
+
+    # ---- escritura ----
+    def registrar(self, nivel, **valores):
+        """Agrega una fila al nivel; las columnas quedan fijas con la primera fila."""
+        if self.solo_lectura:
+            raise ValueError("El registro se abrió solo para lectura.")
+        if nivel not in self._niveles:
+            os.makedirs(os.path.join(self.ruta, nivel), exist_ok=True)
+            columnas = list(valores)
+            for columna in columnas:
+                open(self._archivo(nivel, columna), "ab").close()
+            self._niveles[nivel] = {"columnas": columnas, "filas": 0,
+                                    "agregados": {c: _agregados_vacios() for c in columnas}}
+        desconocidas = set(valores) - set(self._niveles[nivel]["columnas"])
+        if desconocidas:
+            raise ValueError(f"Columnas nuevas en el nivel {nivel!r}: {sorted(desconocidas)}")
+        pendientes = self._pendientes.setdefault(nivel, [])
+        pendientes.append(valores)
+        if len(pendientes) >= self.bufer:
+            self.vaciar()
+
+    def batch(self, **valores):
+        self.registrar("batch", **valores)
+
+    def epoca(self, **valores):
+        self.registrar("epoca", **valores)
+
+    def vaciar(self):
+        """Escribe las filas pendientes y actualiza ``metricas.json``."""
+        if not any(self._pendientes.values()):
+            return
+        for nivel, filas in self._pendientes.items():
+            if not filas:
+                continue
+            info = self._niveles[nivel]
+            for columna in info["columnas"]:
+                valores = np.array([float(f.get(columna, np.nan)) for f in filas])
+                with open(self._archivo(nivel, columna), "ab") as f:
+                    f.write(valores.tobytes())
+                _combinar(info["agregados"][columna], valores)
+            info["filas"] += len(filas)
+            filas.clear()
+        temporal = os.path.join(self.ruta, f"{META}.{os.getpid()}.tmp")
+        with open(temporal, "w", encoding="utf8") as f:
+            json.dump({"formato": FORMATO, "niveles": self._niveles}, f, indent=1)
+        os.replace(temporal, os.path.join(self.ruta, META))
+
+    def cerrar(self):
+        self.vaciar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # ---- lectura ----
+    def __len__(self):
+        return self.filas("batch")
+
+    def filas(self, nivel):
+        """Filas escritas del nivel (sin contar las pendientes)."""
+        return self._niveles[nivel]["filas"] if nivel in self._niveles else 0
+
+    def columna(self, nivel, nombre):
+        """Columna escrita como memmap de solo lectura (vacía si no hay filas)."""
+        n = self.filas(nivel)
+        if n == 0:
+            return np.zeros(0)
+        return np.memmap(self._archivo(nivel, nombre), dtype=np.float64, mode="r", shape=(n,))
+
+    def resumen(self, nivel="epoca"):
+        """{columna: {n, media, desviacion, min, max, ultimo}} de lo ya escrito."""
+        if nivel not in self._niveles:
+            return {}
+        resumen = {}
+        for columna, a in self._niveles[nivel]["agregados"].items():
+            desviacion = float(np.sqrt(a["m2"] / a["n"])) if a["n"] else None
+            resumen[columna] = {"n": a["n"], "media": a["media"] if a["n"] else None,
+                                "desviacion": desviacion, "min": a["min"], "max": a["max"],
+                                "ultimo": a["ultimo"]}
+        return resumen
+
+
+# -----------------------
+# Reducción para graficar
+# -----------------------
+def reducir_minmax(valores, puntos=2000, bloque=1 << 20):
+    """
+    (indices, valores) con a lo sumo ``puntos`` puntos: la serie se parte en puntos // 2
+    tramos y de cada uno quedan su mínimo y su máximo, en orden. Los picos se conservan y la
+    serie se recorre por bloques (sirve para un memmap de millones de filas).
+    """
+    valores = valores if hasattr(valores, "shape") else np.asarray(valores, dtype=float)
+    n = len(valores)
+    if n <= puntos:
+        return np.arange(n), np.asarray(valores, dtype=float)
+    tramo = -(-n // max(puntos // 2, 1))
+    paso = max(bloque // tramo, 1) * tramo
+    indices = []
+    for inicio in range(0, n, paso):
+        trozo = np.asarray(valores[inicio:inicio + paso], dtype=float)
+        # el último tramo puede quedar incompleto: se rellena con NaN, que nunca se elige
+        tramos = -(-len(trozo) // tramo)
+        parte = np.full(tramos * tramo, np.nan)
+        parte[:len(trozo)] = trozo
+        parte = parte.reshape(tramos, tramo)
+        nan = np.isnan(parte)
+        i_min = np.argmin(np.where(nan, np.inf, parte), axis=1)
+        i_max = np.argmax(np.where(nan, -np.inf, parte), axis=1)
+        base = inicio + tramo * np.arange(tramos)
+        indices.append(np.sort(np.stack([base + i_min, base + i_max], axis=1), axis=1).reshape(-1))
+    indices = np.concatenate(indices)
+    return indices, np.asarray(valores[indices], dtype=float)
+
+
+def media_movil_en(valores, window, indices, bloque=1 << 20):
+    """
+    Media móvil de ``window`` valores que terminan en cada uno de ``indices`` (>= window - 1),
+    con sumas acumuladas por bloques: no se arma la serie suavizada completa.
+    """
+    indices = np.asarray(indices)
+    necesarios = np.concatenate([indices + 1, indices + 1 - window])
+    acumulada = np.zeros(len(necesarios))
+    total = 0.0
+    for inicio in range(0, len(valores), bloque):
+        trozo = np.cumsum(np.asarray(valores[inicio:inicio + bloque], dtype=float)) + total
+        # C[j] = suma de los primeros j valores; los j de este bloque son inicio + 1 .. inicio + len
+        dentro = (necesarios > inicio) & (necesarios <= inicio + len(trozo))
+        acumulada[dentro] = trozo[necesarios[dentro] - inicio - 1]
+        total = trozo[-1]
+    k = len(indices)
+    return (acumulada[:k] - acumulada[k:]) / window
@@ -0,0 +1,87 @@
+"""
+Guardado de un modelo DRU entrenado como artefacto autocontenido.
+
+    guardar_modelo("modelos/iris.npz", capas=4, qubits=2, params_flat=best_params,
+                   shape_flat=shape_flat, entrelazamiento='No', clases=iris.target_names,
+                   preprocesamiento=[pca, scaler], lectura=Lectura.clasificacion(3))
+
+escribe ``iris.npz`` (theta, w y la configuración en JSON, sin pickle) y, por defecto, copia
+``inferencia.py`` como ``dru_inferencia.py`` en la misma carpeta. Para cargarlo no hace falta
+este paquete ni PennyLane: ver ``inferencia.cargar_modelo``.
+
+El preprocesamiento se guarda como pasos de NumPy a partir de transformadores ya ajustados
+(se leen sus atributos, sin importar sklearn): MinMaxScaler y StandardScaler como pasos
+afines, PCA como paso lineal; también se aceptan diccionarios con el formato de los pasos.
+"""
+
+import os
+import json
+import shutil
+import numpy as np
+
+from .inferencia import FORMATO, cargar_modelo
+
+RUNTIME = "dru_inferencia.py"
+
+
+def paso_preprocesamiento(transformador):
+    """Paso de ``inferencia.preprocesar`` equivalente a un transformador ajustado."""
+    if isinstance(transformador, dict):
+        return transformador
+    if hasattr(transformador, "components_") and hasattr(transformador, "mean_"):
+        if getattr(transformador, "whiten", False):
+            raise ValueError("PCA con whiten=True no está soportado.")
+        return {"tipo": "lineal", "media": np.asarray(transformador.mean_).tolist(),
+                "matriz": np.asarray(transformador.components_).tolist()}
+    if hasattr(transformador, "min_") and hasattr(transformador, "scale_"):        # MinMaxScaler
+        return {"tipo": "afin", "escala": np.asarray(transformador.scale_).tolist(),
+                "desplazamiento": np.asarray(transformador.min_).tolist()}
+    if hasattr(transformador, "scale_") and hasattr(transformador, "mean_"):       # StandardScaler
+        # with_mean / with_std en False dejan el atributo en None
+        media = 0.0 if transformador.mean_ is None else np.asarray(transformador.mean_)
+        escala = 1.0 if transformador.scale_ is None else np.asarray(transformador.scale_)
+        return {"tipo": "afin", "escala": np.atleast_1d(1 / escala).tolist(),
+                "desplazamiento": np.atleast_1d(-media / escala).tolist()}
+    raise TypeError(f"No se sabe guardar el preprocesamiento {type(transformador).__name__}.")
+
+
+def _valores(clases):
+    if clases is None:
+        return None
+    return [c.item() if hasattr(c, "item") else c for c in np.asarray(clases)]
+
+
+def guardar_modelo(ruta, capas, qubits, params_flat, shape_flat, entrelazamiento='lineal',
+                   target_dim=3, clases=None, lectura=None, preprocesamiento=(), copiar_runtime=True,
+                   **extra):
+    """
+    Escribe el artefacto en ``ruta`` (.npz). ``clases`` traduce el índice predicho a la
+    etiqueta original; ``extra`` se guarda tal cual en la configuración (debe ser JSON).
+    Devuelve la ruta escrita.
+    """
+    # base_functions importa PennyLane: solo hace falta para guardar, no para cargar
+    from .base_functions import reshape_params
+
+    theta, w = reshape_params(np.asarray(params_flat, dtype=float), shape_flat)
+    meta = {
+        "formato": FORMATO,
+        "capas": int(capas),
+        "qubits": int(qubits),
+        "entrelazamiento": entrelazamiento,
+        "target_dim": int(target_dim),
+        "clases": _valores(clases),
+        "lectura": None if lectura is None else {
+            "qubits": lectura.qubits,
+            "estados": None if lectura.estados is None else lectura.estados.tolist(),
+        },
+        "preprocesamiento": [paso_preprocesamiento(t) for t in preprocesamiento],
+        **extra,
+    }
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    with open(ruta, "wb") as f:
+        np.savez(f, theta=np.asarray(theta), w=np.asarray(w), meta=np.array(json.dumps(meta)))
+    if copiar_runtime:
+        shutil.copyfile(os.path.join(os.path.dirname(__file__), "inferencia.py"),
+                        os.path.join(directorio, RUNTIME))
+    return ruta
@@ -0,0 +1,208 @@
+"""
+Simulación del modelo DRU con estados de producto de matrices (MPS), en lote sobre muestras.
+
+Con ``entrelazamiento='lineal'`` el circuito solo tiene CNOT entre vecinos, así que el estado
+se guarda como una cadena de tensores A[q] de forma (N, D_izq, 2, D_der) (N = muestras) y el
+costo crece con la dimensión de enlace D en lugar de con 2**n. Cada CNOT se aplica sobre el
+par (q, q+1) con el centro de ortogonalidad en q y se trunca con una SVD a ``max_enlace``
+valores singulares; el peso descartado queda en ``error_truncamiento``.
+
+Solo se leen las amplitudes de unos estados base o las marginales de unos pocos qubits, que
+es lo que necesitan los costos y ``predict``:
+
+    lect = Lectura.clasificacion(C)
+    p = probabilidades_mps(X, theta, w, capas, qubits=40, lectura=lect, max_enlace=32)
+    modelo = circuito_mps(capas, qubits=40, lectura=lect)     # modelo(x, theta, w) -> (k,)
+
+Es NumPy puro (sin autograd): para entrenar se usa ``GradienteMPS`` (gradientes_sdk), que
+obtiene costo y gradiente por desplazamiento de parámetros a partir de las amplitudes de los
+estados etiqueta:
+
+    with GradienteMPS(capas, qubits=40, lectura=lect, max_enlace=32) as grad:
+        best_params, historia = fit(modelo, etiquetas, X_train, y_train, X_val, y_val,
+                                    params_flat, shape_flat, fidelity_cost, gradiente=grad)
+"""
+
+import numpy as np
+
+from .sdk_backend import angulos_lote
+
+
+class MPS:
+    """
+    Lote de N estados MPS de ``n_qubits`` inicializados en |0...0>. El qubit 0 es el primero
+    de la cadena y el bit más significativo de los índices (como en PennyLane).
+    """
+
+    def __init__(self, n_qubits, n_lote, max_enlace=None, corte=1e-14):
+        self.n_qubits = n_qubits
+        self.n_lote = n_lote
+        self.max_enlace = max_enlace
+        self.corte = corte
+        cero = np.zeros((n_lote, 1, 2, 1), dtype=complex)
+        cero[:, 0, 0, 0] = 1
+        self.tensores = [cero.copy() for _ in range(n_qubits)]
+        self.centro = 0
+        self.error_truncamiento = np.zeros(n_lote)
+
+    @property
+    def enlaces(self):
+        return [A.shape[3] for A in self.tensores[:-1]]
+
+    # -----------------------
+    # Forma canónica
+    # -----------------------
+    def _mover_centro(self, q):
+        A = self.tensores
+        N = self.n_lote
+        while self.centro < q:
+            c = self.centro
+            _, Dl, _, Dr = A[c].shape
+            Q, R = np.linalg.qr(A[c].reshape(N, Dl * 2, Dr))
+            A[c] = Q.reshape(N, Dl, 2, -1)
+            A[c + 1] = np.einsum("nkr,nrjs->nkjs", R, A[c + 1])
+            self.centro += 1
+        while self.centro > q:
+            c = self.centro
+            _, Dl, _, Dr = A[c].shape
+            Q, R = np.linalg.qr(A[c].reshape(N, Dl, 2 * Dr).transpose(0, 2, 1))
+            A[c] = Q.transpose(0, 2, 1).reshape(N, -1, 2, Dr)
+            A[c - 1] = np.einsum("nail,nkl->naik", A[c - 1], R)
+            self.centro -= 1
+
+    # -----------------------
+    # Puertas
+    # -----------------------
+    def aplicar_1q(self, q, U):
+        """U: (N, 2, 2) o (2, 2)."""
+        U = np.broadcast_to(U, (self.n_lote, 2, 2))
+        self.tensores[q] = np.einsum("nij,nljr->nlir", U, self.tensores[q])
+
+    def aplicar_cnot(self, q):
+        """CNOT con control q y objetivo q + 1, truncando el enlace entre ambos."""
+        self._mover_centro(q)
+        A, B = self.tensores[q], self.tensores[q + 1]
+        N, Dl, _, _ = A.shape
+        Dr = B.shape[3]
+        theta = np.einsum("nlia,najr->nlijr", A, B)
+        theta[:, :, 1] = theta[:, :, 1, ::-1].copy()
+
+        U, S, Vh = np.linalg.svd(theta.reshape(N, Dl * 2, 2 * Dr), full_matrices=False)
+        # enlace común al lote: los valores singulares no despreciables de alguna muestra
+        k = max(int(np.max(np.sum(S > self.corte * S[:, :1], axis=1))), 1)
+        if self.max_enlace is not None:
+            k = min(k, self.max_enlace)
+        total = np.sum(S ** 2, axis=1)
+        self.error_truncamiento += np.sum(S[:, k:] ** 2, axis=1) / total
+        S = S[:, :k] / np.sqrt(np.sum(S[:, :k] ** 2, axis=1, keepdims=True))
+
+        self.tensores[q] = U[:, :, :k].reshape(N, Dl, 2, k)
+        self.tensores[q + 1] = (S[:, :, None] * Vh[:, :k]).reshape(N, k, 2, Dr)
+        self.centro = q + 1
+
+    # -----------------------
+    # Lectura
+    # -----------------------
+    def amplitudes(self, indices):
+        """(N, K) amplitudes <b|psi> de los estados base ``indices`` del registro completo."""
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        n = self.n_qubits
+        bits = (indices[:, None] >> np.arange(n - 1, -1, -1)) & 1
+        v = np.ones((self.n_lote, len(indices), 1), dtype=complex)
+        for q, A in enumerate(self.tensores):
+            v = np.einsum("nkl,nlkr->nkr", v, A[:, :, bits[:, q], :])
+        return v[:, :, 0]
+
+    def marginales(self, wires):
+        """(N, 2**m) probabilidades marginales de ``wires``, el primero como bit más significativo."""
+        wires = list(wires)
+        leidos = set(wires)
+        R = np.ones((self.n_lote, 1, 1, 1), dtype=complex)
+        for q, A in enumerate(self.tensores):
+            if q in leidos:
+                R = np.einsum("npab,naic,nbid->npicd", R, A, A.conj(), optimize=True)
+                R = R.reshape(self.n_lote, -1, R.shape[3], R.shape[4])
+            else:
+                R = np.einsum("npab,naic,nbid->npcd", R, A, A.conj(), optimize=True)
+        p = R[:, :, 0, 0].real
+        # quedan en orden creciente de qubit; se reordenan como en ``wires``
+        orden = sorted(wires)
+        p = p.reshape((self.n_lote,) + (2,) * len(wires))
+        p = p.transpose([0] + [1 + orden.index(q) for q in wires])
+        return p.reshape(self.n_lote, -1)
+
+    def probabilidades(self, lectura):
+        """(N, k) probabilidades que pide una ``Lectura``."""
+        wires = lectura.wires(self.n_qubits)
+        if lectura.estados is not None and wires == list(range(self.n_qubits)):
+            return np.abs(self.amplitudes(lectura.estados)) ** 2
+        return lectura.seleccionar(self.marginales(wires))
+
+
+# -----------------------
+# Modelo DRU
+# -----------------------
+def _rotaciones(a):
+    """a: (..., 3) -> RZ(a2) RY(a1) RZ(a0) en lote, (..., 2, 2)."""
+    c, s = np.cos(a[..., 1] / 2), np.sin(a[..., 1] / 2)
+    suma, resta = (a[..., 0] + a[..., 2]) / 2, (a[..., 0] - a[..., 2]) / 2
+    U = np.empty(a.shape[:-1] + (2, 2), dtype=complex)
+    U[..., 0, 0] = np.exp(-1j * suma) * c
+    U[..., 0, 1] = -np.exp(1j * resta) * s
+    U[..., 1, 0] = np.exp(-1j * resta) * s
+    U[..., 1, 1] = np.exp(1j * suma) * c
+    return U
+
+
+def mps_angulos(angulos, capas, subcapas, qubits, entrelazamiento='lineal', max_enlace=None,
+                corte=1e-14):
+    """Estados MPS para una matriz de ángulos (N, P) como la de ``angulos_lote``."""
+    if entrelazamiento not in ('lineal', 'No'):
+        raise ValueError("El motor MPS solo admite entrelazamiento 'lineal' o 'No'.")
+    U = _rotaciones(np.asarray(angulos).reshape(len(angulos), capas, subcapas, qubits, 3))
+
+    estado = MPS(qubits, len(angulos), max_enlace, corte)
+    for capa in range(capas):
+        for s in range(subcapas):
+            for q in range(qubits):
+                estado.aplicar_1q(q, U[:, capa, s, q])
+        if entrelazamiento == 'lineal':
+            for q in range(qubits - 1):
+                estado.aplicar_cnot(q)
+    return estado
+
+
+def mps_dru(X, theta, w, capas, qubits, entrelazamiento='lineal', max_enlace=None, corte=1e-14):
+    """Estados MPS del modelo ``circuito_parametrico`` para todas las filas de X."""
+    angulos, subcapas = angulos_lote(X, theta, w)
+    return mps_angulos(angulos, capas, subcapas, qubits, entrelazamiento, max_enlace, corte)
+
+
+def probabilidades_mps(X, theta, w, capas, qubits, lectura, entrelazamiento='lineal',
+                       max_enlace=32, lote=64):
+    """(N, k) probabilidades de ``lectura`` para X, en bloques de ``lote`` muestras."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    bloques = [mps_dru(X[i:i + lote], theta, w, capas, qubits, entrelazamiento, max_enlace)
+               .probabilidades(lectura) for i in range(0, len(X), lote)]
+    return np.concatenate(bloques, axis=0)
+
+
+def circuito_mps(capas, qubits, lectura=None, entrelazamiento='lineal', max_enlace=32):
+    """
+    Análogo de ``circuito_parametrico`` sobre el motor MPS, solo para evaluar (no admite
+    autograd; para entrenar, ``GradienteMPS``). ``modelo(x, theta, w)`` devuelve las
+    marginales de ``lectura.qubits`` (o el vector de estado completo si no hay lectura, solo
+    viable con pocos qubits). Como en ``circuito_parametrico``, un x 2-D es una muestra ya
+    codificada (subcapas, 3); un x 3-D, un lote de muestras codificadas.
+    """
+    def modelo(x, theta, w):
+        X = np.asarray(x, dtype=float)
+        estado = mps_dru(X[None] if X.ndim < 3 else X, theta, w, capas, qubits,
+                         entrelazamiento, max_enlace)
+        if lectura is None:
+            salida = estado.amplitudes(np.arange(2 ** qubits))
+        else:
+            salida = estado.marginales(lectura.wires(qubits))
+        return salida if X.ndim == 3 else salida[0]
+
+    return modelo
@@ -0,0 +1,68 @@
+"""
+Modo de muestreo (shots finitos) con histogramas vectorizados.
+
+Todo el lote se resuelve sin bucles de Python sobre los shots:
+
+- ``conteos``: una sola llamada multinomial para las N distribuciones (N, k).
+- ``histograma``: muestras en bits (N, shots, m), como las de ``getSamples``, -> conteos
+  (N, 2**m) con un único ``bincount``.
+
+Decenas de miles de shots por punto cuestan lo mismo que unos pocos.
+"""
+
+import numpy as np
+
+
+def _generador(semilla):
+    if isinstance(semilla, np.random.Generator):
+        return semilla
+    return np.random.default_rng(semilla)
+
+
+# -----------------------
+# Muestreo desde probabilidades
+# -----------------------
+def conteos(probs, shots, semilla=None):
+    """
+    probs: (N, k) o (k,) probabilidades. Si cada fila suma menos de 1 (lectura parcial),
+    el resto se trata como un resultado "otro" que se descarta al final.
+    Devuelve los conteos enteros (N, k).
+    """
+    probs = np.atleast_2d(np.asarray(probs, dtype=float))
+    probs = np.clip(probs, 0, None)
+    resto = 1.0 - probs.sum(axis=1, keepdims=True)
+    # renormaliza el ruido de redondeo; con lectura parcial el resto queda como columna extra
+    pvals = np.concatenate([probs, np.clip(resto, 0, None)], axis=1)
+    pvals /= pvals.sum(axis=1, keepdims=True)
+    return _generador(semilla).multinomial(int(shots), pvals)[:, :-1]
+
+
+def estimar_probabilidades(probs, shots, semilla=None):
+    """Frecuencias relativas (N, k) de ``shots`` muestras por fila."""
+    return conteos(probs, shots, semilla) / float(shots)
+
+
+# -----------------------
+# Histogramas de muestras
+# -----------------------
+def indices_muestras(bits):
+    """
+    bits: (..., m) con el bit j del qubit j de la referencia (j = 0 el más significativo,
+    como en PennyLane). Devuelve los índices enteros (...).
+    """
+    bits = np.asarray(bits, dtype=np.int64)
+    m = bits.shape[-1]
+    return bits @ (1 << np.arange(m - 1, -1, -1, dtype=np.int64))
+
+
+def histograma(bits, m=None):
+    """
+    bits: (N, shots, m) o (shots, m) muestras de ``getSamples``. Devuelve (N, 2**m) conteos.
+    """
+    bits = np.asarray(bits)
+    if bits.ndim == 2:
+        bits = bits[None]
+    m = bits.shape[-1] if m is None else m
+    k = 2 ** m
+    idx = indices_muestras(bits) + k * np.arange(len(bits))[:, None]
+    return np.bincount(idx.reshape(-1), minlength=k * len(bits)).reshape(len(bits), k)
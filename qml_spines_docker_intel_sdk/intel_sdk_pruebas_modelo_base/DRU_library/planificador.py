@@ -0,0 +1,200 @@
+"""
+Planificador asíncrono de trabajos del SDK: traduce y compila los kernels siguientes mientras
+se ejecuta el actual.
+
+    trabajos = [Trabajo(qasm=q, n_qubits=1) for q in circuitos_qasm]
+    resultados = ejecutar_trabajos(trabajos, max_compiladores=2, capacidad=4)
+    amplitudes = [r.valor for r in resultados if r.ok]
+
+- La traducción (openqasm_bridge) corre en un hilo y la compilación en subprocesos, como
+  mucho ``max_compiladores`` a la vez; fuentes idénticas se compilan una sola vez.
+- La cola entre preparación y ejecución tiene ``capacidad`` lugares: si la ejecución se
+  atrasa, se deja de preparar (backpressure).
+- La ejecución ocurre en un único hilo (el runtime del SDK no es reentrante), en el orden de
+  entrada. Un error en cualquier etapa queda en su ``Resultado`` y no detiene el resto.
+- Dentro de un event loop (Jupyter) se usa ``await plan.procesar(trabajos)``; ``ejecutar``
+  también funciona ahí, corriendo la tubería en otro hilo.
+
+Así cada punto cuesta aproximadamente max(compilación, ejecución) en vez de la suma.
+"""
+
+import os
+import time
+import shutil
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from . import sdk_backend
+from .artefactos import directorio_rapido
+
+
+class Trabajo:
+    """
+    qasm     : circuito OpenQASM 2 (se traduce a C++), o
+    cpp      : fuente C++ ya lista
+    n_qubits : qubits que se leen del registro ``registro``
+    """
+
+    def __init__(self, qasm=None, cpp=None, n_qubits=1, kernel="my_kernel", registro="q"):
+        if (qasm is None) == (cpp is None):
+            raise ValueError("Un trabajo necesita qasm o cpp (uno de los dos).")
+        self.qasm = qasm
+        self.cpp = cpp
+        self.n_qubits = n_qubits
+        self.kernel = kernel
+        self.registro = registro
+
+
+class Resultado:
+    """valor (amplitudes u otro retorno de ``ejecutar``) o error, con la etapa donde falló."""
+
+    def __init__(self, indice, trabajo):
+        self.indice = indice
+        self.trabajo = trabajo
+        self.valor = None
+        self.error = None
+        self.etapa = None
+        self.tiempos = {}
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        estado = "ok" if self.ok else f"error en {self.etapa}: {self.error!r}"
+        return f"Resultado({self.indice}, {estado})"
+
+
+class Planificador:
+    """
+    backend          : "QD_SIM" o "IQS"
+    max_compiladores : subprocesos del compilador simultáneos
+    capacidad        : trabajos preparados que pueden esperar a la ejecución
+    ejecutar         : función (so_path, trabajo) -> valor; por defecto las amplitudes con
+                       ``GestorSesiones.ejecutar_kernel``
+    """
+
+    def __init__(self, backend="QD_SIM", max_compiladores=2, capacidad=4, directorio=None,
+                 cbindings=None, gestor=None, ejecutar=None):
+        self.backend = backend
+        self.max_compiladores = max_compiladores
+        self.capacidad = capacidad
+        self._temporal = directorio is None and gestor is None
+        self.directorio = directorio or (gestor.directorio if gestor else directorio_rapido("dru_plan_"))
+        self._propio = gestor is None
+        self.gestor = gestor or sdk_backend.GestorSesiones(directorio=self.directorio, cbindings=cbindings)
+        self.cb = self.gestor.cb
+        self._ejecutar = ejecutar or self._amplitudes
+        self._hilo = ThreadPoolExecutor(max_workers=1)
+
+    def _amplitudes(self, so_path, trabajo):
+        return self.gestor.ejecutar_kernel(so_path, trabajo.kernel, trabajo.n_qubits, self.backend,
+                                           trabajo.registro)
+
+    # -----------------------
+    # Preparación
+    # -----------------------
+    async def _compilar(self, fuente):
+        opciones = sdk_backend.opciones_kernel(fuente, self.backend)
+        cpp_path, so_path = sdk_backend.rutas_kernel(fuente, self.directorio, self.backend, opciones)
+        if os.path.isfile(so_path):
+            return so_path
+        async with self._limite:
+            with open(cpp_path, "w", encoding="utf8") as f:
+                f.write(fuente)
+            cmd = sdk_backend.comando_compilador(cpp_path, so_path, self.backend, cbindings=self.cb,
+                                                 opciones=opciones)
+            proc = await asyncio.create_subprocess_exec(*cmd, cwd=self.directorio,
+                                                        stdout=asyncio.subprocess.DEVNULL,
+                                                        stderr=asyncio.subprocess.PIPE)
+            _, err = await proc.communicate()
+        if proc.returncode:
+            raise RuntimeError(f"El compilador terminó con código {proc.returncode}: "
+                               f"{err.decode(errors='replace').strip()[-500:]}")
+        return so_path
+
+    async def _preparar(self, resultado):
+        trabajo = resultado.trabajo
+        resultado.etapa = "traduccion"
+        t0 = time.perf_counter()
+        fuente = trabajo.cpp
+        if fuente is None:
+            lineas = await asyncio.to_thread(self._traducir, trabajo.qasm, kernel_name=trabajo.kernel)
+            fuente = "\n".join(lineas) + "\n"
+        resultado.tiempos["traduccion"] = time.perf_counter() - t0
+
+        resultado.etapa = "compilacion"
+        t0 = time.perf_counter()
+        clave = sdk_backend.rutas_kernel(fuente, self.directorio, self.backend)[1]
+        if clave not in self._compilaciones:
+            self._compilaciones[clave] = asyncio.ensure_future(self._compilar(fuente))
+        so_path = await self._compilaciones[clave]
+        resultado.tiempos["compilacion"] = time.perf_counter() - t0
+        return so_path
+
+    # -----------------------
+    # Tubería
+    # -----------------------
+    async def procesar(self, trabajos):
+        """Procesa todos los trabajos y devuelve sus ``Resultado`` en el orden de entrada."""
+        self._limite = asyncio.Semaphore(self.max_compiladores)
+        self._compilaciones = {}   # ruta .so -> tarea de compilación en curso o terminada
+        self._traducir = sdk_backend.traductor(self.cb) if any(t.qasm is not None for t in trabajos) else None
+        resultados = [Resultado(i, t) for i, t in enumerate(trabajos)]
+        cola = asyncio.Queue(maxsize=self.capacidad)
+        loop = asyncio.get_running_loop()
+
+        async def productor():
+            for r in resultados:
+                # put bloquea cuando hay ``capacidad`` trabajos preparándose o esperando
+                await cola.put((r, asyncio.ensure_future(self._preparar(r))))
+            await cola.put(None)
+
+        async def consumidor():
+            while (item := await cola.get()) is not None:
+                r, preparacion = item
+                try:
+                    so_path = await preparacion
+                    r.etapa = "ejecucion"
+                    t0 = time.perf_counter()
+                    r.valor = await loop.run_in_executor(self._hilo, self._ejecutar, so_path, r.trabajo)
+                    r.tiempos["ejecucion"] = time.perf_counter() - t0
+                    r.etapa = None
+                except Exception as e:
+                    r.error = e
+
+        await asyncio.gather(productor(), consumidor())
+        return resultados
+
+    def ejecutar(self, trabajos):
+        """
+        Versión síncrona de ``procesar``. Si ya hay un event loop corriendo en este hilo
+        (Jupyter), ``asyncio.run`` no se puede usar: la tubería corre en un hilo aparte con su
+        propio loop. Desde código asíncrono conviene ``await plan.procesar(trabajos)``.
+        """
+        trabajos = list(trabajos)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.procesar(trabajos))
+        with ThreadPoolExecutor(max_workers=1) as hilo:
+            return hilo.submit(asyncio.run, self.procesar(trabajos)).result()
+
+    def cerrar(self):
+        self._hilo.shutdown(wait=True)
+        if self._propio:
+            self.gestor.cerrar()
+        if self._temporal:
+            shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def ejecutar_trabajos(trabajos, **opciones):
+    """Atajo: crea un ``Planificador`` con ``opciones``, procesa los trabajos y lo cierra."""
+    with Planificador(**opciones) as plan:
+        return plan.ejecutar(trabajos)
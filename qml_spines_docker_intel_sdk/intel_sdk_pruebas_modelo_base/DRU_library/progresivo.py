@@ -0,0 +1,97 @@
+"""
+Entrenamiento progresivo por capas (warm start).
+
+Se entrena primero el modelo de 1 capa hasta que el costo se estanca (el early stopping de
+``fit`` con ``patience``) y luego se agrega una capa cuyas rotaciones empiezan cerca de la
+identidad (theta, w ~ 0), conservando los bloques de theta/w ya entrenados. Las épocas con
+pocas capas son mucho más baratas, y con ``congelar=True`` solo la capa nueva recibe
+gradiente:
+
+    best_params, shape_flat, historias = fit_progresivo(
+        etiquetas, X_train, y_train, X_val, y_val, capas=4, qubits=2,
+        cost_function=fidelity_cost, epochs_por_capa=50, patience=10, congelar=True)
+
+En ``theta``/``w`` (forma (subcapas * capas * qubits, 3)) cada capa ocupa un bloque de
+``subcapas * qubits`` filas consecutivas, así que agregar una capa es agregar filas al final.
+Con entrelazamiento distinto de 'No' la capa nueva también agrega sus CNOT: solo las
+rotaciones empiezan en la identidad.
+"""
+
+import numpy as np
+from pennylane import numpy as pnp
+
+from .base_functions import circuito_parametrico, parametros, flatten_params, reshape_params
+from .datos import separar
+from .training import fit
+
+
+def filas_por_capa(shape_flat, capas):
+    return shape_flat[0][0] // capas
+
+
+def agregar_capa(params_flat, shape_flat, capas, escala=1e-2, rng=None):
+    """
+    Parámetros de ``capas + 1`` capas: los actuales y una capa nueva con theta y w de
+    N(0, escala) (rotaciones casi identidad). Devuelve (params_flat, shape_flat).
+    """
+    rng = rng or np.random
+    theta, w = reshape_params(np.asarray(params_flat, dtype=float), shape_flat)
+    filas = filas_por_capa(shape_flat, capas)
+    theta = np.concatenate([theta, rng.normal(0, escala, (filas, theta.shape[1]))])
+    w = np.concatenate([w, rng.normal(0, escala, (filas, w.shape[1]))])
+    flat, shapes = flatten_params([theta, w])
+    return pnp.array(flat, requires_grad=True), shapes
+
+
+def mascara_capas(shape_flat, capas, entrenables):
+    """Máscara booleana sobre ``params_flat`` con True en las capas ``entrenables``."""
+    filas = filas_por_capa(shape_flat, capas)
+    por_fila = np.zeros(shape_flat[0][0], dtype=bool)
+    for capa in entrenables:
+        por_fila[capa * filas:(capa + 1) * filas] = True
+    bloque = np.repeat(por_fila, shape_flat[0][1])
+    return np.concatenate([bloque, bloque])
+
+
+def fit_progresivo(etiquetas_modelo, X_train, y_train, X_val, y_val, capas, qubits, cost_function,
+                   params_flat=None, shape_flat=None, entrelazamiento='lineal', device="default.qubit",
+                   lectura=None, epochs_por_capa=100, congelar=False, escala=1e-2,
+                   crear_gradiente=None, **opciones_fit):
+    """
+    Entrena de 1 a ``capas`` capas, agregando una capa cuando ``fit`` termina la etapa.
+    params_flat / shape_flat : modelo inicial (con las capas que indique su forma); por
+                               defecto una capa con ``parametros``
+    congelar        : solo la capa recién agregada es entrenable en cada etapa
+    crear_gradiente : función capas -> proveedor de gradiente (p. ej. un GradienteSDK)
+    opciones_fit    : se pasan a ``fit`` (batch_size, stepsize, patience, min_delta, ...)
+    Devuelve (best_params, shape_flat, historias), una historia de ``fit`` por etapa.
+    """
+    muestras, _ = separar(X_train)
+    # ya codificadas (N, subcapas, 3) o características (N, d)
+    subcapas = muestras.shape[1] if np.ndim(muestras) == 3 else -(-np.shape(muestras)[1] // 3)
+    if params_flat is None:
+        params_flat, shape_flat = flatten_params(parametros(subcapas, 1, qubits=qubits))
+        params_flat = pnp.array(params_flat, requires_grad=True)
+    actuales = shape_flat[0][0] // (subcapas * qubits)
+
+    historias = []
+    while True:
+        modelo = circuito_parametrico(actuales, qubits, entrelazamiento, device)
+        entrenables = None
+        if congelar and historias:
+            entrenables = mascara_capas(shape_flat, actuales, [actuales - 1])
+        gradiente = crear_gradiente(actuales) if crear_gradiente is not None else None
+        try:
+            params_flat, historia = fit(modelo, etiquetas_modelo, X_train, y_train, X_val, y_val,
+                                        params_flat, shape_flat, cost_function, epochs=epochs_por_capa,
+                                        gradiente=gradiente, lectura=lectura, entrenables=entrenables,
+                                        **opciones_fit)
+        finally:
+            if gradiente is not None and hasattr(gradiente, "cerrar"):
+                gradiente.cerrar()
+        historia['capas'] = actuales
+        historias.append(historia)
+        if actuales >= capas:
+            return params_flat, shape_flat, historias
+        params_flat, shape_flat = agregar_capa(params_flat, shape_flat, actuales, escala)
+        actuales += 1
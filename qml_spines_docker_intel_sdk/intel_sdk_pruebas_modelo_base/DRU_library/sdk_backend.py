@@ -0,0 +1,668 @@
+"""
+Ejecución de circuitos del modelo DRU en los simuladores del Intel Quantum SDK.
+
+Genera un único ``quantum_kernel`` paramétrico en C++ (los ángulos se leen de un arreglo
+global ``dru_angles``), lo compila una vez y lo ejecuta fila a fila escribiendo los ángulos
+directamente en la memoria del ``.so`` cargado. Así no hace falta traducir QASM ni
+recompilar por cada punto.
+
+``intelqsdk.cbindings`` se importa solo al abrir una sesión; con la variable de entorno
+``DRU_CBINDINGS=DRU_library.cbindings_local`` se usa el sustituto local.
+"""
+
+import os
+import re
+import json
+import ctypes
+import hashlib
+import importlib
+import subprocess
+import time
+from collections import OrderedDict
+import numpy as np
+
+from .artefactos import directorio_compartido
+from .lectura import Lectura
+from .muestreo import conteos, histograma
+
+# -----------------------
+# Rutas del SDK
+# -----------------------
+SDK_BASE = os.environ.get(
+    "INTEL_QSDK_BASE",
+    "/opt/intel/quantum-sdk/docker-intel_quantum_sdk_1.1.1.2024-11-15T22_03_32+00_00",
+)
+COMPILADOR = os.path.join(SDK_BASE, "intel-quantum-compiler")
+CONFIG_QDSIM = os.path.join(SDK_BASE, "intel-quantum-sdk-QDSIM.json")
+
+# archivo de plataforma que recibe el compilador (-c) según el backend
+CONFIGURACIONES = {"QD_SIM": CONFIG_QDSIM, "IQS": None, "CLIFFORD": None}
+OPCIONES_COMPILADOR = ("-p", "trivial", "-S", "greedy")
+
+# opciones elegidas por ``autoajuste`` por firma de circuito; el directorio de kernels se borra
+# al salir, así que van a la caché del usuario (``DRU_AUTOAJUSTE`` fija otro archivo)
+AJUSTES = "autoajuste.json"
+
+KERNEL = "dru_kernel"
+KERNEL_REINICIO = "dru_reset"
+SIMBOLO = "dru_angles"
+REGISTRO = "q"
+
+# puerta de PennyLane -> intrínseco del SDK
+PUERTAS = {
+    "RX": "RX", "RY": "RY", "RZ": "RZ",
+    "Hadamard": "H", "PauliX": "X", "PauliY": "Y", "PauliZ": "Z",
+    "S": "S", "T": "T", "CNOT": "CNOT", "CZ": "CZ", "SWAP": "SWAP",
+}
+
+
+def cargar_cbindings(cbindings=None):
+    """Devuelve el módulo de bindings: el dado, el de ``DRU_CBINDINGS`` o ``intelqsdk.cbindings``."""
+    if cbindings is not None:
+        return cbindings
+    return importlib.import_module(os.environ.get("DRU_CBINDINGS", "intelqsdk.cbindings"))
+
+
+# -----------------------
+# Generación del kernel
+# -----------------------
+def operaciones_dru(capas, qubits, subcapas, entrelazamiento='lineal'):
+    """
+    Operaciones del ansatz de ``circuito_parametrico`` como (puerta, qubits, índice de ángulo).
+    El ángulo k corresponde a ``phi.reshape(-1)[k]``.
+    """
+    ops = []
+    k = 0
+    for _ in range(capas):
+        for _ in range(subcapas):
+            for q in range(qubits):
+                for puerta in ("RZ", "RY", "RZ"):
+                    ops.append((puerta, (q,), k))
+                    k += 1
+
+        if entrelazamiento == 'lineal':
+            ops += [("CNOT", (q, q + 1), None) for q in range(qubits - 1)]
+        elif entrelazamiento == 'full':
+            ops += [("CNOT", (i, j), None) for i in range(qubits) for j in range(i + 1, qubits)]
+        elif entrelazamiento == 'circular':
+            ops += [("CNOT", (q, q + 1), None) for q in range(qubits - 1)]
+            ops.append(("CNOT", (qubits - 1, 0), None))
+    return ops
+
+
+def operaciones_ghz(n_qubits):
+    """Operaciones del estado GHZ: H en el qubit 0 y CNOT en cadena."""
+    return [("H", (0,), None)] + [("CNOT", (q, q + 1), None) for q in range(n_qubits - 1)]
+
+
+def kernel_cpp(operaciones, n_qubits, n_params, kernel=KERNEL, simbolo=SIMBOLO):
+    """
+    Fuente C++ del kernel: reinicia los qubits con PrepZ y aplica las operaciones. El ángulo
+    de cada operación es un índice de ``simbolo`` o directamente una expresión C++ (str).
+    """
+    lineas = [
+        "#include <clang/Quantum/quintrinsics.h>",
+        "",
+        f"qbit {REGISTRO}[{n_qubits}];",
+        "",
+        "// ángulos escritos desde Python antes de cada llamada",
+        f'extern "C" {{',
+        f"double {simbolo}[{max(n_params, 1)}];",
+        "}",
+        "",
+        f"quantum_kernel void {kernel}()",
+        "{",
+    ]
+    lineas += [f"    PrepZ({REGISTRO}[{q}]);" for q in range(n_qubits)]
+    for puerta, qs, k in operaciones:
+        args = [f"{REGISTRO}[{q}]" for q in qs]
+        if isinstance(k, str):
+            args.append(k)
+        elif k is not None:
+            args.append(f"{simbolo}[{k}]")
+        lineas.append(f"    {puerta}({', '.join(args)});")
+    lineas.append("}")
+    return "\n".join(lineas) + "\n"
+
+
+def compilar_kernel(fuente, directorio, backend="QD_SIM", compilador=None, cbindings=None,
+                    opciones=None):
+    """
+    Escribe la fuente en ``directorio`` y la compila a ``.so``. El nombre del archivo es el hash
+    de la fuente, de modo que un kernel ya compilado se reutiliza sin invocar al compilador.
+    Sin ``opciones`` se usan las que ``autoajuste`` guardó para el circuito (o las por defecto).
+    """
+    if opciones is None:
+        opciones = opciones_kernel(fuente, backend)
+    cpp_path, so_path = rutas_kernel(fuente, directorio, backend, opciones)
+    if os.path.isfile(so_path):
+        return so_path
+
+    with open(cpp_path, "w", encoding="utf8") as f:
+        f.write(fuente)
+
+    cmd = comando_compilador(cpp_path, so_path, backend, compilador, cbindings, opciones)
+    subprocess.run(cmd, check=True, cwd=directorio)
+    return so_path
+
+
+def rutas_kernel(fuente, directorio, backend="QD_SIM", opciones=None):
+    """
+    Rutas (.cpp, .so) de una fuente: el nombre es el hash de la fuente y el backend (y de las
+    opciones del compilador, si no son las por defecto).
+    """
+    clave = backend + fuente
+    if opciones is not None and tuple(opciones) != OPCIONES_COMPILADOR:
+        clave += " ".join(opciones)
+    nombre = "dru_" + hashlib.sha1(clave.encode()).hexdigest()[:16]
+    return os.path.join(directorio, nombre + ".cpp"), os.path.join(directorio, nombre + ".so")
+
+
+# -----------------------
+# Opciones ajustadas por circuito
+# -----------------------
+_LITERAL = re.compile(r"\d+\.\d*(?:[eE][-+]?\d+)?|\d+[eE][-+]?\d+")
+_ajustes = {}        # ruta -> (mtime, {firma: ajuste})
+
+
+def firma_circuito(fuente, backend="QD_SIM"):
+    """
+    Firma de la estructura del circuito: hash de la fuente con los ángulos literales borrados,
+    así dos traducciones del mismo QASM con otros ángulos comparten las opciones ajustadas.
+    """
+    return hashlib.sha1((backend + _LITERAL.sub("#", fuente)).encode()).hexdigest()[:16]
+
+
+def ruta_ajustes():
+    """``DRU_AUTOAJUSTE`` o ``$XDG_CACHE_HOME/dru_library/autoajuste.json`` (por defecto ~/.cache)."""
+    if os.environ.get("DRU_AUTOAJUSTE"):
+        return os.environ["DRU_AUTOAJUSTE"]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "dru_library", AJUSTES)
+
+
+def leer_ajustes():
+    """{firma: ajuste} guardados (vacío si no hay archivo)."""
+    ruta = ruta_ajustes()
+    try:
+        mtime = os.stat(ruta).st_mtime_ns
+    except OSError:
+        return {}
+    if ruta not in _ajustes or _ajustes[ruta][0] != mtime:
+        with open(ruta, encoding="utf8") as f:
+            _ajustes[ruta] = (mtime, json.load(f))
+    return _ajustes[ruta][1]
+
+
+def guardar_ajuste(fuente, ajuste, backend="QD_SIM"):
+    """Guarda ``ajuste`` (un dict con "opciones") para la firma de ``fuente``."""
+    ruta = ruta_ajustes()
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    ajustes = dict(leer_ajustes())
+    ajustes[firma_circuito(fuente, backend)] = ajuste
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf8") as f:
+        json.dump(ajustes, f, indent=1)
+    os.replace(temporal, ruta)
+    _ajustes.pop(ruta, None)
+
+
+def opciones_kernel(fuente, backend="QD_SIM"):
+    """Opciones del compilador para ``fuente``: las ajustadas para su firma o las por defecto."""
+    ajuste = leer_ajustes().get(firma_circuito(fuente, backend))
+    return tuple(ajuste["opciones"]) if ajuste else OPCIONES_COMPILADOR
+
+
+def traductor(cbindings=None):
+    """``translate`` de openqasm_bridge (o el de los bindings locales, si lo traen)."""
+    cb = cargar_cbindings(cbindings)
+    if hasattr(cb, "translate"):
+        return cb.translate
+    return importlib.import_module("openqasm_bridge.v2").translate
+
+
+def comando_compilador(cpp_path, so_path, backend="QD_SIM", compilador=None, cbindings=None,
+                       opciones=OPCIONES_COMPILADOR):
+    """argv de intel-quantum-compiler (o del compilador local de los bindings elegidos)."""
+    if compilador is None:
+        compilador = getattr(cargar_cbindings(cbindings), "COMPILADOR", COMPILADOR)
+    cmd = [compilador] if isinstance(compilador, str) else list(compilador)
+    if CONFIGURACIONES.get(backend):
+        cmd += ["-c", CONFIGURACIONES[backend]]
+    return cmd + [*opciones, "-s", cpp_path, "-o", so_path]
+
+
+# -----------------------
+# Lectura de amplitudes
+# -----------------------
+def a_orden_pennylane(amps, n_qubits):
+    """
+    El SDK indexa los estados base con el qubit 0 como bit menos significativo; PennyLane
+    usa el wire 0 como el más significativo. Invierte el orden en el último eje.
+    """
+    amps = np.asarray(amps)
+    lote = amps.shape[:-1]
+    t = amps.reshape(lote + (2,) * n_qubits)
+    ejes = list(range(len(lote))) + list(range(t.ndim - 1, len(lote) - 1, -1))
+    return t.transpose(ejes).reshape(lote + (2 ** n_qubits,))
+
+
+def _valor(mapa, indice):
+    # los estados por debajo del umbral pueden no venir en el mapa
+    try:
+        return float(mapa[indice])
+    except KeyError:
+        return 0.0
+
+
+def _a_complejos(amps):
+    return np.fromiter((complex(a.real, a.imag) for a in amps), dtype=complex, count=len(amps))
+
+
+def _buffer_parametros(cb, so_path, simbolo, n):
+    """Vista NumPy del arreglo global de ángulos dentro del .so cargado."""
+    if hasattr(cb, "parameterBuffer"):
+        return cb.parameterBuffer(so_path, simbolo, n), None
+    # dlopen devuelve el mismo handle que abrió loadSdk, así que se escribe en su memoria
+    lib = ctypes.CDLL(os.path.abspath(so_path))
+    arreglo = (ctypes.c_double * max(n, 1)).in_dll(lib, simbolo)
+    return np.ctypeslib.as_array(arreglo)[:n], lib
+
+
+# el runtime ejecuta los kernels en el último simulador que pasó por ready()
+_listo_actual = None
+
+
+def _poner_listo(cb, dev, backend):
+    global _listo_actual
+    codigo = dev.ready()
+    if codigo != getattr(cb, "QRT_ERROR_SUCCESS", 0):
+        raise RuntimeError(f"El dispositivo {backend} no quedó listo (ready() = {codigo}).")
+    _listo_actual = dev
+
+
+def _configurar_dispositivo(cb, backend, n_qubits):
+    if backend == "QD_SIM":
+        cfg = cb.DeviceConfig("QD_SIM")
+        cfg.device_type = "QD_SIM"
+        cfg.num_qubits = n_qubits
+        cfg.synchronous = True
+    elif backend == "IQS":
+        cfg = cb.IqsConfig()
+        cfg.num_qubits = n_qubits
+        cfg.simulation_type = "noiseless"
+    else:
+        raise ValueError(f"Backend no soportado: {backend}")
+    return cfg
+
+
+# -----------------------
+# Sesión de ejecución
+# -----------------------
+class SesionSDK:
+    """
+    Un kernel compilado cargado en un FullStateSimulator listo. Cada llamada a ``ejecutar``
+    escribe una fila de ángulos, llama al kernel (que reinicia el estado con PrepZ) y
+    devuelve las amplitudes en el orden de PennyLane.
+
+    Con ``gestor`` (GestorSesiones) el simulador y la biblioteca cargada se toman del gestor y
+    siguen vivos al cerrar la sesión; sin él, la sesión crea y libera los suyos.
+    """
+
+    def __init__(self, so_path, n_qubits, n_params, backend="QD_SIM", kernel=KERNEL,
+                 simbolo=SIMBOLO, cbindings=None, gestor=None):
+        self.so_path = so_path
+        self.n_qubits = n_qubits
+        self.n_params = n_params
+        self.backend = backend
+        self.kernel = kernel
+        self.simbolo = simbolo
+        self.gestor = gestor
+        self.cb = gestor.cb if gestor is not None else cargar_cbindings(cbindings)
+        self.sdk_name = os.path.splitext(os.path.basename(so_path))[0]
+        self.dev = None
+        self.tiempos = {"preparacion": 0.0, "ejecucion": 0.0}
+
+    def abrir(self):
+        t0 = time.perf_counter()
+        cb = self.cb
+        if self.gestor is not None:
+            self.dev = self.gestor.dispositivo(self.backend, self.n_qubits)
+            self.sdk_name, _ = self.gestor.cargar(self.so_path)
+        else:
+            cb.loadSdk(self.so_path, self.sdk_name)
+            self.cfg = _configurar_dispositivo(cb, self.backend, self.n_qubits)
+            self.dev = cb.FullStateSimulator(self.cfg)
+            try:
+                _poner_listo(cb, self.dev, self.backend)
+            except RuntimeError:
+                self.cerrar()
+                raise
+        self._referencias()
+        self.tiempos["preparacion"] += time.perf_counter() - t0
+        return self
+
+    def _referencias(self):
+        cb = self.cb
+        self.qbits = cb.RefVec()
+        for i in range(self.n_qubits):
+            self.qbits.append(cb.QbitRef(REGISTRO, i, self.sdk_name).get_ref())
+        self.angulos, self._lib = _buffer_parametros(cb, self.so_path, self.simbolo, self.n_params)
+
+    def ejecutar(self, angulos):
+        """Ejecuta el kernel con una fila de ángulos y devuelve el vector de estado."""
+        return self.ejecutar_lote(np.asarray(angulos, dtype=float)[None, :])[0]
+
+    def ejecutar_lote(self, angulos, lectura=None):
+        """
+        angulos: (N, n_params). Ejecuta las N filas dentro de la misma sesión (el kernel
+        reinicia el estado con PrepZ en cada llamada) y devuelve un arreglo (N, 2**n_qubits).
+        Con ``lectura`` (ver lectura.Lectura) pide al simulador solo esas probabilidades y
+        devuelve (N, k).
+        """
+        self._preparar()
+        t0 = time.perf_counter()
+        angulos = np.atleast_2d(np.asarray(angulos, dtype=float))
+        if lectura is None:
+            leer = lambda: _a_complejos(self.dev.getAmplitudes(self.qbits))
+            salida = np.empty((len(angulos), 2 ** self.n_qubits), dtype=complex)
+        else:
+            leer, k = self._lector(lectura)
+            salida = np.empty((len(angulos), k))
+        for i, fila in enumerate(angulos):
+            self.angulos[:] = fila
+            self.cb.callCppFunction(self.kernel, self.sdk_name)
+            salida[i] = leer()
+        self._contar(time.perf_counter() - t0)
+        if lectura is None:
+            return a_orden_pennylane(salida, self.n_qubits)
+        if lectura.estados is None:
+            return a_orden_pennylane(salida, len(lectura.wires(self.n_qubits)))
+        return salida
+
+    def muestrear_lote(self, angulos, shots, lectura=None, metodo="multinomial", semilla=None):
+        """
+        Conteos (N, k) de ``shots`` medidas por fila de ángulos, sobre los estados de
+        ``lectura`` (por defecto los 2**n del registro, en el orden de PennyLane).
+
+        metodo="multinomial": lee las probabilidades y muestrea todo el lote con una sola
+        llamada multinomial. metodo="getSamples": pide las muestras al simulador (una
+        llamada por punto) y arma los histogramas con un único ``bincount``.
+        """
+        lectura = lectura or Lectura()
+        if metodo == "multinomial":
+            return conteos(self.ejecutar_lote(angulos, lectura=lectura), shots, semilla)
+        if metodo != "getSamples":
+            raise ValueError(f"Método de muestreo desconocido: {metodo}")
+
+        self._preparar()
+        t0 = time.perf_counter()
+        angulos = np.atleast_2d(np.asarray(angulos, dtype=float))
+        refs = self._refs(lectura)
+        bits = np.empty((len(angulos), int(shots), len(refs)), dtype=bool)
+        for i, fila in enumerate(angulos):
+            self.angulos[:] = fila
+            self.cb.callCppFunction(self.kernel, self.sdk_name)
+            bits[i] = np.asarray(self.dev.getSamples(int(shots), refs), dtype=bool)
+        self._contar(time.perf_counter() - t0)
+        # bit j de cada muestra <-> refs[j], el primero es el más significativo como en PennyLane
+        hist = histograma(bits)
+        return hist if lectura.estados is None else hist[:, lectura.estados]
+
+    def _preparar(self):
+        if self.gestor is not None:
+            # el gestor pudo descargar la biblioteca (LRU) o activar otro simulador
+            t0 = time.perf_counter()
+            self.dev = self.gestor.dispositivo(self.backend, self.n_qubits)
+            self.sdk_name, recargada = self.gestor.cargar(self.so_path)
+            if recargada:
+                self._referencias()
+            self.tiempos["preparacion"] += time.perf_counter() - t0
+        elif _listo_actual is not self.dev:
+            _poner_listo(self.cb, self.dev, self.backend)
+
+    def _contar(self, dt):
+        self.tiempos["ejecucion"] += dt
+        if self.gestor is not None:
+            self.gestor.tiempos["ejecucion"] += dt
+
+    def _refs(self, lectura):
+        refs = self.cb.RefVec()
+        for q in lectura.wires(self.n_qubits):
+            refs.append(self.qbits[q])
+        return refs
+
+    def _lector(self, lectura):
+        """Función que lee del simulador solo lo que pide ``lectura`` y su tamaño."""
+        cb = self.cb
+        refs = self._refs(lectura)
+        m = len(refs)
+        if lectura.estados is None:
+            return (lambda: np.fromiter(self.dev.getProbabilities(refs), dtype=float, count=2 ** m)), 2 ** m
+
+        # QssIndex: el carácter j corresponde a refs[j], igual que el bit j (MSB primero) del índice
+        indices = [cb.QssIndex(format(int(e), f"0{m}b")) for e in lectura.estados]
+        vec = cb.QssIndexVec()
+        for idx in indices:
+            vec.append(idx)
+
+        def leer():
+            mapa = self.dev.getProbabilities(refs, vec, 0.0)
+            return [_valor(mapa, idx) for idx in indices]
+        return leer, len(indices)
+
+    def cerrar(self):
+        if self.gestor is not None:
+            self.dev = None
+            self._lib = None
+            return
+        if self.dev is not None:
+            self.dev.wait()
+        try:
+            self.cb.unloadSdk(self.sdk_name)
+        except Exception:
+            pass
+        self.dev = None
+        self._lib = None
+
+    def __enter__(self):
+        return self.abrir()
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# -----------------------
+# Gestor de simuladores y bibliotecas
+# -----------------------
+class GestorSesiones:
+    """
+    Mantiene un FullStateSimulator por (backend, num_qubits, simulation_type) y las bibliotecas
+    cargadas con ``loadSdk`` en una caché LRU; al expulsar una biblioteca se llama ``unloadSdk``.
+    Entre kernels el estado se reinicia explícitamente con un kernel de PrepZ.
+
+    ``tiempos`` separa la puesta en marcha (config + FullStateSimulator + ready + loadSdk)
+    de la ejecución (callCppFunction + lectura).
+    """
+
+    def __init__(self, max_kernels=8, max_dispositivos=4, directorio=None, cbindings=None):
+        self.cb = cargar_cbindings(cbindings)
+        self.max_kernels = max_kernels
+        self.max_dispositivos = max_dispositivos
+        self.directorio = directorio or directorio_kernels()
+        self._dispositivos = OrderedDict()   # clave -> (cfg, dev)
+        self._bibliotecas = OrderedDict()    # ruta .so -> sdk_name
+        self.tiempos = {"preparacion": 0.0, "ejecucion": 0.0}
+        self.conteos = {"dispositivos": 0, "cargas": 0, "descargas": 0}
+
+    # ---- simuladores ----
+    def dispositivo(self, backend="QD_SIM", n_qubits=1, simulation_type="noiseless"):
+        """Simulador listo para la clave dada; se crea solo la primera vez."""
+        clave = (backend, n_qubits, simulation_type)
+        if clave in self._dispositivos:
+            self._dispositivos.move_to_end(clave)
+            cfg, dev = self._dispositivos[clave]
+            if _listo_actual is not dev:
+                t0 = time.perf_counter()
+                _poner_listo(self.cb, dev, backend)
+                self.tiempos["preparacion"] += time.perf_counter() - t0
+            return dev
+
+        t0 = time.perf_counter()
+        cfg = _configurar_dispositivo(self.cb, backend, n_qubits)
+        if backend == "IQS":
+            cfg.simulation_type = simulation_type
+        dev = self.cb.FullStateSimulator(cfg)
+        _poner_listo(self.cb, dev, backend)
+        self._dispositivos[clave] = (cfg, dev)
+        self.conteos["dispositivos"] += 1
+        while len(self._dispositivos) > self.max_dispositivos:
+            _, (_, viejo) = self._dispositivos.popitem(last=False)
+            viejo.wait()
+        self.tiempos["preparacion"] += time.perf_counter() - t0
+        return dev
+
+    # ---- bibliotecas ----
+    def cargar(self, so_path):
+        """Carga el .so si hace falta. Devuelve (sdk_name, True si se acaba de cargar)."""
+        if so_path in self._bibliotecas:
+            self._bibliotecas.move_to_end(so_path)
+            return self._bibliotecas[so_path], False
+
+        t0 = time.perf_counter()
+        sdk_name = os.path.splitext(os.path.basename(so_path))[0]
+        self.cb.loadSdk(so_path, sdk_name)
+        self._bibliotecas[so_path] = sdk_name
+        self.conteos["cargas"] += 1
+        while len(self._bibliotecas) > self.max_kernels:
+            _, viejo = self._bibliotecas.popitem(last=False)
+            self._descargar(viejo)
+        self.tiempos["preparacion"] += time.perf_counter() - t0
+        return sdk_name, True
+
+    def _descargar(self, sdk_name):
+        try:
+            self.cb.unloadSdk(sdk_name)
+        except Exception:
+            pass
+        self.conteos["descargas"] += 1
+
+    # ---- ejecución ----
+    def reiniciar(self, backend="QD_SIM", n_qubits=1):
+        """Lleva los n_qubits del simulador a |0...0> con un kernel de PrepZ."""
+        fuente = kernel_cpp([], n_qubits, 0, kernel=KERNEL_REINICIO)
+        so_path = compilar_kernel(fuente, self.directorio, backend=backend, cbindings=self.cb)
+        self.dispositivo(backend, n_qubits)
+        sdk_name, _ = self.cargar(so_path)
+        self.cb.callCppFunction(KERNEL_REINICIO, sdk_name)
+
+    def ejecutar_kernel(self, so_path, kernel, n_qubits, backend="QD_SIM", registro=REGISTRO,
+                        reiniciar=True):
+        """
+        Ejecuta un kernel sin parámetros (p. ej. traducido con openqasm_bridge) sobre el
+        simulador compartido y devuelve sus amplitudes en el orden de PennyLane.
+        """
+        if reiniciar:
+            self.reiniciar(backend, n_qubits)
+        dev = self.dispositivo(backend, n_qubits)
+        sdk_name, _ = self.cargar(so_path)
+
+        t0 = time.perf_counter()
+        self.cb.callCppFunction(kernel, sdk_name)
+        qbits = self.cb.RefVec()
+        for i in range(n_qubits):
+            qbits.append(self.cb.QbitRef(registro, i, sdk_name).get_ref())
+        amps = _a_complejos(dev.getAmplitudes(qbits))
+        self.tiempos["ejecucion"] += time.perf_counter() - t0
+        return a_orden_pennylane(amps, n_qubits)
+
+    def reporte(self):
+        """Tiempos acumulados y conteos de creación/carga/descarga."""
+        return {**self.tiempos, **self.conteos}
+
+    def cerrar(self):
+        for sdk_name in self._bibliotecas.values():
+            self._descargar(sdk_name)
+        self._bibliotecas.clear()
+        for _, dev in self._dispositivos.values():
+            dev.wait()
+        self._dispositivos.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# -----------------------
+# Lotes de puntos del modelo DRU
+# -----------------------
+def angulos_lote(X, theta, w, target_dim=3):
+    """
+    Equivalente vectorizado de ``phi_s(re_dim(x)[0], theta, w).reshape(-1)`` para todas las
+    filas de X. Devuelve (N, n_params) y el número de subcapas. X (N, subcapas, target_dim)
+    se toma como ya codificado (ver datos.ConjuntoDatos).
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    theta, w = np.asarray(theta, dtype=float), np.asarray(w, dtype=float)
+    if X.ndim == 3:
+        arr, subcapas = X, X.shape[1]
+    else:
+        subcapas = -(-X.shape[1] // target_dim)
+        arr = np.zeros((len(X), subcapas * target_dim))
+        arr[:, :X.shape[1]] = X
+        arr = arr.reshape(len(X), subcapas, target_dim)
+    # cada subvector v alimenta vectores // subcapas filas consecutivas de theta/w
+    phi = np.repeat(arr, len(w) // subcapas, axis=1) * w + theta
+    return phi.reshape(len(X), -1), subcapas
+
+
+def amplitudes_sdk(X, theta, w, capas, qubits, entrelazamiento='lineal', backend="QD_SIM",
+                   directorio=None, cbindings=None, gestor=None):
+    """
+    Estados del modelo ``circuito_parametrico`` para todas las filas de X en el Intel SDK:
+    un kernel compilado, un ``loadSdk`` y un simulador para todo el conjunto. Con ``gestor``
+    el simulador y el kernel cargado se reutilizan entre llamadas.
+    Devuelve un arreglo (N, 2**qubits) en el orden de PennyLane.
+    """
+    angulos, subcapas = angulos_lote(X, theta, w)
+    ops = operaciones_dru(capas, qubits, subcapas, entrelazamiento)
+    fuente = kernel_cpp(ops, qubits, angulos.shape[1])
+    if gestor is not None:
+        directorio, cbindings = directorio or gestor.directorio, gestor.cb
+    so_path = compilar_kernel(fuente, directorio or directorio_kernels(), backend=backend,
+                              cbindings=cbindings)
+    with SesionSDK(so_path, qubits, angulos.shape[1], backend=backend, cbindings=cbindings,
+                   gestor=gestor) as sesion:
+        return sesion.ejecutar_lote(angulos)
+
+
+def probabilidades_sdk(X, theta, w, capas, qubits, lectura, entrelazamiento='lineal',
+                       backend="QD_SIM", directorio=None, cbindings=None, gestor=None,
+                       shots=None, metodo="multinomial", semilla=None):
+    """
+    Como ``amplitudes_sdk`` pero leyendo solo ``lectura``: devuelve (N, k) probabilidades.
+    Con ``shots`` devuelve las frecuencias de ``shots`` medidas por punto (ver
+    ``SesionSDK.muestrear_lote``).
+    """
+    angulos, subcapas = angulos_lote(X, theta, w)
+    ops = operaciones_dru(capas, qubits, subcapas, entrelazamiento)
+    fuente = kernel_cpp(ops, qubits, angulos.shape[1])
+    if gestor is not None:
+        directorio, cbindings = directorio or gestor.directorio, gestor.cb
+    so_path = compilar_kernel(fuente, directorio or directorio_kernels(), backend=backend,
+                              cbindings=cbindings)
+    with SesionSDK(so_path, qubits, angulos.shape[1], backend=backend, cbindings=cbindings,
+                   gestor=gestor) as sesion:
+        if shots is None:
+            return sesion.ejecutar_lote(angulos, lectura=lectura)
+        return sesion.muestrear_lote(angulos, shots, lectura, metodo, semilla) / float(shots)
+
+
+def directorio_kernels():
+    """
+    Directorio para fuentes y bibliotecas compiladas: uno por proceso, en RAM si se puede
+    (ver artefactos.py). Como los nombres son hashes, los kernels se reutilizan entre llamadas.
+    """
+    return directorio_compartido()
@@ -3,6 +3,11 @@ from tqdm import trange
 import matplotlib.pyplot as plt
 from sklearn.metrics import confusion_matrix, classification_report, roc_auc_score, roc_curve
 from .base_functions import reshape_params
+from .etiquetas import Etiquetas
+from .cost_functions import fidelity_cost, fidelity_cost_indice
+from .muestreo import estimar_probabilidades
+from .vector_estado import estados_dru, buffer_estado
+from .datos import lotes, separar
 from pennylane import numpy as np
 
 
@@ -10,16 +15,36 @@ from pennylane import numpy as np
 # -----------------------
 # Costo por batch
 # -----------------------
-def costo_batches(params_flat, shape, x_batch, y_batch, modelo, etiquetas, cost_fn):
+# costos que con etiquetas.Etiquetas se calculan a partir del índice de clase (sin matrices)
+COSTOS_INDICE = {fidelity_cost: fidelity_cost_indice}
+
+
+def costo_batches(params_flat, shape, x_batch, y_batch, modelo, etiquetas, cost_fn, lectura=None):
+    """
+    Costo medio del batch. Con ``lectura`` (Lectura con los qubits de etiqueta) el estado se
+    reduce a esos qubits por traza parcial y se compara con etiquetas de ese tamaño.
+    """
     # reconstruir en el orden theta, w
     theta, w = reshape_params(params_flat, shape)
     loss_par = []
+    nativo = COSTOS_INDICE.get(cost_fn) if isinstance(etiquetas, Etiquetas) else None
 
     for x, y in zip(x_batch, y_batch):
         # modelo debe recibir (x, theta, w)
         pred_state = modelo(x, theta, w)   # devuelve statevector
-        etiqueta_dm = etiquetas[y]
-        den_pred = np.outer(pred_state, np.conj(pred_state))
+        if not np.iscomplexobj(pred_state):
+            # con probabilidades no hay fidelidad que calcular (ni traza parcial que hacer)
+            raise ValueError("costo_batches necesita que el modelo devuelva el vector de estado; "
+                             "este devuelve probabilidades (lectura en el QNode o circuito_mps).")
+        if nativo is not None:
+            probs = np.abs(pred_state) ** 2 if lectura is None else lectura.marginal(pred_state)
+            loss_par.append(nativo(probs, etiquetas.indice(y)))
+            continue
+        etiqueta_dm = etiquetas[y]         # Etiquetas: matriz nueva, solo para este costo
+        if lectura is None:
+            den_pred = np.outer(pred_state, np.conj(pred_state))
+        else:
+            den_pred = lectura.reducida(pred_state)
         loss_par.append(cost_fn(den_pred, etiqueta_dm))
 
     return np.mean(np.array(loss_par))
@@ -28,12 +53,31 @@ def costo_batches(params_flat, shape, x_batch, y_batch, modelo, etiquetas, cost_
 # -----------------------
 # Función de costo anidada
 # -----------------------
-def make_cost_fn(x_batch, y_batch, modelo, etiquetas, shape_flat, cost_fn):
+def make_cost_fn(x_batch, y_batch, modelo, etiquetas, shape_flat, cost_fn, lectura=None):
     def cost_fn_inner(params_flat):
-        return costo_batches(params_flat, shape_flat, x_batch, y_batch, modelo, etiquetas, cost_fn)
+        return costo_batches(params_flat, shape_flat, x_batch, y_batch, modelo, etiquetas, cost_fn,
+                             lectura)
     return cost_fn_inner
 
 
+def gradiente_entrenables(costo, entrenables):
+    """
+    grad_fn que deriva ``costo`` solo respecto de los parámetros en True de ``entrenables``:
+    los fijos entran como constantes y su componente del gradiente es exactamente cero.
+    """
+    indices = np.flatnonzero(entrenables)
+
+    def grad_fn(params_flat):
+        fijos = np.where(entrenables, 0.0, params_flat)
+        fijos.requires_grad = False
+        parcial = lambda libres: costo(qml.math.scatter_element_add(fijos, (indices,), libres))
+        libres = np.array(params_flat[indices], requires_grad=True)
+        grad = np.zeros(len(params_flat), requires_grad=False)
+        grad[indices] = qml.grad(parcial)(libres)
+        return grad
+    return grad_fn
+
+
 # -----------------------
 # Dibujo del circuito
 # -----------------------
@@ -52,20 +96,17 @@ def dibujar_modelo_completo(modelo, x, theta, w):
 # -----------------------
 # Exactitud
 # -----------------------
-def accuracy(X, y, modelo, params_flat, shape_flat):
+def accuracy(X, y, modelo, params_flat, shape_flat, lectura=None, shots=None, semilla=None):
     """
     Calcula la accuracy del modelo entrenado.
+    lectura: Lectura opcional; la clase es el estado etiqueta más probable.
+    shots  : si se da, la clase sale de ``shots`` medidas simuladas por muestra.
+    X puede ser un ``ConjuntoDatos`` (con y=None se usan sus clases).
     """
+    X, y = separar(X, y)
     theta, w = reshape_params(params_flat, shape_flat)
-
-    correctos = 0
-    for xi, yi in zip(X, y):
-        state = modelo(xi, theta, w)
-        probs = np.abs(state) ** 2
-        y_pred = np.argmax(probs)
-        if y_pred == yi:
-            correctos += 1
-    return correctos / len(y)
+    probs = _probabilidades_lote(X, modelo, theta, w, lectura, shots, semilla)
+    return float(np.mean(np.argmax(probs, axis=1) == np.asarray(y)))
 
 
 # -----------------------
@@ -73,10 +114,34 @@ def accuracy(X, y, modelo, params_flat, shape_flat):
 # -----------------------
 def fit(modelo, etiquetas_modelo, X_train, y_train, X_val, y_val, params_flat, shape_flat,
         cost_function, epochs=500, batch_size=10, stepsize=0.05, patience=100, min_delta=1e-4,
-        acc_stop=0.98):
+        acc_stop=0.98, gradiente=None, lectura=None, entrenables=None, registro=None,
+        historia_params=True):
     """
     Entrena el modelo cuántico y devuelve métricas, historial y mejores parámetros.
+    gradiente: proveedor opcional de costo y gradiente por batch (p. ej. GradienteSDK, que
+               evalúa la regla de desplazamiento en el Intel SDK); también calcula la accuracy.
+               La pérdida de cada batch es entonces la previa al paso. Su costo debe
+               corresponder a ``cost_function`` (si no, ValueError).
+    X_train / X_val pueden ser ``ConjuntoDatos`` ya codificados (con y_train / y_val = None).
+    lectura  : Lectura con los qubits de etiqueta, si el modelo tiene más qubits que la etiqueta;
+               la usan el costo (traza parcial) y la accuracy.
+    entrenables: máscara booleana sobre ``params_flat``; los parámetros en False quedan fijos:
+               solo se deriva respecto de los entrenables (gradiente_entrenables) y
+               GradienteSDK ni siquiera desplaza los ángulos fijos.
+    registro : RegistroMetricas donde se escriben la pérdida de cada batch (nivel "batch") y
+               las métricas de cada época (nivel "epoca"); se vacía al terminar.
+    historia_params: guardar los parámetros de cada época en ``historia['params']``.
     """
+    if gradiente is None:
+        exactitud = lambda X, y, p: accuracy(X, y, modelo, p, shape_flat, lectura=lectura)
+    else:
+        if hasattr(gradiente, "comprobar_costo"):
+            gradiente.comprobar_costo(cost_function)
+        exactitud = lambda X, y, p: gradiente.accuracy(X, y, p, shape_flat)
+    opciones_gradiente = {}
+    if entrenables is not None:
+        entrenables = np.array(entrenables, dtype=bool, requires_grad=False)
+        opciones_gradiente["entrenables"] = entrenables
     opt = qml.AdamOptimizer(stepsize=stepsize)
     best_loss = float("inf")
     best_acc_val = 0.0
@@ -88,29 +153,40 @@ def fit(modelo, etiquetas_modelo, X_train, y_train, X_val, y_val, params_flat, s
     pbar = trange(epochs, desc="Entrenando", unit="epoch")
 
     for epoca in pbar:
-        batch_loss_mean = []
-        perm = np.random.permutation(len(X_train))
-        X_train_sh, y_train_sh = X_train[perm], y_train[perm]
-
-        for start in range(0, len(X_train_sh), batch_size):
-            x_batch = X_train_sh[start:start + batch_size]
-            y_batch = y_train_sh[start:start + batch_size]
+        suma_loss, n_batches = 0.0, 0
 
-            costo = make_cost_fn(x_batch, y_batch, modelo, etiquetas_modelo, shape_flat, cost_fn=cost_function)
-            params_flat = opt.step(costo, params_flat)
-            loss = float(costo(params_flat))
-            batch_loss_mean.append(loss)
+        for x_batch, y_batch in lotes(X_train, y_train, batch_size):
+            costo = make_cost_fn(x_batch, y_batch, modelo, etiquetas_modelo, shape_flat, cost_fn=cost_function,
+                                 lectura=lectura)
+            if gradiente is None:
+                if entrenables is None:
+                    params_flat = opt.step(costo, params_flat)
+                else:
+                    # con gradiente cero Adam deja el parámetro exactamente igual
+                    params_flat = opt.step(costo, params_flat,
+                                           grad_fn=gradiente_entrenables(costo, entrenables))
+                loss = float(costo(params_flat))
+            else:
+                loss, grad = gradiente(params_flat, shape_flat, x_batch, y_batch, **opciones_gradiente)
+                params_flat = opt.step(costo, params_flat, grad_fn=lambda _: grad)
+            suma_loss += loss
+            n_batches += 1
+            if registro is not None:
+                registro.batch(epoca=epoca, loss=loss)
 
         # ---- métricas ----
-        epoch_loss = np.mean(batch_loss_mean)
-        acc_train = accuracy(X_train, y_train, modelo, params_flat, shape_flat)
-        acc_val   = accuracy(X_val,   y_val,   modelo, params_flat, shape_flat)
+        epoch_loss = suma_loss / n_batches
+        acc_train = exactitud(X_train, y_train, params_flat)
+        acc_val   = exactitud(X_val,   y_val,   params_flat)
 
         historia['epoch'].append(epoca)
         historia['loss'].append(epoch_loss)
         historia['acc_train'].append(acc_train)
         historia['acc_val'].append(acc_val)
-        historia['params'].append(params_flat.copy())
+        if historia_params:
+            historia['params'].append(params_flat.copy())
+        if registro is not None:
+            registro.epoca(epoca=epoca, loss=epoch_loss, acc_train=acc_train, acc_val=acc_val)
 
         # ---- early stopping ----
         if epoch_loss < best_loss - min_delta:
@@ -138,29 +214,65 @@ def fit(modelo, etiquetas_modelo, X_train, y_train, X_val, y_val, params_flat, s
             "wait": patience - wait
         })
 
+    if registro is not None:
+        registro.vaciar()
     return best_params, historia
 
 
 # -----------------------
 # Predicciones
 # -----------------------
-def predict(X, modelo, params_flat, shape_flat):
+# muestras por bloque de estados_dru en accuracy / predict
+LOTE_ESTADOS = 256
+
+
+def _probabilidades(salida, lectura):
+    """
+    Probabilidades de la salida del modelo: todo el registro o solo lo que pide ``lectura``.
+    Si la salida ya es real (QNode con ``lectura`` o ``circuito_mps``) no se eleva al cuadrado.
+    """
+    if lectura is None:
+        return np.abs(salida) ** 2 if np.iscomplexobj(salida) else salida
+    return lectura.probabilidades(salida)
+
+
+def _probabilidades_lote(X, modelo, theta, w, lectura, shots=None, semilla=None):
+    """
+    (N, k) probabilidades exactas o, con ``shots``, frecuencias muestreadas en un solo lote.
+    Si el QNode trae su ``arquitectura`` (circuito_parametrico en un dispositivo ideal), todo
+    X se simula de una vez con ``estados_dru``, con un BufferEstado que queda en la
+    arquitectura del modelo y se reutiliza en las llamadas siguientes; si no, muestra por muestra.
+    """
+    arquitectura = getattr(modelo, "arquitectura", None)
+    if arquitectura is not None:
+        precision = arquitectura.get("precision", "double")
+        buffer = buffer_estado(arquitectura.get("buffer"), arquitectura["qubits"],
+                               min(LOTE_ESTADOS, max(len(X), 1)), precision)
+        arquitectura["buffer"] = buffer
+        estados = estados_dru(X, theta, w, arquitectura["capas"], arquitectura["qubits"],
+                              arquitectura["entrelazamiento"], LOTE_ESTADOS, precision, buffer)
+        lect = lectura if lectura is not None else arquitectura["lectura"]
+        probs = np.abs(estados) ** 2 if lect is None else lect.de_estados(estados)
+    else:
+        probs = np.array([_probabilidades(modelo(x, theta, w), lectura) for x in X])
+    if shots is None:
+        return probs
+    return estimar_probabilidades(probs, shots, semilla)
+
+
+def predict(X, modelo, params_flat, shape_flat, lectura=None, shots=None, semilla=None):
     """Devuelve la etiqueta predicha (índice de clase) para cada muestra."""
+    X, _ = separar(X)
     theta, w = reshape_params(params_flat, shape_flat)
-    y_pred = []
-    for x in X:
-        state = modelo(x, theta, w)
-        probs = np.abs(state) ** 2
-        y_pred.append(np.argmax(probs))
-    return np.array(y_pred)
+    return np.argmax(_probabilidades_lote(X, modelo, theta, w, lectura, shots, semilla), axis=1)
 
 
-def predict_proba(X, modelo, params_flat, shape_flat):
-    """Devuelve el vector de probabilidades para cada muestra."""
+def predict_proba(X, modelo, params_flat, shape_flat, lectura=None, shots=None, semilla=None):
+    """
+    Devuelve el vector de probabilidades para cada muestra
+    (con ``lectura``, solo las de sus estados, sin renormalizar;
+    con ``shots``, las frecuencias observadas en ``shots`` medidas).
+    """
+    X, _ = separar(X)
     theta, w = reshape_params(params_flat, shape_flat)
-    probs_all = []
-    for x in X:
-        state = modelo(x, theta, w)
-        probs = np.abs(state) ** 2
-        probs_all.append(probs)
-    return np.array(probs_all)
+    return _probabilidades_lote(X, modelo, theta, w, lectura, shots, semilla)
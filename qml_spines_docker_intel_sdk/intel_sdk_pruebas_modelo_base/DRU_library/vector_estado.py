@@ -0,0 +1,133 @@
+"""
+Simulación de vector de estado del modelo DRU en NumPy, en lote sobre muestras.
+
+El estado de N muestras se guarda como un arreglo (N, 2, ..., 2) (un eje por qubit, el wire 0
+primero, como en PennyLane) y cada puerta se aplica a todo el lote con una sola operación
+matricial, sin QNode ni bucle por muestra:
+
+    estados = estados_dru(X, theta, w, capas, qubits)      # (N, 2**qubits)
+
+Coincide con ``circuito_parametrico(...)(x, theta, w)`` fila a fila. Es NumPy puro (sin
+autograd): sirve para evaluar e inferir, no para ``qml.grad``.
+
+``precision="single"`` simula en complex64 (la mitad de ancho de banda de memoria, que es lo
+que limita las actualizaciones del estado desde ~12 qubits). Solo afecta a esta simulación
+(inferencia: accuracy / predict); el QNode con el que se entrena sigue en complex128.
+
+El estado vive en dos buffers de ``lote`` filas (``BufferEstado``): cada puerta escribe con
+``out=`` en el otro buffer o intercambia cuartos del estado en sitio, sin reservar memoria
+dentro del bucle de puertas. Con ``buffer=`` los mismos buffers sirven entre llamadas
+(training._probabilidades_lote guarda uno en el modelo).
+"""
+
+import numpy as np
+
+from .sdk_backend import angulos_lote, operaciones_dru
+from .mps import _rotaciones
+
+
+PRECISIONES = {"double": np.complex128, "single": np.complex64}
+
+
+def tipo_complejo(precision):
+    if precision not in PRECISIONES:
+        raise ValueError(f"Precisión desconocida: {precision} (use 'double' o 'single').")
+    return PRECISIONES[precision]
+
+
+class BufferEstado:
+    """Estados de hasta ``lote`` muestras de ``n_qubits`` en buffers reutilizables."""
+
+    def __init__(self, n_qubits, lote, precision="double"):
+        self.n_qubits = n_qubits
+        self.lote = lote
+        self.dtype = tipo_complejo(precision)
+        dim = 2 ** n_qubits
+        self._a = np.empty(lote * dim, dtype=self.dtype)
+        self._b = np.empty(lote * dim, dtype=self.dtype)
+        self._mitad = np.empty(lote * max(dim // 2, 1), dtype=self.dtype)
+        self.N = 0
+
+    def admite(self, n_qubits, lote, precision="double"):
+        """True si sirve para ``lote`` muestras de ``n_qubits`` en esa precisión."""
+        return (self.n_qubits == n_qubits and self.lote >= lote
+                and self.dtype == tipo_complejo(precision))
+
+    def _vista(self, buf, *forma):
+        return buf[:self.N * 2 ** self.n_qubits].reshape(self.N, *forma)
+
+    @property
+    def estado(self):
+        """(N, 2**n) vista del estado actual (se sobrescribe en el próximo ``reiniciar``)."""
+        return self._vista(self._a, -1)
+
+    def reiniciar(self, N):
+        """N estados |0...0>."""
+        self.N = N
+        psi = self.estado
+        psi[:] = 0
+        psi[:, 0] = 1
+
+    def aplicar_1q(self, q, U):
+        """U: (N, 2, 2) en el dtype del buffer."""
+        n = self.n_qubits
+        forma = (2 ** q, 2, 2 ** (n - q - 1))
+        psi, out = self._vista(self._a, *forma), self._vista(self._b, *forma)
+        if forma[2] >= 64:
+            # bloques contiguos largos: un matmul en lote es lo más rápido
+            np.matmul(U[:, None], psi, out=out)
+        else:
+            # qubits bajos: combinación elemento a elemento de las dos mitades
+            u = U[:, :, :, None, None]
+            tmp = self._mitad[:self.N * forma[0] * forma[2]].reshape(self.N, forma[0], forma[2])
+            for i in range(2):
+                np.multiply(u[:, i, 0], psi[:, :, 0], out=out[:, :, i])
+                np.multiply(u[:, i, 1], psi[:, :, 1], out=tmp)
+                np.add(out[:, :, i], tmp, out=out[:, :, i])
+        self._a, self._b = self._b, self._a
+
+    def aplicar_cnot(self, c, t):
+        """Intercambia en sitio los cuartos (c=1, t=0) y (c=1, t=1)."""
+        psi = self._vista(self._a, *(2,) * self.n_qubits)
+        uno_cero = [slice(None)] * psi.ndim
+        uno_cero[c + 1], uno_cero[t + 1] = 1, 0
+        uno_uno = list(uno_cero)
+        uno_uno[t + 1] = 1
+        a, b = psi[tuple(uno_cero)], psi[tuple(uno_uno)]
+        tmp = self._mitad[:a.size].reshape(a.shape)
+        np.copyto(tmp, a)
+        np.copyto(a, b)
+        np.copyto(b, tmp)
+
+
+def buffer_estado(buffer, n_qubits, lote, precision="double"):
+    """``buffer`` si admite ``lote`` muestras de ``n_qubits``; si no, un BufferEstado nuevo."""
+    if buffer is not None and buffer.admite(n_qubits, lote, precision):
+        return buffer
+    return BufferEstado(n_qubits, lote, precision)
+
+
+def estados_dru(X, theta, w, capas, qubits, entrelazamiento='lineal', lote=256, precision="double",
+                buffer=None):
+    """
+    (N, 2**qubits) estados del modelo DRU para las filas de X, en bloques de ``lote``.
+    buffer: BufferEstado a reutilizar (si no admite el bloque, se reserva uno nuevo).
+    """
+    angulos, subcapas = angulos_lote(X, theta, w)
+    ops = operaciones_dru(capas, qubits, subcapas, entrelazamiento)
+    buffer = buffer_estado(buffer, qubits, min(lote, max(len(angulos), 1)), precision)
+    salida = np.empty((len(angulos), 2 ** qubits), dtype=buffer.dtype)
+
+    for i in range(0, len(angulos), lote):
+        bloque = angulos[i:i + lote]
+        N = len(bloque)
+        buffer.reiniciar(N)
+        # RZ RY RZ consecutivos sobre un qubit se aplican como una sola matriz
+        U = _rotaciones(bloque.reshape(N, -1, 3)).astype(buffer.dtype)
+        for puerta, qs, k in ops:
+            if puerta == "CNOT":
+                buffer.aplicar_cnot(*qs)
+            elif k % 3 == 0:
+                buffer.aplicar_1q(qs[0], U[:, k // 3])
+        salida[i:i + N] = buffer.estado
+    return salida
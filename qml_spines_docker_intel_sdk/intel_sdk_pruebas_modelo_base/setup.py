@@ -13,6 +13,12 @@ setup(
         "tqdm",
         "scikit-learn"
     ],
+    entry_points={
+        "pennylane.plugins": [
+            "intel.qd_sim = DRU_library.intel_device:IntelSDKDevice",
+            "intel.iqs = DRU_library.intel_device:IntelSDKDevice",
+        ]
+    },
     python_requires=">=3.9",
     license="MIT"
 )
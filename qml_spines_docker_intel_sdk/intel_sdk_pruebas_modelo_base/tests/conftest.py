@@ -0,0 +1,40 @@
+"""
+Las pruebas corren sobre ``cbindings_local`` (los bindings del Intel Quantum SDK simulados en
+NumPy), así que no hace falta el SDK instalado. Con ``DRU_CBINDINGS`` definido se usan esos.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DRU_CBINDINGS", "DRU_library.cbindings_local")
+
+import numpy as np
+import pytest
+
+from DRU_library import sdk_backend
+
+
+def comparar_estados(obtenidos, esperados, atol=1e-10):
+    """
+    Estados (N, 2**n) iguales salvo fase global: |<a|b>| = 1 y mismas probabilidades. El
+    FullStateSimulator no fija la fase global (PrepZ conserva la que dejó el kernel anterior).
+    """
+    obtenidos, esperados = np.atleast_2d(obtenidos), np.atleast_2d(esperados)
+    solapamiento = np.abs(np.sum(np.conj(obtenidos) * esperados, axis=1))
+    np.testing.assert_allclose(solapamiento, 1, atol=atol)
+    np.testing.assert_allclose(np.abs(obtenidos) ** 2, np.abs(esperados) ** 2, atol=atol)
+
+
+@pytest.fixture
+def gestor():
+    with sdk_backend.GestorSesiones() as g:
+        yield g
+
+
+@pytest.fixture
+def retardos():
+    """``configurar_retardos`` de cbindings_local; al terminar la prueba vuelven a cero."""
+    from DRU_library import cbindings_local
+    yield cbindings_local.configurar_retardos
+    cbindings_local.configurar_retardos(**dict.fromkeys(cbindings_local.RETARDOS, 0.0))
@@ -0,0 +1,52 @@
+"""
+Área temporal de intermedios (artefactos.py): solo lo pedido llega al destino y el directorio
+del trabajo se borra entero.
+"""
+
+import os
+
+import pytest
+
+from DRU_library import artefactos, sdk_backend
+from DRU_library.artefactos import Artefactos
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    ruta = tmp_path / "ram"
+    ruta.mkdir()
+    monkeypatch.setenv("DRU_TMP", str(ruta))
+    return ruta
+
+
+def test_solo_se_conserva_lo_pedido(base, tmp_path):
+    destino = tmp_path / "workspace"
+    with Artefactos(destino=str(destino), prefijo="ghz_") as art:
+        assert os.path.dirname(art.directorio) == str(base)
+        cpp = art.escribir("ghz.cpp", ["qbit q[1];", "quantum_kernel void my_kernel() {", "}"])
+        art.escribir("ghz.ll", "ir")
+        art.escribir("ghz.so", "binario")
+        art.conservar("ghz.cpp", "ghz.qs")       # ghz.qs no existe: se ignora
+        with open(cpp, encoding="utf8") as f:
+            assert f.read().endswith("}\n")
+
+    assert sorted(os.listdir(destino)) == ["ghz.cpp"]
+    assert os.listdir(base) == []
+
+
+def test_se_borra_aunque_falle(base):
+    with pytest.raises(RuntimeError):
+        with Artefactos() as art:
+            art.escribir("a.cpp", "x")
+            raise RuntimeError("falla el compilador")
+    assert not os.path.exists(art.directorio)
+    assert art.persistir() == []                # sin destino no se copia nada
+
+
+def test_directorio_de_kernels_compartido(base, monkeypatch):
+    monkeypatch.setattr(artefactos, "_compartido", None)
+    directorio = sdk_backend.directorio_kernels()
+    assert os.path.dirname(directorio) == str(base)
+    assert sdk_backend.directorio_kernels() == directorio
+    with sdk_backend.GestorSesiones() as gestor:
+        assert gestor.directorio == directorio
@@ -0,0 +1,95 @@
+"""
+Opciones ajustadas por circuito (sdk_backend.ruta_ajustes / guardar_ajuste / opciones_kernel):
+dónde se guardan, ida y vuelta por el JSON y su uso al compilar.
+"""
+
+import json
+import os
+
+import pytest
+
+from DRU_library import autoajuste, sdk_backend
+
+
+@pytest.fixture
+def ajustes(tmp_path, monkeypatch):
+    """Archivo de ajustes propio de la prueba (ni el del usuario ni el de otra prueba)."""
+    ruta = tmp_path / "cache" / "ajustes.json"
+    monkeypatch.setenv("DRU_AUTOAJUSTE", str(ruta))
+    monkeypatch.setattr(sdk_backend, "_ajustes", {})
+    return ruta
+
+
+def fuente_dru(capas=2, qubits=2):
+    ops = sdk_backend.operaciones_dru(capas, qubits, 1, "lineal")
+    return sdk_backend.kernel_cpp(ops, qubits, capas * qubits * 3)
+
+
+def test_ruta_ajustes(tmp_path, monkeypatch):
+    monkeypatch.setenv("DRU_AUTOAJUSTE", str(tmp_path / "propio.json"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert sdk_backend.ruta_ajustes() == str(tmp_path / "propio.json")
+
+    monkeypatch.delenv("DRU_AUTOAJUSTE")
+    assert sdk_backend.ruta_ajustes() == str(tmp_path / "xdg" / "dru_library" / "autoajuste.json")
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "casa"))
+    assert sdk_backend.ruta_ajustes() == str(tmp_path / "casa" / ".cache" / "dru_library" / "autoajuste.json")
+
+
+def test_ida_y_vuelta(ajustes):
+    fuente = fuente_dru()
+    assert sdk_backend.leer_ajustes() == {}
+    assert sdk_backend.opciones_kernel(fuente) == sdk_backend.OPCIONES_COMPILADOR
+
+    sdk_backend.guardar_ajuste(fuente, {"opciones": ["-p", "local", "-S", "lookahead"], "tiempo": 1e-3})
+    firma = sdk_backend.firma_circuito(fuente)
+    assert json.loads(ajustes.read_text())[firma]["opciones"] == ["-p", "local", "-S", "lookahead"]
+    assert sdk_backend.leer_ajustes()[firma]["tiempo"] == 1e-3
+    assert sdk_backend.opciones_kernel(fuente) == ("-p", "local", "-S", "lookahead")
+    # por backend y por estructura: otro backend u otro circuito siguen con las por defecto
+    assert sdk_backend.opciones_kernel(fuente, "IQS") == sdk_backend.OPCIONES_COMPILADOR
+    assert sdk_backend.opciones_kernel(fuente_dru(capas=3)) == sdk_backend.OPCIONES_COMPILADOR
+
+    # un segundo ajuste no borra el primero
+    sdk_backend.guardar_ajuste(fuente, {"opciones": ["-p", "global", "-S", "greedy"]}, "IQS")
+    assert sdk_backend.opciones_kernel(fuente) == ("-p", "local", "-S", "lookahead")
+    assert sdk_backend.opciones_kernel(fuente, "IQS") == ("-p", "global", "-S", "greedy")
+    assert not [p for p in os.listdir(ajustes.parent) if p.endswith(".tmp")]
+
+
+def test_misma_firma_con_otros_angulos(ajustes):
+    a = "RZ(q[0], 0.125);\nCNOT(q[0], q[1]);\n"
+    b = "RZ(q[0], 2.5e-3);\nCNOT(q[0], q[1]);\n"
+    assert sdk_backend.firma_circuito(a) == sdk_backend.firma_circuito(b)
+    sdk_backend.guardar_ajuste(a, {"opciones": ["-p", "local", "-S", "greedy"]})
+    assert sdk_backend.opciones_kernel(b) == ("-p", "local", "-S", "greedy")
+
+
+def test_archivo_cambiado_por_otro_proceso(ajustes):
+    fuente = fuente_dru()
+    sdk_backend.guardar_ajuste(fuente, {"opciones": ["-p", "local", "-S", "greedy"]})
+    assert sdk_backend.opciones_kernel(fuente) == ("-p", "local", "-S", "greedy")
+
+    # otro proceso reescribe el archivo: se relee por su mtime
+    firma = sdk_backend.firma_circuito(fuente)
+    ajustes.write_text(json.dumps({firma: {"opciones": ["-p", "global", "-S", "lookahead"]}}))
+    mtime = os.stat(ajustes).st_mtime_ns + 1_000_000
+    os.utime(ajustes, ns=(mtime, mtime))
+    assert sdk_backend.opciones_kernel(fuente) == ("-p", "global", "-S", "lookahead")
+
+
+def test_ajustar_guarda_y_compilar_usa(ajustes, tmp_path):
+    from DRU_library import cbindings_local
+
+    fuente = fuente_dru()
+    opciones = [("-p", "trivial", "-S", "greedy"), ("-p", "local", "-S", "lookahead")]
+    ajuste = autoajuste.ajustar_kernel(fuente, 2, directorio=str(tmp_path), opciones=opciones,
+                                       repeticiones=1, cbindings=cbindings_local)
+    assert ajuste["opciones"] in opciones
+    assert sdk_backend.opciones_kernel(fuente) == tuple(ajuste["opciones"])
+
+    # sin opciones explícitas compilar_kernel usa las guardadas
+    so_path = sdk_backend.compilar_kernel(fuente, str(tmp_path), cbindings=cbindings_local)
+    assert so_path == sdk_backend.rutas_kernel(fuente, str(tmp_path), "QD_SIM", ajuste["opciones"])[1]
@@ -0,0 +1,63 @@
+import csv
+
+import numpy as np
+import pytest
+
+from DRU_library import sdk_backend
+from DRU_library.barrido_ruido import (modelo_ruido, rejilla_ruido, barrido_dru, barrido_ghz,
+                                       estados_referencia)
+from DRU_library.base_functions import parametros
+from DRU_library.vector_estado import estados_dru
+
+
+def _problema():
+    np.random.seed(0)
+    theta, w = parametros(1, 2, qubits=2)
+    return np.random.uniform(-1, 1, (3, 3)), theta, w
+
+
+def test_modelos_de_ruido():
+    modelos = rejilla_ruido(depolarizante=(0.01, 0.1), desfase=(0.05,))
+    assert [m["nombre"] for m in modelos] == ["noiseless", "qd_sim", "depolarizante_0.01",
+                                             "depolarizante_0.1", "desfase_0.05"]
+    assert modelos[2]["depolarizante"] == 0.01 and modelos[2]["bitflip"] == 0.0
+    with pytest.raises(ValueError):
+        modelo_ruido("x", termico=0.1)
+    with pytest.raises(ValueError):
+        modelo_ruido("x", backend="QD_SIM", depolarizante=0.1)
+
+
+def test_estados_referencia_igual_a_estados_dru():
+    X, theta, w = _problema()
+    angulos, subcapas = sdk_backend.angulos_lote(X, theta, w)
+    ops = sdk_backend.operaciones_dru(2, 2, subcapas, "lineal")
+    np.testing.assert_allclose(estados_referencia(ops, 2, angulos), estados_dru(X, theta, w, 2, 2),
+                               atol=1e-12)
+
+
+def test_barrido_sin_ruido_y_con_ruido(tmp_path):
+    X, theta, w = _problema()
+    modelos = rejilla_ruido(depolarizante=(0.02, 0.2))
+    salida = tmp_path / "ruido.csv"
+    filas = barrido_dru(X, theta, w, 2, 2, modelos, procesos=0, trayectorias=30, salida=str(salida))
+
+    por_nombre = {f["nombre"]: f for f in filas}
+    for ideal in ("noiseless", "qd_sim"):
+        assert por_nombre[ideal]["trayectorias"] == 1
+        np.testing.assert_allclose(por_nombre[ideal]["fidelidades"], 1, atol=1e-10)
+    # el ruido baja la fidelidad, más cuanto más intenso
+    assert por_nombre["depolarizante_0.02"]["trayectorias"] == 30
+    assert 1 > por_nombre["depolarizante_0.02"]["media"] > por_nombre["depolarizante_0.2"]["media"]
+
+    with open(salida, newline="", encoding="utf8") as f:
+        leidas = list(csv.DictReader(f))
+    assert [r["nombre"] for r in leidas] == [m["nombre"] for m in modelos]
+    assert "fidelidades" not in leidas[0]
+
+
+def test_barrido_en_procesos_igual_que_en_el_actual():
+    modelos = [modelo_ruido("noiseless"), modelo_ruido("dep", depolarizante=0.1)]
+    en_proceso = barrido_ghz(3, modelos, procesos=0, trayectorias=10, semilla=4)
+    en_pool = barrido_ghz(3, modelos, procesos=2, trayectorias=10, semilla=4)
+    for a, b in zip(en_proceso, en_pool):
+        np.testing.assert_allclose(a["fidelidades"], b["fidelidades"], atol=1e-12)
@@ -0,0 +1,39 @@
+import csv
+
+import numpy as np
+import pytest
+
+from DRU_library import benchmark_sdk
+from DRU_library import cbindings_local
+
+
+def test_resumir():
+    fila = benchmark_sdk.resumir([0.1, 0.2, 0.3, 0.4])
+    assert fila["n"] == 4 and fila["max"] == 0.4
+    assert fila["media"] == pytest.approx(0.25) and fila["p50"] == pytest.approx(0.25)
+
+
+def test_etapas_y_csv(tmp_path, retardos):
+    retardos(ready=0.02, callCppFunction=0.01)
+    salida = tmp_path / "bench.csv"
+    filas = benchmark_sdk.ejecutar_benchmark(qubits=(1, 2), profundidades=(1,), repeticiones=2,
+                                            cbindings=cbindings_local, salida=str(salida))
+
+    assert len(filas) == 2 * len(benchmark_sdk.ETAPAS)
+    por_etapa = {(f["qubits"], f["etapa"]): f for f in filas}
+    for n in (1, 2):
+        # los retardos sintéticos aparecen en la etapa que les corresponde
+        assert por_etapa[n, "ready"]["p50"] >= 0.02
+        assert por_etapa[n, "callCppFunction"]["p50"] >= 0.01
+        assert por_etapa[n, "translate"]["p50"] < 0.01
+        assert all(por_etapa[n, e]["n"] == 2 for e in benchmark_sdk.ETAPAS)
+
+    with open(salida, newline="", encoding="utf8") as f:
+        leidas = list(csv.DictReader(f))
+    assert len(leidas) == len(filas)
+    assert float(leidas[0]["p99"]) == pytest.approx(filas[0]["p99"])
+
+
+def test_qasm_capas():
+    qasm = benchmark_sdk.qasm_capas(3, 2, np.random.default_rng(0))
+    assert qasm.count("cx ") == 2 * 2 and qasm.count("rz(") == 2 * 3 * 2
@@ -0,0 +1,82 @@
+"""
+Conjuntos ya codificados (datos.py): codificación igual a ``re_dim``, mini-batches que
+recorren cada muestra una vez y mismos resultados que con los arreglos sin codificar.
+"""
+
+import numpy as np
+import pytest
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params, re_dim
+from DRU_library.datos import ConjuntoDatos, lotes, separar
+from DRU_library.lectura import Lectura
+from DRU_library.training import accuracy, predict_proba
+
+
+def numerado(N, d=5):
+    """X con el número de fila en la primera columna, para rastrear cada muestra."""
+    X = np.random.default_rng(0).uniform(-1, 1, (N, d))
+    X[:, 0] = np.arange(N)
+    return X, np.arange(N) % 3
+
+
+@pytest.mark.parametrize("en_disco", [False, True])
+def test_codificacion_igual_a_re_dim(tmp_path, en_disco):
+    X, y = numerado(23)
+    ruta = str(tmp_path / "x.npy") if en_disco else None
+    # bloque=5 no divide a 23: también se codifica el último bloque incompleto
+    datos = ConjuntoDatos(X, y, ruta=ruta, bloque=5)
+
+    assert datos.caracteristicas.shape == (23, 2, 3) and datos.subcapas == 2
+    for x, codificada in zip(X, datos.caracteristicas):
+        np.testing.assert_array_equal(codificada, re_dim(x)[0])
+    if en_disco:
+        abierto = ConjuntoDatos.abrir(ruta, y)
+        np.testing.assert_array_equal(abierto.caracteristicas, datos.caracteristicas)
+        assert (abierto.subcapas, abierto.target_dim) == (2, 3)
+
+
+@pytest.mark.parametrize("batch_size", [1, 4, 7, 23, 50])
+def test_lotes_recorren_cada_muestra_una_vez(batch_size):
+    X, y = numerado(23)
+    datos = ConjuntoDatos(X, y)
+
+    for barajar in (True, False):
+        vistos = []
+        for x_batch, y_batch in datos.lotes(batch_size, barajar=barajar, rng=np.random.default_rng(1)):
+            assert len(x_batch) <= batch_size
+            filas = x_batch[:, 0, 0].astype(int)
+            np.testing.assert_array_equal(y_batch, y[filas])     # las clases siguen a su muestra
+            vistos.extend(filas)
+        assert sorted(vistos) == list(range(23))
+        if not barajar:
+            assert vistos == list(range(23))
+
+    # con arreglos sin codificar, lo mismo
+    vistos = [fila for x_batch, _ in lotes(X, y, batch_size) for fila in x_batch[:, 0].astype(int)]
+    assert sorted(vistos) == list(range(23))
+
+
+def test_lotes_barajan_distinto_cada_vez():
+    X, y = numerado(40)
+    datos = ConjuntoDatos(X, y)
+    rng = np.random.default_rng(2)
+    primero = [x[:, 0, 0] for x, _ in datos.lotes(10, rng=rng)]
+    segundo = [x[:, 0, 0] for x, _ in datos.lotes(10, rng=rng)]
+    assert any(not np.array_equal(a, b) for a, b in zip(primero, segundo))
+
+
+def test_modelo_con_conjunto_codificado():
+    np.random.seed(3)
+    X = np.random.uniform(-1, 1, (15, 4))
+    y = np.random.randint(0, 2, len(X))
+    datos = ConjuntoDatos(X, y)
+    theta, w = parametros(2, 2, qubits=2)
+    params_flat, shape_flat = flatten_params([theta, w])
+    lectura = Lectura.clasificacion(2)
+    modelo = circuito_parametrico(2, 2, lectura=lectura)
+
+    assert separar(datos)[1] is datos.y
+    np.testing.assert_allclose(predict_proba(datos, modelo, params_flat, shape_flat, lectura),
+                               predict_proba(X, modelo, params_flat, shape_flat, lectura), atol=1e-12)
+    assert accuracy(datos, None, modelo, params_flat, shape_flat, lectura) == \
+        accuracy(X, y, modelo, params_flat, shape_flat, lectura)
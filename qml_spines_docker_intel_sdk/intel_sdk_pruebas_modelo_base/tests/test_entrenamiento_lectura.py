@@ -0,0 +1,82 @@
+"""
+Entrenamiento con lectura parcial (``lectura=`` en costo_batches / make_cost_fn / fit): el
+estado se reduce a los qubits de etiqueta y se compara con etiquetas de ese tamaño.
+"""
+
+import numpy as np
+import pennylane as qml
+import pytest
+from pennylane import numpy as pnp
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params, reshape_params
+from DRU_library.base_functions import generar_etiquetas
+from DRU_library.cost_functions import fidelity_cost, Trace_Distance_v3, Renyi_Divergence_2
+from DRU_library.lectura import Lectura
+from DRU_library.training import costo_batches, make_cost_fn, fit, accuracy
+
+CAPAS, QUBITS, C = 2, 3, 2
+TOL = 1e-7    # qml.math.fidelity con matrices de rango 1
+
+
+@pytest.fixture
+def problema():
+    np.random.seed(9)
+    X = np.random.uniform(-1, 1, (6, 3))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    params_flat, shape_flat = flatten_params([theta, w])
+    return X, y, params_flat, shape_flat
+
+
+def referencia(params_flat, shape_flat, X, y, costo, wires):
+    """Costo medio con la matriz reducida de PennyLane y etiquetas densas de len(wires) qubits."""
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    theta, w = reshape_params(params_flat, shape_flat)
+    dim = 2 ** len(wires)
+    total = 0
+    for x, c in zip(X, y):
+        rho = qml.math.reduce_statevector(modelo(x, theta, w), indices=wires)
+        etiqueta = np.zeros((dim, dim), dtype=complex)
+        etiqueta[c, c] = 1
+        total = total + costo(rho, etiqueta)
+    return total / len(X)
+
+
+@pytest.mark.parametrize("costo", [fidelity_cost, Trace_Distance_v3, Renyi_Divergence_2])
+@pytest.mark.parametrize("wires", [[0], [2]])
+def test_costo_con_traza_parcial(problema, costo, wires):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    lectura = Lectura(wires)
+    obtenido = costo_batches(params_flat, shape_flat, X, y, circuito_parametrico(CAPAS, QUBITS),
+                             etiquetas, costo, lectura)
+    assert float(obtenido) == pytest.approx(float(referencia(params_flat, shape_flat, X, y, costo, wires)),
+                                            abs=TOL)
+
+
+def test_gradiente_con_traza_parcial(problema):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    costo = make_cost_fn(X, y, circuito_parametrico(CAPAS, QUBITS), etiquetas, shape_flat,
+                         fidelity_cost, Lectura.clasificacion(C))
+    ref = lambda p: referencia(p, shape_flat, X, y, fidelity_cost, [0])
+    p = pnp.array(params_flat, requires_grad=True)
+    np.testing.assert_allclose(qml.grad(costo)(p), qml.grad(ref)(p), atol=1e-6)
+
+
+def test_fit_con_lectura(problema):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    lectura = Lectura.clasificacion(C)
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    _, historia = fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, fidelity_cost,
+                         epochs=3, batch_size=3, acc_stop=1.1, lectura=lectura)
+
+    assert len(historia["loss"]) == 3
+    assert historia["loss"][-1] < historia["loss"][0]
+    # la accuracy de la historia usa la misma lectura
+    assert historia["acc_train"][-1] == accuracy(X, y, modelo, historia["params"][-1], shape_flat,
+                                                 lectura=lectura)
+    # sin lectura las etiquetas de 1 qubit no encajan con el estado de 3
+    with pytest.raises(ValueError):
+        costo_batches(params_flat, shape_flat, X, y, modelo, list(etiquetas), Trace_Distance_v3)
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+import pytest
+
+from DRU_library.estabilizador import Estabilizador, es_clifford, leer_qasm
+
+
+@pytest.mark.parametrize("expr, esperado", [
+    ("pi/2", math.pi / 2), ("-pi", -math.pi), ("3*pi/4", 3 * math.pi / 4), ("0.25", 0.25),
+    ("-(pi - 1) * 2", -(math.pi - 1) * 2), ("+1e-3", 1e-3),
+])
+def test_angulos_qasm(expr, esperado):
+    _, ops = leer_qasm(f"OPENQASM 2.0; qreg q[1]; rz({expr}) q[0];")
+    assert ops == [("RZ", (0,), pytest.approx(esperado))]
+
+
+@pytest.mark.parametrize("expr", [
+    "().__class__.__bases__[0].__subclasses__()", "__import__('os')", "pi ** 2", "e", "True",
+    "abs(-1)", "pi if 1 else 0", "'pi'",
+])
+def test_angulos_qasm_rechaza_expresiones(expr):
+    with pytest.raises(ValueError):
+        leer_qasm(f"OPENQASM 2.0; qreg q[1]; rz({expr}) q[0];")
+
+
+def test_measz_en_la_tabla():
+    # lo que es_clifford acepta, Estabilizador.aplicar lo ejecuta
+    ops = [("H", (0,), None), ("CNOT", (0, 1), None), ("MeasZ", (0,), None), ("PrepZ", (1,), None)]
+    assert es_clifford(ops)
+    tabla = Estabilizador(2, 0)
+    resultados = [tabla.aplicar(puerta, qubits) for puerta, qubits, _ in ops]
+    assert resultados[2] in (0, 1)
+    muestras = tabla.muestrear(50)
+    assert np.all(muestras[:, 0] == resultados[2]) and not muestras[:, 1].any()
@@ -0,0 +1,106 @@
+"""
+Etiquetas implícitas (etiquetas.py) contra las listas densas que armaba ``generar_etiquetas``
+antes, y costos de ``costo_batches`` con ambas.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params, generar_etiquetas
+from DRU_library.cost_functions import (fidelity_cost, Trace_Distance_v3, Renyi_Divergence_0_5,
+                                        Renyi_Divergence_2)
+from DRU_library.etiquetas import Etiquetas
+from DRU_library.lectura import Lectura
+from DRU_library.training import costo_batches
+
+# qml.math.fidelity (camino denso) toma raíces de matrices de rango 1: ~1e-8 de error numérico
+TOL = 1e-7
+
+
+def etiquetas_densas(C):
+    """Lo que devolvía ``generar_etiquetas``: listas de kets y de |c><c| densos."""
+    dim = 2 ** int(math.ceil(math.log2(C)))
+    kets, dms = [], []
+    for c in range(C):
+        estado = np.zeros(dim, dtype=complex)
+        estado[c] = 1
+        kets.append(estado)
+        dms.append(np.outer(estado, np.conj(estado)))
+    return kets, dms
+
+
+@pytest.mark.parametrize("C", [2, 3, 4, 5, 8])
+def test_igual_a_las_listas_densas(C):
+    kets, dms = generar_etiquetas(C)
+    kets_ref, dms_ref = etiquetas_densas(C)
+
+    assert isinstance(dms, Etiquetas) and len(kets) == len(dms) == C
+    assert dms.n_qubits == int(math.ceil(math.log2(C)))
+    for c in range(C):
+        np.testing.assert_array_equal(kets[c], kets_ref[c])
+        np.testing.assert_array_equal(dms[c], dms_ref[c])
+        np.testing.assert_array_equal(dms.densa(c), dms_ref[c])
+    np.testing.assert_array_equal(np.array(list(dms)), np.array(dms_ref))
+    # cada acceso es una matriz nueva: modificarla no cambia la etiqueta
+    dms[0][0, 0] = 7
+    assert dms[0][0, 0] == 1
+
+
+def test_suavizado_igual_al_de_los_costos():
+    _, dms = generar_etiquetas(4)
+    _, dms_ref = etiquetas_densas(4)
+    # Trace_Distance_v3 y las Renyi suavizan dm_true en el lugar: 0.999 en c, el resto repartido
+    for c in range(4):
+        suave = dms_ref[c].astype(complex)
+        Trace_Distance_v3(np.eye(4) / 4, suave)
+        np.testing.assert_allclose(dms.densa(c, suavizado=0.999), suave, atol=1e-15)
+        assert np.trace(dms.densa(c, suavizado=0.999)).real == pytest.approx(1)
+
+
+def test_precision_y_rangos():
+    kets, dms = generar_etiquetas(3, precision="single")
+    assert kets[1].dtype == np.complex64 and dms[1].dtype == np.complex64
+    assert Etiquetas(3, n_qubits=4).dim == 16
+    with pytest.raises(IndexError):
+        dms[3]
+    with pytest.raises(ValueError):
+        Etiquetas(5, n_qubits=2)
+    with pytest.raises(ValueError):
+        Etiquetas(2, forma="vector")
+
+
+@pytest.mark.parametrize("costo", [fidelity_cost, Trace_Distance_v3, Renyi_Divergence_0_5, Renyi_Divergence_2])
+def test_costos_iguales_con_etiquetas_implicitas(costo):
+    np.random.seed(7)
+    C, capas, qubits = 3, 2, 2
+    X = np.random.uniform(-1, 1, (6, 3))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(1, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    modelo = circuito_parametrico(capas, qubits)
+
+    _, implicitas = generar_etiquetas(C)
+    _, densas = etiquetas_densas(C)
+    # con las listas densas, los costos que suavizan modifican la etiqueta: una copia por llamada
+    referencia = costo_batches(params_flat, shape_flat, X, y, modelo, [d.copy() for d in densas], costo)
+    assert costo_batches(params_flat, shape_flat, X, y, modelo, implicitas, costo) == \
+        pytest.approx(float(referencia), abs=TOL)
+
+
+def test_fidelidad_nativa_con_lectura():
+    np.random.seed(8)
+    C, capas, qubits = 2, 2, 3
+    X = np.random.uniform(-1, 1, (5, 3))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(1, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    modelo = circuito_parametrico(capas, qubits)
+    lectura = Lectura.clasificacion(C)
+
+    _, implicitas = generar_etiquetas(C)
+    _, densas = etiquetas_densas(C)
+    assert costo_batches(params_flat, shape_flat, X, y, modelo, implicitas, fidelity_cost, lectura) == \
+        pytest.approx(float(costo_batches(params_flat, shape_flat, X, y, modelo, densas, fidelity_cost,
+                                          lectura)), abs=TOL)
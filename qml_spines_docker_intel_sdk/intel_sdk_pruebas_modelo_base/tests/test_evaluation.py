@@ -0,0 +1,68 @@
+"""
+Métricas de ``evaluate_classification`` a partir de probabilidades ya calculadas, contra el
+camino de una simulación por muestra.
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix, classification_report
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.evaluation import evaluate_classification
+from DRU_library.lectura import Lectura
+from DRU_library.training import predict_proba
+
+CAPAS, QUBITS = 2, 3
+
+
+def no_simular(*args, **kwargs):
+    raise AssertionError("no debería simular: las probabilidades ya están calculadas")
+
+
+@pytest.mark.parametrize("C", [2, 3])
+def test_metricas_desde_probabilidades(C):
+    np.random.seed(6)
+    X_train, X_val = np.random.uniform(-1, 1, (20, 3)), np.random.uniform(-1, 1, (12, 3))
+    y_train, y_val = np.random.randint(0, C, 20), np.random.randint(0, C, 12)
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    params_flat, shape_flat = flatten_params([theta, w])
+    lectura = Lectura.clasificacion(C)
+    modelo = circuito_parametrico(CAPAS, QUBITS, lectura=lectura)
+
+    probs_train = predict_proba(X_train, modelo, params_flat, shape_flat, lectura)
+    probs_val = predict_proba(X_val, modelo, params_flat, shape_flat, lectura)
+    metricas = evaluate_classification(modelo, params_flat, shape_flat, X_train, y_train, X_val, y_val,
+                                       predict_proba=no_simular, lectura=lectura,
+                                       probs_train=probs_train, probs_val=probs_val)
+
+    # camino anterior: un QNode por muestra y la clase de mayor probabilidad
+    def por_muestra(X):
+        return np.array([np.argmax(lectura.seleccionar(modelo(x, theta, w))) for x in X])
+
+    pred_train, pred_val = por_muestra(X_train), por_muestra(X_val)
+    clases = np.unique(np.concatenate((y_train, y_val)))
+    assert metricas["acc_train"] == np.mean(pred_train == y_train)
+    assert metricas["acc_val"] == np.mean(pred_val == y_val)
+    np.testing.assert_array_equal(metricas["cm_train"], confusion_matrix(y_train, pred_train, labels=clases))
+    np.testing.assert_array_equal(metricas["cm_val"], confusion_matrix(y_val, pred_val, labels=clases))
+    assert metricas["report_val"] == classification_report(y_val, pred_val, labels=clases, digits=2)
+    assert (metricas["auc"] is None) == (C != 2)
+
+
+def test_predict_se_usa_si_se_da():
+    X = np.zeros((4, 3))
+    y = np.array([0, 1, 0, 1])
+    probs = np.array([[0.9, 0.1]] * 4)
+    llamadas = []
+
+    def predict(X, modelo, params_flat, shape_flat):
+        llamadas.append(len(X))
+        return y
+
+    metricas = evaluate_classification(None, None, None, X, y, X, y, predict=predict,
+                                       predict_proba=no_simular, probs_train=probs, probs_val=probs)
+    assert llamadas == [4, 4]
+    assert metricas["acc_train"] == metricas["acc_val"] == 1.0
@@ -0,0 +1,58 @@
+"""
+Modelo exportado a C++ (exportar.py) contra el QNode de ``circuito_parametrico`` con los
+mismos parámetros entrenados.
+"""
+
+import numpy as np
+import pytest
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.base_functions import generar_etiquetas, reshape_params
+from DRU_library.cost_functions import fidelity_cost
+from DRU_library.exportar import exportar_modelo, cargar_exportado
+from DRU_library.lectura import Lectura
+from DRU_library.training import fit
+
+from conftest import comparar_estados
+
+CAPAS, QUBITS, C = 2, 3, 3
+
+
+@pytest.fixture(scope="module")
+def entrenado():
+    np.random.seed(4)
+    X = np.random.uniform(-1, 1, (12, 5))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(2, CAPAS, qubits=QUBITS)
+    params_flat, shape_flat = flatten_params([theta, w])
+    _, etiquetas = generar_etiquetas(C)
+    lectura = Lectura.clasificacion(C)
+    best_params, _ = fit(circuito_parametrico(CAPAS, QUBITS), etiquetas, X, y, X, y,
+                         params_flat, shape_flat, fidelity_cost, epochs=2, batch_size=6,
+                         lectura=lectura, historia_params=False)
+    return X, best_params, shape_flat, lectura
+
+
+@pytest.mark.parametrize("entrelazamiento", ["lineal", "full"])
+def test_host_igual_al_qnode(gestor, tmp_path, entrenado, entrelazamiento):
+    X, params, shape_flat, lectura = entrenado
+    theta, w = reshape_params(params, shape_flat)
+    ruta = exportar_modelo(str(tmp_path / "modelo_dru"), CAPAS, QUBITS, params, shape_flat,
+                           entrelazamiento)
+
+    qnode = circuito_parametrico(CAPAS, QUBITS, entrelazamiento, lectura=lectura)
+    estados = circuito_parametrico(CAPAS, QUBITS, entrelazamiento)
+    # el QNode devuelve las marginales de los qubits de etiqueta; la lectura elige los estados
+    referencia = lectura.seleccionar(np.array([qnode(x, theta, w) for x in X]))
+    with cargar_exportado(ruta, gestor=gestor) as host:
+        np.testing.assert_allclose(host.probabilidades(X, lectura), referencia, atol=1e-10)
+        comparar_estados(host.amplitudes(X), np.array([estados(x, theta, w) for x in X]))
+        np.testing.assert_array_equal(host.predict(X, lectura), np.argmax(referencia, axis=1))
+
+
+def test_host_rechaza_demasiadas_caracteristicas(gestor, tmp_path, entrenado):
+    _, params, shape_flat, lectura = entrenado
+    ruta = exportar_modelo(str(tmp_path / "modelo_dru"), CAPAS, QUBITS, params, shape_flat)
+    with cargar_exportado(ruta, gestor=gestor) as host:
+        with pytest.raises(ValueError):
+            host.probabilidades(np.zeros((2, 7)), lectura)
@@ -0,0 +1,49 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from DRU_library.fidelidad_medidas import (fidelidades, fidelidad_clasica, resumen_fidelidad,
+                                           FidelidadAcumulada)
+
+
+def _estados(rng, n, d):
+    psi = rng.normal(size=(n, d)) + 1j * rng.normal(size=(n, d))
+    return psi / np.linalg.norm(psi, axis=1, keepdims=True)
+
+
+def test_fidelidades_igual_a_qml_math_fidelity():
+    rng = np.random.default_rng(0)
+    a, b = _estados(rng, 20, 8), _estados(rng, 20, 8)
+    esperadas = [qml.math.fidelity_statevector(x, y) for x, y in zip(a, b)]
+    np.testing.assert_allclose(fidelidades(a, b), esperadas, atol=1e-12)
+    # y contra la fórmula con matrices densidad
+    densas = [qml.math.fidelity(np.outer(x, x.conj()), np.outer(y, y.conj())) for x, y in zip(a[:5], b[:5])]
+    np.testing.assert_allclose(fidelidades(a[:5], b[:5]), densas, atol=1e-6)
+
+
+def test_fidelidades_invariante_a_fase_y_un_estado():
+    rng = np.random.default_rng(1)
+    a = _estados(rng, 3, 4)
+    np.testing.assert_allclose(fidelidades(a, a * np.exp(0.7j)), 1, atol=1e-12)
+    assert fidelidades(a[0], a[0]).shape == (1,)
+    with pytest.raises(ValueError):
+        fidelidades(a, a[:2])
+
+
+def test_fidelidad_clasica():
+    p = np.array([[0.5, 0.5, 0.0], [1.0, 0.0, 0.0]])
+    np.testing.assert_allclose(fidelidad_clasica(p, p), 1)
+    np.testing.assert_allclose(fidelidad_clasica(p[1], [0.0, 1.0, 0.0]), 0)
+    np.testing.assert_allclose(fidelidad_clasica(p[0], p[1]), 0.5)
+
+
+def test_acumulada_igual_al_resumen():
+    rng = np.random.default_rng(2)
+    a, b = _estados(rng, 50, 4), _estados(rng, 50, 4)
+    acumulada = FidelidadAcumulada()
+    for i in range(0, 50, 7):
+        acumulada.agregar(a[i:i + 7], b[i:i + 7])
+    resumen = resumen_fidelidad(a, b)
+    for clave in ("media", "desviacion", "error", "n"):
+        assert acumulada.resumen()[clave] == pytest.approx(resumen[clave], rel=1e-12)
+    assert resumen["desviacion"] == pytest.approx(np.std(resumen["fidelidades"], ddof=1))
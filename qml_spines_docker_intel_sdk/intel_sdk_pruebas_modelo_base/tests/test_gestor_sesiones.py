@@ -0,0 +1,53 @@
+import numpy as np
+
+from DRU_library import sdk_backend
+from DRU_library.base_functions import parametros
+from DRU_library.vector_estado import estados_dru
+
+from conftest import comparar_estados
+
+CAPAS, QUBITS = 2, 3
+
+
+def _datos(semilla=0):
+    np.random.seed(semilla)
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    return np.random.uniform(-1, 1, (4, 3)), theta, w
+
+
+def test_simulador_y_kernels_se_reutilizan(gestor):
+    X, theta, w = _datos()
+    for _ in range(3):
+        for entrelazamiento in ("lineal", "full"):
+            estados = sdk_backend.amplitudes_sdk(X, theta, w, CAPAS, QUBITS, entrelazamiento, gestor=gestor)
+            comparar_estados(estados, estados_dru(X, theta, w, CAPAS, QUBITS, entrelazamiento))
+    reporte = gestor.reporte()
+    # un simulador y un loadSdk por kernel, por más llamadas que haya
+    assert reporte["dispositivos"] == 1
+    assert reporte["cargas"] == 2 and reporte["descargas"] == 0
+
+
+def test_lru_de_kernels_descarga_el_mas_viejo():
+    X, theta, w = _datos(1)
+    with sdk_backend.GestorSesiones(max_kernels=2) as gestor:
+        for entrelazamiento in ("lineal", "full", "circular", "lineal"):
+            sdk_backend.amplitudes_sdk(X, theta, w, CAPAS, QUBITS, entrelazamiento, gestor=gestor)
+        assert gestor.conteos["cargas"] == 4 and gestor.conteos["descargas"] == 2
+        assert len(gestor._bibliotecas) == 2
+    assert gestor.conteos["descargas"] == 4      # cerrar descarga lo que quedaba
+
+
+def test_dispositivos_por_numero_de_qubits(gestor):
+    for n in (2, 3, 2, 4):
+        gestor.dispositivo("QD_SIM", n)
+    assert gestor.conteos["dispositivos"] == 3
+
+
+def test_ejecutar_kernel_reinicia_el_estado(gestor):
+    n = 4
+    fuente = sdk_backend.kernel_cpp(sdk_backend.operaciones_ghz(n), n, 0)
+    so_path = sdk_backend.compilar_kernel(fuente, gestor.directorio, cbindings=gestor.cb)
+    ghz = np.zeros(2 ** n)
+    ghz[[0, -1]] = 1 / np.sqrt(2)
+    for _ in range(3):
+        comparar_estados(gestor.ejecutar_kernel(so_path, sdk_backend.KERNEL, n), ghz)
@@ -0,0 +1,144 @@
+"""
+Caminos de entrenamiento sobre el Intel SDK (``GradienteSDK``, ``amplitudes_sdk``) contra
+PennyLane en default.qubit; con ``cbindings_local`` (ver conftest.py) corren sin el SDK.
+"""
+
+import numpy as np
+import pennylane as qml
+import pytest
+from pennylane import numpy as pnp
+
+from DRU_library import sdk_backend
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params, reshape_params
+from DRU_library.base_functions import generar_etiquetas
+from DRU_library.cost_functions import fidelity_cost, Trace_Distance_v3
+from DRU_library.gradientes_sdk import GradienteSDK
+from DRU_library.lectura import Lectura
+from DRU_library.training import make_cost_fn, predict_proba, fit
+from DRU_library.vector_estado import estados_dru
+
+from conftest import comparar_estados
+
+CAPAS, QUBITS, C = 2, 2, 3
+
+
+@pytest.fixture
+def problema():
+    np.random.seed(0)
+    X = np.random.uniform(-1, 1, (8, 4))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(2, CAPAS, qubits=QUBITS)
+    params_flat, shape_flat = flatten_params([theta, w])
+    return X, y, params_flat, shape_flat
+
+
+def test_gradiente_fidelidad_igual_a_qml_grad(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    costo = make_cost_fn(X, y, circuito_parametrico(CAPAS, QUBITS), etiquetas, shape_flat, fidelity_cost)
+
+    with GradienteSDK(CAPAS, QUBITS, Lectura.clasificacion(C), gestor=gestor) as gradiente:
+        loss, grad = gradiente(params_flat, shape_flat, X, y)
+        # 2P + 1 filas por muestra en un solo lote, con P = len(theta) * 3 = len(params_flat) / 2
+        assert gradiente.ejecuciones == len(X) * (len(params_flat) + 1)
+
+    assert abs(loss - costo(params_flat)) < 1e-8
+    np.testing.assert_allclose(grad, qml.grad(costo)(params_flat), atol=1e-8)
+
+
+def test_gradiente_entropia_igual_a_qml_grad(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+
+    def entropia(p):
+        theta, w = reshape_params(p, shape_flat)
+        return sum(-pnp.log(pnp.abs(modelo(x, theta, w)[c]) ** 2) for x, c in zip(X, y)) / len(X)
+
+    with GradienteSDK(CAPAS, QUBITS, Lectura.clasificacion(C), costo="entropia", gestor=gestor) as gradiente:
+        loss, grad = gradiente(params_flat, shape_flat, X, y)
+
+    assert abs(loss - entropia(params_flat)) < 1e-8
+    np.testing.assert_allclose(grad, qml.grad(entropia)(params_flat), atol=1e-8)
+
+
+def test_gradiente_con_entrenables(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    entrenables = np.zeros(len(params_flat), dtype=bool)
+    entrenables[::3] = True
+
+    with GradienteSDK(CAPAS, QUBITS, Lectura.clasificacion(C), gestor=gestor) as gradiente:
+        _, completo = gradiente(params_flat, shape_flat, X, y)
+        antes = gradiente.ejecuciones
+        _, parcial = gradiente(params_flat, shape_flat, X, y, entrenables=entrenables)
+        # solo se desplazan los ángulos de los parámetros entrenables
+        assert gradiente.ejecuciones - antes < len(X) * (len(params_flat) + 1)
+
+    np.testing.assert_allclose(parcial[entrenables], completo[entrenables], atol=1e-12)
+    assert np.all(parcial[~entrenables] == 0)
+
+
+def test_probabilidades_y_accuracy(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    lectura = Lectura.clasificacion(C)
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    esperadas = predict_proba(X, modelo, params_flat, shape_flat, lectura=lectura)
+
+    with GradienteSDK(CAPAS, QUBITS, lectura, gestor=gestor) as gradiente:
+        np.testing.assert_allclose(gradiente.probabilidades(X, params_flat, shape_flat), esperadas,
+                                   atol=1e-10)
+        acc = gradiente.accuracy(X, y, params_flat, shape_flat)
+    assert acc == np.mean(np.argmax(esperadas, axis=1) == y)
+
+
+def test_fit_con_gradiente_sdk_sigue_a_default_qubit(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    lectura = Lectura.clasificacion(C)
+    opciones = dict(epochs=3, batch_size=4, acc_stop=1.1)
+
+    np.random.seed(1)
+    p_ref, h_ref = fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, fidelity_cost,
+                       lectura=lectura, **opciones)
+    with GradienteSDK(CAPAS, QUBITS, lectura, gestor=gestor) as gradiente:
+        np.random.seed(1)
+        p_sdk, h_sdk = fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, fidelity_cost,
+                           gradiente=gradiente, **opciones)
+
+    # la pérdida con gradiente es la previa a cada paso: se comparan parámetros y accuracy
+    np.testing.assert_allclose(h_sdk["params"], h_ref["params"], atol=1e-6)
+    assert h_sdk["acc_train"] == h_ref["acc_train"]
+    np.testing.assert_allclose(p_sdk, p_ref, atol=1e-6)
+
+
+def test_fit_rechaza_costos_distintos(gestor, problema):
+    X, y, params_flat, shape_flat = problema
+    _, etiquetas = generar_etiquetas(C)
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    lectura = Lectura.clasificacion(C)
+
+    # el gradiente deriva la entropía, fit entrenaría con fidelity_cost / Trace_Distance_v3
+    with GradienteSDK(CAPAS, QUBITS, lectura, costo="entropia", gestor=gestor) as gradiente:
+        with pytest.raises(ValueError, match="entropia"):
+            fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, fidelity_cost,
+                epochs=1, gradiente=gradiente)
+    with GradienteSDK(CAPAS, QUBITS, lectura, gestor=gestor) as gradiente:
+        with pytest.raises(ValueError, match="Trace_Distance_v3"):
+            fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, Trace_Distance_v3,
+                epochs=1, gradiente=gradiente)
+
+    # la cost_function de fit también sirve como costo del gradiente
+    with GradienteSDK(CAPAS, QUBITS, lectura, costo=fidelity_cost, gestor=gestor) as gradiente:
+        assert gradiente.nombre_costo == "fidelidad"
+        _, historia = fit(modelo, etiquetas, X, y, X, y, params_flat, shape_flat, fidelity_cost,
+                          epochs=1, batch_size=4, gradiente=gradiente)
+    assert len(historia["loss"]) == 1
+
+
+@pytest.mark.parametrize("entrelazamiento", ["lineal", "full"])
+def test_amplitudes_sdk_igual_a_estados_dru(gestor, entrelazamiento):
+    np.random.seed(2)
+    theta, w = parametros(2, CAPAS, qubits=3)
+    X = np.random.uniform(-1, 1, (5, 6))
+    amplitudes = sdk_backend.amplitudes_sdk(X, theta, w, CAPAS, 3, entrelazamiento, gestor=gestor)
+    comparar_estados(amplitudes, estados_dru(X, theta, w, CAPAS, 3, entrelazamiento))
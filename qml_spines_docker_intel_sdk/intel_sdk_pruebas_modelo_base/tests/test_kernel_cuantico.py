@@ -0,0 +1,88 @@
+"""
+Kernel cuántico (kernel_cuantico.py): Gram por teselas contra |<psi(x)|psi(x')>|^2 por pares
+y clasificadores sobre estados calculados una sola vez.
+"""
+
+import numpy as np
+import pytest
+
+from DRU_library import kernel_cuantico
+from DRU_library.base_functions import circuito_parametrico
+from DRU_library.kernel_cuantico import KernelCuantico, gram, parametros_embedding, estados_embedding
+
+CAPAS, QUBITS = 2, 3
+
+
+def datos(n, semilla):
+    rng = np.random.default_rng(semilla)
+    X = rng.uniform(-1, 1, (n, 3))
+    return X, (X[:, 0] * X[:, 1] > 0).astype(int)
+
+
+def test_gram_por_teselas_igual_a_pares(tmp_path):
+    X, _ = datos(11, 0)
+    Z, _ = datos(7, 1)
+    theta, w = parametros_embedding(3, CAPAS, QUBITS)
+    A = estados_embedding(X, theta, w, CAPAS, QUBITS)
+    B = estados_embedding(Z, theta, w, CAPAS, QUBITS)
+
+    # referencia: un circuito por muestra en default.qubit y solapamiento por pares
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    ref_A = [modelo(x, theta, w) for x in X]
+    ref_B = [modelo(z, theta, w) for z in Z]
+    K_ref = np.array([[np.abs(np.vdot(a, b)) ** 2 for b in ref_B] for a in ref_A])
+    K_sim = np.array([[np.abs(np.vdot(a, b)) ** 2 for b in ref_A] for a in ref_A])
+
+    # bloque=4 no divide a 11 ni a 7: teselas incompletas en los bordes
+    np.testing.assert_allclose(gram(A, B, bloque=4), K_ref, atol=1e-10)
+    simetrica = gram(A, bloque=4, salida=str(tmp_path / "gram.npy"))
+    np.testing.assert_allclose(simetrica, K_sim, atol=1e-10)
+    np.testing.assert_allclose(np.load(tmp_path / "gram.npy"), K_sim, atol=1e-10)
+    np.testing.assert_allclose(np.diag(simetrica), 1, atol=1e-10)
+
+
+def test_embedding_es_la_entrada():
+    theta, w = parametros_embedding(4, CAPAS, QUBITS)
+    assert theta.shape == w.shape == (2 * CAPAS * QUBITS, 3)
+    assert np.all(theta == 0) and np.all(w == 1)
+    with pytest.raises(ValueError):
+        estados_embedding(np.zeros((1, 4)), theta, w, CAPAS, QUBITS, motor="otro")
+
+
+@pytest.mark.parametrize("modelo", ["svm", "ridge"])
+def test_clasificador_y_cache(modelo, monkeypatch):
+    X, y = datos(40, 2)
+    X_val, y_val = datos(20, 3)
+    clf = KernelCuantico(CAPAS, QUBITS, modelo=modelo, bloque=16).fit(X, y)
+
+    assert clf.gram_prueba(X_val).shape == (20, 40)
+    assert 0.0 <= clf.score(X_val, y_val) <= 1.0
+    assert set(clf.predict(X_val)) <= set(clf.clases)
+
+    # los estados de un conjunto ya visto no se recalculan
+    llamadas = []
+    original = kernel_cuantico.estados_embedding
+    monkeypatch.setattr(kernel_cuantico, "estados_embedding",
+                        lambda *a, **k: llamadas.append(1) or original(*a, **k))
+    clf.predict(X_val)
+    clf.decision_function(X_val)
+    assert llamadas == []
+    clf.limpiar_cache()
+    clf.predict(X_val)
+    assert llamadas == [1]        # solo X_val: estados_train queda en el clasificador
+
+
+def test_con_parametros_entrenados_y_single():
+    X, y = datos(30, 4)
+    np.random.seed(0)
+    theta = np.random.uniform(0, np.pi, (CAPAS * QUBITS, 3))
+    w = np.random.uniform(0, np.pi, theta.shape)
+    shape_flat = [theta.shape, w.shape]
+    params_flat = np.concatenate([theta.ravel(), w.ravel()])
+
+    doble = KernelCuantico(CAPAS, QUBITS, params_flat, shape_flat).fit(X, y)
+    simple = KernelCuantico(CAPAS, QUBITS, params_flat, shape_flat, precision="single").fit(X, y)
+    modelo = circuito_parametrico(CAPAS, QUBITS)
+    np.testing.assert_allclose(doble.estados_train, [modelo(x, theta, w) for x in X], atol=1e-10)
+    np.testing.assert_allclose(gram(simple.estados_train), gram(doble.estados_train), atol=1e-5)
+    np.testing.assert_array_equal(doble.predict(X), simple.predict(X))
@@ -0,0 +1,77 @@
+import numpy as np
+import pennylane as qml
+import pytest
+from pennylane import numpy as pnp
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.cost_functions import fidelity_cost
+from DRU_library.etiquetas import Etiquetas
+from DRU_library.lectura import Lectura
+from DRU_library.training import costo_batches, predict_proba
+
+N_QUBITS = 4
+
+
+def _estado(semilla):
+    rng = np.random.default_rng(semilla)
+    psi = rng.normal(size=2 ** N_QUBITS) + 1j * rng.normal(size=2 ** N_QUBITS)
+    return psi / np.linalg.norm(psi)
+
+
+@pytest.mark.parametrize("qubits", [[0], [0, 1], [2, 0], [1, 3, 2]])
+def test_reducida_y_marginal_igual_a_pennylane(qubits):
+    psi = _estado(0)
+    lectura = Lectura(qubits)
+    np.testing.assert_allclose(lectura.reducida(psi), qml.math.reduce_statevector(psi, indices=qubits),
+                               atol=1e-12)
+
+    @qml.qnode(qml.device("default.qubit", wires=N_QUBITS))
+    def circuito():
+        qml.StatePrep(psi, wires=range(N_QUBITS))
+        return qml.density_matrix(wires=qubits), qml.probs(wires=qubits)
+
+    densa, probs = circuito()
+    np.testing.assert_allclose(lectura.reducida(psi), densa, atol=1e-12)
+    np.testing.assert_allclose(lectura.marginal(psi), probs, atol=1e-12)
+    np.testing.assert_allclose(lectura.de_estados(psi[None])[0], probs, atol=1e-12)
+
+
+def test_clasificacion_selecciona_estados_etiqueta():
+    lectura = Lectura.clasificacion(3)
+    assert lectura.qubits == [0, 1] and list(lectura.estados) == [0, 1, 2]
+    estados = np.array([_estado(1), _estado(2)])
+    marginal = np.array([Lectura([0, 1]).marginal(e) for e in estados])
+    np.testing.assert_allclose(lectura.de_estados(estados), marginal[:, :3], atol=1e-12)
+    # la salida real (qml.probs del QNode) y la compleja dan lo mismo
+    np.testing.assert_allclose(lectura.probabilidades(marginal), lectura.probabilidades(estados), atol=1e-12)
+
+
+def test_marginal_admite_autograd():
+    @qml.qnode(qml.device("default.qubit", wires=2))
+    def estado(a):
+        qml.RY(a, wires=1)
+        qml.CNOT(wires=[1, 0])
+        return qml.state()
+
+    # p(qubit 0 = 0) = cos^2(a / 2)
+    f = lambda a: Lectura([0]).marginal(estado(a))[0]
+    assert qml.grad(f)(pnp.array(0.3, requires_grad=True)) == pytest.approx(-np.sin(0.3) / 2)
+
+
+def test_qnode_con_lectura_y_costo():
+    np.random.seed(0)
+    lectura = Lectura.clasificacion(3)
+    X = np.random.uniform(-1, 1, (4, 3))
+    theta, w = parametros(1, 2, qubits=3)
+    params_flat, shape_flat = flatten_params([theta, w])
+    esperadas = predict_proba(X, circuito_parametrico(2, 3), params_flat, shape_flat, lectura=lectura)
+
+    # un QNode que ya devuelve probabilidades no se vuelve a elevar al cuadrado
+    ruidoso = circuito_parametrico(2, 3, device="default.mixed", lectura=lectura)
+    np.testing.assert_allclose(predict_proba(X, ruidoso, params_flat, shape_flat, lectura=lectura),
+                               esperadas, atol=1e-10)
+    np.testing.assert_allclose(predict_proba(X, ruidoso, params_flat, shape_flat)[:, :3], esperadas,
+                               atol=1e-10)
+    with pytest.raises(ValueError):
+        costo_batches(params_flat, shape_flat, X, [0, 1, 2, 0], ruidoso, Etiquetas(3, 2), fidelity_cost,
+                      lectura=lectura)
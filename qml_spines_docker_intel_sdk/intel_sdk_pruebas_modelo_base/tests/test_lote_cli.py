@@ -0,0 +1,115 @@
+"""
+Evaluación por lotes reanudable (lote_cli.py) sobre ``cbindings_local``: reanudación tras
+una caída, ventana acotada de bloques en vuelo y resultados iguales a ``estados_dru``.
+"""
+
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from DRU_library import cbindings_local, lote_cli
+from DRU_library.base_functions import parametros
+from DRU_library.sdk_backend import angulos_lote
+from DRU_library.vector_estado import estados_dru
+
+from conftest import comparar_estados
+
+CAPAS, QUBITS, BLOQUE = 1, 2, 4
+
+
+@pytest.fixture
+def entrada(tmp_path):
+    np.random.seed(5)
+    X = np.random.uniform(-1, 1, (22, 3))
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    angulos, _ = angulos_lote(X, theta, w)
+    ruta = str(tmp_path / "angulos.npy")
+    np.save(ruta, angulos)
+    args = argparse.Namespace(modelo=None, capas=CAPAS, qubits=QUBITS, entrelazamiento="lineal")
+    plan = lote_cli._plan_modelo(args, angulos.shape[1])
+    return ruta, plan, estados_dru(X, theta, w, CAPAS, QUBITS)
+
+
+def test_reanuda_solo_los_bloques_pendientes(tmp_path, entrada, monkeypatch):
+    ruta, plan, esperados = entrada
+    salida = str(tmp_path / "resultados")
+    guardar = lote_cli._guardar_bloque
+    guardados = []
+
+    def caer_tras_dos(almacen, inicio, amplitudes, tiempos):
+        if len(guardados) == 2:
+            raise KeyboardInterrupt    # el proceso muere a mitad de la corrida
+        guardar(almacen, inicio, amplitudes, tiempos)
+        guardados.append(inicio)
+
+    monkeypatch.setattr(lote_cli, "_guardar_bloque", caer_tras_dos)
+    with pytest.raises(KeyboardInterrupt):
+        lote_cli.procesar(ruta, salida, plan, bloque=BLOQUE, cbindings=cbindings_local, registro=lambda m: None)
+    monkeypatch.setattr(lote_cli, "_guardar_bloque", guardar)
+
+    completados = np.load(tmp_path / "resultados" / "completados.npy")
+    assert completados.sum() == 2 * BLOQUE
+    assert lote_cli.bloques_pendientes(completados, BLOQUE) == [8, 12, 16, 20]
+    with open(tmp_path / "resultados" / "meta.json", encoding="utf8") as f:
+        assert json.load(f)["bloque"] == BLOQUE
+
+    procesar_bloque = lote_cli._procesar_bloque
+    procesados = []
+
+    def contar(tarea):
+        procesados.append(tarea[5])
+        return procesar_bloque(tarea)
+
+    monkeypatch.setattr(lote_cli, "_procesar_bloque", contar)
+    completadas, total, errores = lote_cli.procesar(ruta, salida, plan, bloque=BLOQUE,
+                                                    cbindings=cbindings_local, registro=lambda m: None)
+
+    assert procesados == [8, 12, 16, 20]
+    assert (completadas, total, errores) == (22, 22, 0)
+    comparar_estados(np.load(tmp_path / "resultados" / "amplitudes.npy"), esperados)
+
+    # una reanudación con otra configuración se rechaza
+    with pytest.raises(SystemExit):
+        lote_cli.procesar(ruta, salida, plan, bloque=8, cbindings=cbindings_local, registro=lambda m: None)
+
+
+def test_ventana_acotada_y_tareas_sin_filas(tmp_path, entrada, monkeypatch):
+    ruta, plan, _ = entrada
+    guardar = lote_cli._guardar_bloque
+    cuenta = {"enviados": 0, "guardados": 0, "en_vuelo": 0}
+
+    class Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            super().__init__(max_workers=1)
+
+        def submit(self, fn, tarea):
+            # solo viaja la ruta y el rango, nunca las filas
+            assert not any(isinstance(x, np.ndarray) for x in tarea)
+            cuenta["enviados"] += 1
+            cuenta["en_vuelo"] = max(cuenta["en_vuelo"], cuenta["enviados"] - cuenta["guardados"])
+            return super().submit(fn, tarea)
+
+    def contar(*args):
+        guardar(*args)
+        cuenta["guardados"] += 1
+
+    monkeypatch.setattr(lote_cli, "ProcessPoolExecutor", Pool)
+    monkeypatch.setattr(lote_cli, "_guardar_bloque", contar)
+    completadas, _, _ = lote_cli.procesar(ruta, str(tmp_path / "resultados"), plan, bloque=2, workers=2,
+                                          cbindings=cbindings_local, registro=lambda m: None)
+
+    assert completadas == 22 and cuenta["enviados"] == 11
+    assert cuenta["en_vuelo"] == lote_cli.VENTANA_POR_WORKER * 2
+
+
+def test_workers_en_procesos(tmp_path, entrada):
+    ruta, _, esperados = entrada
+    salida = tmp_path / "resultados"
+    codigo = lote_cli.main([ruta, "--capas", str(CAPAS), "--qubits", str(QUBITS), "--salida", str(salida),
+                            "--bloque", str(BLOQUE), "--workers", "2", "--local"])
+    assert codigo == 0
+    comparar_estados(np.load(salida / "amplitudes.npy"), esperados)
+    assert np.load(salida / "completados.npy").all()
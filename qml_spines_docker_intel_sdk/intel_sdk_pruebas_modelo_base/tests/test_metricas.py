@@ -0,0 +1,103 @@
+"""
+Registro de métricas en disco (metricas.py): agregados corrientes iguales a los de NumPy,
+reapertura tras un proceso interrumpido y reducciones para graficar series largas.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from DRU_library.metricas import RegistroMetricas, reducir_minmax, media_movil_en
+
+
+def test_agregados_iguales_a_numpy(tmp_path):
+    rng = np.random.default_rng(0)
+    loss = rng.normal(3, 2, 103)
+    acc = rng.uniform(0, 1, 10)
+    # bufer=7 no divide a 103: los agregados se combinan en tandas de distinto tamaño
+    with RegistroMetricas(str(tmp_path), bufer=7) as registro:
+        for i, valor in enumerate(loss):
+            registro.batch(epoca=i // 11, loss=valor)
+        for i, valor in enumerate(acc):
+            # una época sin acc_val: queda NaN en la columna y fuera de los agregados
+            fila = {"loss": loss[i]} if i == 4 else {"loss": loss[i], "acc_val": valor}
+            registro.epoca(**fila)
+
+    resumen = RegistroMetricas.abrir(str(tmp_path)).resumen("batch")["loss"]
+    assert resumen["n"] == len(loss)
+    assert resumen["media"] == pytest.approx(np.mean(loss), rel=1e-12)
+    assert resumen["desviacion"] == pytest.approx(np.std(loss), rel=1e-12)
+    assert (resumen["min"], resumen["max"], resumen["ultimo"]) == (loss.min(), loss.max(), loss[-1])
+    np.testing.assert_array_equal(registro.columna("batch", "loss"), loss)
+
+    acc_val = RegistroMetricas.abrir(str(tmp_path)).resumen("epoca")["acc_val"]
+    validos = np.delete(acc, 4)
+    assert acc_val["n"] == 9
+    assert acc_val["media"] == pytest.approx(np.mean(validos), rel=1e-12)
+    assert acc_val["desviacion"] == pytest.approx(np.std(validos), rel=1e-12)
+    assert np.isnan(registro.columna("epoca", "acc_val")[4])
+
+
+def test_reabrir_despues_de_truncar(tmp_path):
+    ruta = str(tmp_path)
+    valores = np.arange(20, dtype=float)
+    registro = RegistroMetricas(ruta, bufer=8)
+    for v in valores[:12]:
+        registro.batch(loss=v)
+    # el proceso muere con 4 filas en el búfer y media fila escrita tras el último metricas.json
+    assert registro.filas("batch") == 8
+    with open(os.path.join(ruta, "batch", "loss.f64"), "ab") as f:
+        f.write(np.array([99.0, 98.0]).tobytes()[:12])
+    del registro
+
+    registro = RegistroMetricas(ruta, bufer=8)
+    assert os.path.getsize(os.path.join(ruta, "batch", "loss.f64")) == 8 * 8
+    np.testing.assert_array_equal(registro.columna("batch", "loss"), valores[:8])
+    for v in valores[8:]:
+        registro.batch(loss=v)
+    registro.cerrar()
+
+    leido = RegistroMetricas.abrir(ruta)
+    np.testing.assert_array_equal(leido.columna("batch", "loss"), valores)
+    assert leido.resumen("batch")["loss"]["media"] == pytest.approx(np.mean(valores))
+    assert leido.resumen("batch")["loss"]["desviacion"] == pytest.approx(np.std(valores))
+    with pytest.raises(ValueError):
+        leido.batch(loss=1.0)
+    with pytest.raises(ValueError):
+        RegistroMetricas(ruta).batch(otra=1.0)
+    with pytest.raises(FileNotFoundError):
+        RegistroMetricas.abrir(str(tmp_path / "nada"))
+
+
+@pytest.mark.parametrize("n, puntos, bloque", [(10007, 200, 1000), (5000, 101, 1 << 20), (150, 200, 64)])
+def test_reducir_minmax_conserva_extremos(tmp_path, n, puntos, bloque):
+    rng = np.random.default_rng(1)
+    serie = rng.normal(0, 1, n)
+    serie[n // 3], serie[n - 1] = 50.0, -50.0          # picos que no pueden perderse
+    en_disco = np.memmap(tmp_path / "serie.f64", dtype=np.float64, mode="w+", shape=(n,))
+    en_disco[:] = serie
+
+    indices, valores = reducir_minmax(en_disco, puntos, bloque)
+    assert len(indices) <= puntos
+    assert np.all(np.diff(indices) >= 0)
+    np.testing.assert_array_equal(valores, serie[indices])
+    assert valores.max() == serie.max() and valores.min() == serie.min()
+    if n <= puntos:
+        np.testing.assert_array_equal(indices, np.arange(n))
+        return
+    # cada tramo aporta exactamente su mínimo y su máximo
+    tramo = -(-n // (puntos // 2))
+    for inicio in range(0, n, tramo):
+        tramo_serie = serie[inicio:inicio + tramo]
+        propios = valores[(indices >= inicio) & (indices < inicio + tramo)]
+        assert sorted(propios) == sorted([tramo_serie.min(), tramo_serie.max()])
+
+
+@pytest.mark.parametrize("window, bloque", [(1, 7), (10, 7), (10, 1 << 20), (33, 50)])
+def test_media_movil_en(window, bloque):
+    serie = np.random.default_rng(2).normal(0, 1, 500)
+    referencia = np.convolve(serie, np.ones(window) / window, mode="valid")   # termina en window-1..
+    indices = np.array([window - 1, window, 137, 250, 251, 499])
+    np.testing.assert_allclose(media_movil_en(serie, window, indices, bloque),
+                               referencia[indices - window + 1], atol=1e-12)
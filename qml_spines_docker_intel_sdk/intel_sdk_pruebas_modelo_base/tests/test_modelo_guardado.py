@@ -0,0 +1,52 @@
+"""
+Carga de un modelo guardado (modelo_guardado.py / inferencia.py) sin PennyLane, sklearn ni
+matplotlib: ``import DRU_library`` no los importa y ``ModeloDRU`` da las mismas
+probabilidades que ``training.predict_proba``.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.lectura import Lectura
+from DRU_library.modelo_guardado import guardar_modelo
+from DRU_library.training import predict_proba
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CARGA_SIN_DEPENDENCIAS = textwrap.dedent("""
+    import sys
+    for nombre in ("pennylane", "sklearn", "matplotlib"):
+        sys.modules[nombre] = None          # cualquier import de ellos falla
+    import numpy as np
+    import DRU_library
+    from DRU_library.modelo_guardado import cargar_modelo
+
+    modelo = DRU_library.cargar_modelo(sys.argv[1])
+    assert modelo.__class__.__name__ == "ModeloDRU" and cargar_modelo is DRU_library.cargar_modelo
+    np.save(sys.argv[3], modelo.predict_proba(np.load(sys.argv[2])))
+""")
+
+
+def test_carga_sin_pennylane_ni_sklearn(tmp_path):
+    np.random.seed(4)
+    capas, qubits, C = 2, 3, 3
+    X = np.random.uniform(-1, 1, (25, 4))
+    theta, w = parametros(2, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    lectura = Lectura.clasificacion(C)
+    ruta = guardar_modelo(str(tmp_path / "modelo.npz"), capas, qubits, params_flat, shape_flat,
+                          entrelazamiento='full', lectura=lectura, copiar_runtime=False)
+    np.save(tmp_path / "X.npy", X)
+
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join([RAIZ, os.environ.get("PYTHONPATH", "")]))
+    subprocess.run([sys.executable, "-c", CARGA_SIN_DEPENDENCIAS, ruta, str(tmp_path / "X.npy"),
+                    str(tmp_path / "probs.npy")], check=True, env=entorno, cwd=tmp_path)
+
+    modelo = circuito_parametrico(capas, qubits, 'full')
+    esperadas = predict_proba(X, modelo, params_flat, shape_flat, lectura)
+    np.testing.assert_allclose(np.load(tmp_path / "probs.npy"), esperadas, atol=1e-12)
@@ -0,0 +1,133 @@
+"""
+Motor MPS (mps.py) y su camino de entrenamiento (``GradienteMPS``) contra ``estados_dru`` y
+PennyLane en default.qubit.
+"""
+
+import numpy as np
+import pennylane as qml
+import pytest
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.base_functions import generar_etiquetas
+from DRU_library.cost_functions import fidelity_cost
+from DRU_library.gradientes_sdk import GradienteMPS
+from DRU_library.lectura import Lectura
+from DRU_library.mps import mps_dru, circuito_mps, probabilidades_mps
+from DRU_library.training import make_cost_fn, fit
+from DRU_library.vector_estado import estados_dru
+
+CAPAS, QUBITS, C = 3, 4, 3
+
+
+@pytest.fixture
+def problema():
+    np.random.seed(0)
+    X = np.random.uniform(-1, 1, (6, 5))
+    y = np.random.randint(0, C, len(X))
+    theta, w = parametros(2, CAPAS, qubits=QUBITS)
+    return X, y, theta, w
+
+
+@pytest.mark.parametrize("entrelazamiento", ["lineal", "No"])
+def test_mps_dru_contra_estados_dru_y_qnode(problema, entrelazamiento):
+    X, _, theta, w = problema
+    estado = mps_dru(X, theta, w, CAPAS, QUBITS, entrelazamiento)
+    amplitudes = estado.amplitudes(np.arange(2 ** QUBITS))
+
+    modelo = circuito_parametrico(CAPAS, QUBITS, entrelazamiento)
+    referencia = np.array([modelo(x, theta, w) for x in X])
+
+    np.testing.assert_allclose(amplitudes, estados_dru(X, theta, w, CAPAS, QUBITS, entrelazamiento),
+                               atol=1e-10)
+    np.testing.assert_allclose(amplitudes, referencia, atol=1e-10)
+    assert np.all(estado.error_truncamiento < 1e-20)
+    if entrelazamiento == "No":
+        assert estado.enlaces == [1] * (QUBITS - 1)
+
+
+def test_truncamiento_acota_la_infidelidad():
+    np.random.seed(3)
+    capas, qubits = 4, 8
+    X = np.random.uniform(-1, 1, (5, 6))
+    theta, w = parametros(2, capas, qubits=qubits)
+    exacto = estados_dru(X, theta, w, capas, qubits)
+
+    truncado = mps_dru(X, theta, w, capas, qubits, max_enlace=4)
+    amplitudes = truncado.amplitudes(np.arange(2 ** qubits))
+    infidelidad = 1 - np.abs(np.sum(exacto.conj() * amplitudes, axis=1)) ** 2
+
+    assert max(truncado.enlaces) == 4
+    assert np.all(truncado.error_truncamiento > 0)
+    np.testing.assert_allclose(np.linalg.norm(amplitudes, axis=1), 1, atol=1e-10)
+    assert np.all(infidelidad > 1e-6)
+    assert np.all(infidelidad <= 2 * truncado.error_truncamiento + 1e-10)
+
+    # con enlace 2**(n/2) no se descarta nada
+    completo = mps_dru(X, theta, w, capas, qubits, max_enlace=2 ** (qubits // 2))
+    np.testing.assert_allclose(completo.amplitudes(np.arange(2 ** qubits)), exacto, atol=1e-10)
+
+
+def test_marginales_contra_lectura(problema):
+    X, _, theta, w = problema
+    lectura = Lectura.clasificacion(C)
+    estados = estados_dru(X, theta, w, CAPAS, QUBITS)
+    np.testing.assert_allclose(probabilidades_mps(X, theta, w, CAPAS, QUBITS, lectura, lote=4),
+                               lectura.de_estados(estados), atol=1e-10)
+
+    lectura = Lectura([2, 0])
+    np.testing.assert_allclose(mps_dru(X, theta, w, CAPAS, QUBITS).marginales([2, 0]),
+                               lectura.de_estados(estados), atol=1e-10)
+
+
+def test_circuito_mps_acepta_muestras_codificadas(problema):
+    X, _, theta, w = problema
+    lectura = Lectura.clasificacion(C)
+    modelo = circuito_mps(CAPAS, QUBITS, lectura)
+    qnode = circuito_parametrico(CAPAS, QUBITS, lectura=lectura)
+    # re_dim: 5 características -> 2 subcapas de 3, con un cero de relleno
+    codificadas = np.pad(X, ((0, 0), (0, 1))).reshape(len(X), 2, 3)
+
+    for x, c in zip(X, codificadas):
+        # una muestra cruda y la misma ya codificada dan lo mismo que el QNode
+        np.testing.assert_allclose(modelo(x, theta, w), qnode(x, theta, w), atol=1e-10)
+        np.testing.assert_allclose(modelo(c, theta, w), qnode(c, theta, w), atol=1e-10)
+    # un lote codificado (N, subcapas, 3)
+    np.testing.assert_allclose(modelo(codificadas, theta, w),
+                               np.array([qnode(x, theta, w) for x in X]), atol=1e-10)
+
+
+def test_gradiente_mps_igual_a_qml_grad(problema):
+    X, y, theta, w = problema
+    params_flat, shape_flat = flatten_params([theta, w])
+    _, etiquetas = generar_etiquetas(C)
+    lectura = Lectura.clasificacion(C)
+    costo = make_cost_fn(X, y, circuito_parametrico(CAPAS, QUBITS), etiquetas, shape_flat,
+                         fidelity_cost, lectura)
+
+    gradiente = GradienteMPS(CAPAS, QUBITS, lectura, max_enlace=None, lote=7)
+    loss, grad = gradiente(params_flat, shape_flat, X, y)
+
+    assert abs(loss - costo(params_flat)) < 1e-8
+    np.testing.assert_allclose(grad, qml.grad(costo)(params_flat), atol=1e-8)
+    assert gradiente.ejecuciones == len(X) * (len(params_flat) + 1)
+
+
+def test_fit_con_gradiente_mps_en_muchos_qubits():
+    # 30 qubits: el vector de estado no cabe, el MPS con enlace 4 sí
+    np.random.seed(2)
+    capas, qubits, C2 = 1, 30, 2
+    X = np.random.uniform(-1, 1, (6, 3))
+    y = (X[:, 0] > 0).astype(int)
+    theta, w = parametros(1, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    _, etiquetas = generar_etiquetas(C2)
+    lectura = Lectura.clasificacion(C2)
+
+    with GradienteMPS(capas, qubits, lectura, max_enlace=4) as gradiente:
+        _, historia = fit(circuito_mps(capas, qubits, lectura, max_enlace=4), etiquetas,
+                          X, y, X, y, params_flat, shape_flat, fidelity_cost, epochs=2,
+                          batch_size=6, stepsize=0.1, gradiente=gradiente, lectura=lectura)
+
+    assert len(historia["loss"]) == 2
+    assert np.all(np.isfinite(historia["loss"]))
+    assert historia["loss"][1] < historia["loss"][0]
@@ -0,0 +1,57 @@
+import numpy as np
+
+from DRU_library import sdk_backend
+from DRU_library.base_functions import parametros
+from DRU_library.lectura import Lectura
+from DRU_library.muestreo import conteos, estimar_probabilidades, histograma, indices_muestras
+from DRU_library.vector_estado import estados_dru
+
+
+def test_conteos_suman_los_shots():
+    rng = np.random.default_rng(0)
+    probs = rng.dirichlet(np.ones(8), size=5)
+    c = conteos(probs, 1000, semilla=1)
+    assert c.shape == (5, 8) and c.dtype.kind == "i"
+    assert np.all(c.sum(axis=1) == 1000)
+    np.testing.assert_array_equal(conteos(probs, 1000, semilla=1), c)
+
+
+def test_conteos_con_lectura_parcial_descartan_el_resto():
+    probs = np.array([[0.2, 0.3], [0.0, 0.1]])       # el resto (0.5, 0.9) es "otro"
+    c = conteos(probs, 20000, semilla=2)
+    assert np.all(c.sum(axis=1) < 20000)
+    np.testing.assert_allclose(c / 20000, probs, atol=0.015)
+
+
+def test_estimar_probabilidades_converge():
+    probs = np.array([0.1, 0.2, 0.3, 0.4])
+    np.testing.assert_allclose(estimar_probabilidades(probs, 200000, semilla=3)[0], probs, atol=5e-3)
+
+
+def test_histograma_igual_a_un_bucle():
+    rng = np.random.default_rng(4)
+    bits = rng.integers(0, 2, size=(3, 500, 3))
+    h = histograma(bits)
+    assert h.shape == (3, 8) and np.all(h.sum(axis=1) == 500)
+    for n in range(3):
+        esperado = np.zeros(8, dtype=int)
+        for fila in bits[n]:
+            esperado[int("".join(map(str, fila)), 2)] += 1
+        np.testing.assert_array_equal(h[n], esperado)
+    np.testing.assert_array_equal(histograma(bits[0]), h[:1])
+    assert indices_muestras([1, 0, 0]) == 4            # qubit 0 es el bit más significativo
+
+
+def test_probabilidades_sdk_con_shots(gestor):
+    np.random.seed(5)
+    theta, w = parametros(1, 2, qubits=3)
+    X = np.random.uniform(-1, 1, (3, 3))
+    lectura = Lectura.clasificacion(3)
+    exactas = lectura.de_estados(estados_dru(X, theta, w, 2, 3))
+    frecuencias = sdk_backend.probabilidades_sdk(X, theta, w, 2, 3, lectura, gestor=gestor,
+                                                 shots=40000, semilla=6)
+    assert frecuencias.shape == exactas.shape
+    np.testing.assert_allclose(frecuencias, exactas, atol=0.02)
+    muestreadas = sdk_backend.probabilidades_sdk(X, theta, w, 2, 3, lectura, gestor=gestor, shots=20000,
+                                                 metodo="getSamples")
+    np.testing.assert_allclose(muestreadas, exactas, atol=0.03)
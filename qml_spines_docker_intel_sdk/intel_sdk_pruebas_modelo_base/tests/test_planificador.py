@@ -0,0 +1,111 @@
+"""
+Planificador asíncrono (planificador.py) sobre ``cbindings_local``: orden de los resultados,
+errores por trabajo, límite de compilaciones simultáneas y uso dentro de un event loop.
+"""
+
+import asyncio
+
+import numpy as np
+
+from DRU_library import cbindings_local
+from DRU_library.planificador import Planificador, Trabajo, ejecutar_trabajos
+
+
+def qasm_base(n_qubits, unos):
+    """|b> con X en los qubits ``unos``."""
+    lineas = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{n_qubits}];"]
+    lineas += [f"x q[{q}];" for q in unos]
+    return "\n".join(lineas) + "\n"
+
+
+def indice(n_qubits, unos):
+    # orden de PennyLane: el qubit 0 es el bit más significativo
+    return sum(1 << (n_qubits - 1 - q) for q in unos)
+
+
+def test_resultados_en_orden_de_entrada(retardos):
+    # la ejecución tarda más que la compilación: los trabajos se preparan por delante
+    retardos(callCppFunction=0.01)
+    casos = [(3, (0,)), (2, ()), (3, (1, 2)), (1, (0,)), (3, (0,)), (2, (1,))]
+    trabajos = [Trabajo(qasm=qasm_base(n, unos), n_qubits=n) for n, unos in casos]
+    resultados = ejecutar_trabajos(trabajos, cbindings=cbindings_local, max_compiladores=2, capacidad=2)
+
+    assert [r.indice for r in resultados] == list(range(len(casos)))
+    for r, (n, unos) in zip(resultados, casos):
+        assert r.ok and r.trabajo is trabajos[r.indice]
+        esperado = np.zeros(2 ** n)
+        esperado[indice(n, unos)] = 1
+        np.testing.assert_allclose(np.abs(r.valor) ** 2, esperado, atol=1e-12)
+        assert set(r.tiempos) == {"traduccion", "compilacion", "ejecucion"}
+
+
+def test_errores_quedan_en_su_resultado():
+    def ejecutar(so_path, trabajo):
+        if trabajo.n_qubits == 2:
+            raise RuntimeError("falla al ejecutar")
+        return so_path
+
+    trabajos = [
+        Trabajo(qasm=qasm_base(1, (0,)), n_qubits=1),
+        Trabajo(qasm="esto no es qasm", n_qubits=1),
+        # el compilador rechaza la puerta desconocida
+        Trabajo(cpp="qbit q[1];\nquantum_kernel void my_kernel() {\n  Foo(q[0]);\n}\n", n_qubits=1),
+        Trabajo(qasm=qasm_base(2, ()), n_qubits=2),
+        Trabajo(qasm=qasm_base(1, ()), n_qubits=1),
+    ]
+    resultados = ejecutar_trabajos(trabajos, cbindings=cbindings_local, ejecutar=ejecutar)
+
+    assert [r.ok for r in resultados] == [True, False, False, False, True]
+    assert [r.etapa for r in resultados] == [None, "traduccion", "compilacion", "ejecucion", None]
+    assert resultados[0].valor.endswith(".so") and resultados[4].valor.endswith(".so")
+
+
+def test_limite_de_compilaciones(retardos, monkeypatch):
+    retardos(compilar=0.2)
+    original = asyncio.create_subprocess_exec
+    activos, maximo, llamadas = 0, 0, 0
+
+    async def contar(*args, **kwargs):
+        nonlocal activos, maximo, llamadas
+        proc = await original(*args, **kwargs)
+        llamadas += 1
+        activos += 1
+        maximo = max(maximo, activos)
+        comunicar = proc.communicate
+
+        async def communicate():
+            nonlocal activos
+            try:
+                return await comunicar()
+            finally:
+                activos -= 1
+
+        proc.communicate = communicate
+        return proc
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", contar)
+    # 5 fuentes distintas y una repetida: la repetida se compila una sola vez
+    trabajos = [Trabajo(qasm=qasm_base(5, (q,)), n_qubits=5) for q in range(5)]
+    trabajos.append(Trabajo(qasm=qasm_base(5, (0,)), n_qubits=5))
+    resultados = ejecutar_trabajos(trabajos, cbindings=cbindings_local, max_compiladores=2, capacidad=6)
+
+    assert all(r.ok for r in resultados)
+    assert llamadas == 5
+    assert maximo == 2
+
+
+def test_ejecutar_dentro_de_un_event_loop():
+    trabajos = [Trabajo(qasm=qasm_base(2, (1,)), n_qubits=2), Trabajo(qasm=qasm_base(1, ()), n_qubits=1)]
+
+    async def principal():
+        with Planificador(cbindings=cbindings_local) as plan:
+            # como en Jupyter: ejecutar() con un loop ya corriendo, y procesar() con await
+            sincronos = plan.ejecutar(trabajos)
+            asincronos = await plan.procesar(trabajos)
+        return sincronos, asincronos
+
+    sincronos, asincronos = asyncio.run(principal())
+    for a, b in zip(sincronos, asincronos):
+        assert a.ok and b.ok
+        np.testing.assert_allclose(np.abs(a.valor), np.abs(b.valor), atol=1e-12)
+    assert np.abs(sincronos[0].valor[indice(2, (1,))]) == 1
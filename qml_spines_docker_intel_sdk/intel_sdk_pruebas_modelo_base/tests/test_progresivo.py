@@ -0,0 +1,64 @@
+"""
+Entrenamiento progresivo (progresivo.py) con capas congeladas: solo se deriva respecto de
+los parámetros entrenables y los fijos no cambian ni en el último bit.
+"""
+
+import numpy as np
+import pennylane as qml
+from pennylane import numpy as pnp
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params, generar_etiquetas
+from DRU_library.cost_functions import fidelity_cost
+from DRU_library.lectura import Lectura
+from DRU_library.progresivo import fit_progresivo, mascara_capas
+from DRU_library.training import fit, make_cost_fn, gradiente_entrenables
+
+QUBITS, C = 2, 2
+
+
+def datos(n, semilla):
+    rng = np.random.default_rng(semilla)
+    X = rng.uniform(-1, 1, (n, 3))
+    return X, (X[:, 0] > 0).astype(int)
+
+
+def test_gradiente_solo_de_los_entrenables():
+    X, y = datos(6, 0)
+    np.random.seed(0)
+    params_flat, shape_flat = flatten_params(parametros(1, 2, qubits=QUBITS))
+    params_flat = pnp.array(params_flat, requires_grad=True)
+    _, etiquetas = generar_etiquetas(C)
+    costo = make_cost_fn(X, y, circuito_parametrico(2, QUBITS), etiquetas, shape_flat, fidelity_cost,
+                         Lectura.clasificacion(C))
+    mascara = mascara_capas(shape_flat, 2, [1])
+
+    grad = gradiente_entrenables(costo, mascara)(params_flat)
+    assert np.all(grad[~mascara] == 0)
+    np.testing.assert_allclose(grad[mascara], qml.grad(costo)(params_flat)[mascara], atol=1e-12)
+
+
+def test_capas_congeladas_quedan_identicas():
+    X, y = datos(8, 1)
+    X_val, y_val = datos(4, 2)
+    _, etiquetas = generar_etiquetas(C)
+    lectura = Lectura.clasificacion(C)
+    np.random.seed(1)
+    params_flat, shape_flat = flatten_params(parametros(1, 2, qubits=QUBITS))
+    params_flat = pnp.array(params_flat, requires_grad=True)
+    mascara = mascara_capas(shape_flat, 2, [1])
+
+    _, historia = fit(circuito_parametrico(2, QUBITS), etiquetas, X, y, X_val, y_val, params_flat,
+                      shape_flat, fidelity_cost, epochs=2, batch_size=4, acc_stop=1.1, lectura=lectura,
+                      entrenables=mascara)
+    for params in historia["params"]:
+        np.testing.assert_array_equal(params[~mascara], params_flat[~mascara])
+        assert np.any(params[mascara] != params_flat[mascara])
+
+    # en fit_progresivo la capa 0 queda fija durante la etapa de 2 capas
+    best, shape_final, historias = fit_progresivo(etiquetas, X, y, X_val, y_val, 2, QUBITS, fidelity_cost,
+                                                  lectura=lectura, epochs_por_capa=2, congelar=True,
+                                                  batch_size=4, acc_stop=1.1)
+    fija = ~mascara_capas(shape_final, 2, [1])
+    inicio = historias[1]["params"][0][fija]
+    for params in historias[1]["params"][1:] + [best]:
+        np.testing.assert_array_equal(params[fija], inicio)
@@ -0,0 +1,71 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from DRU_library import sdk_backend
+from DRU_library.base_functions import circuito_parametrico, parametros
+from DRU_library.intel_device import IntelSDKDevice
+
+from conftest import comparar_estados
+
+ENTRELAZAMIENTOS = ["No", "lineal", "full", "circular"]
+CAPAS, QUBITS = 2, 3
+
+
+def _sesion(gestor, entrelazamiento, subcapas):
+    ops = sdk_backend.operaciones_dru(CAPAS, QUBITS, subcapas, entrelazamiento)
+    n_params = CAPAS * subcapas * QUBITS * 3
+    so_path = sdk_backend.compilar_kernel(sdk_backend.kernel_cpp(ops, QUBITS, n_params),
+                                          gestor.directorio, cbindings=gestor.cb)
+    return sdk_backend.SesionSDK(so_path, QUBITS, n_params, gestor=gestor).abrir()
+
+
+@pytest.mark.parametrize("entrelazamiento", ENTRELAZAMIENTOS)
+def test_ejecutar_lote_igual_a_default_qubit(gestor, entrelazamiento):
+    rng = np.random.default_rng(0)
+    theta, w = parametros(2, CAPAS, qubits=QUBITS)
+    X = rng.uniform(-np.pi, np.pi, (6, 6))
+    angulos, subcapas = sdk_backend.angulos_lote(X, theta, w)
+
+    estados = _sesion(gestor, entrelazamiento, subcapas).ejecutar_lote(angulos)
+
+    modelo = circuito_parametrico(CAPAS, QUBITS, entrelazamiento)
+    esperados = np.array([modelo(x, theta, w) for x in X])
+    comparar_estados(estados, esperados)
+
+
+def test_prepz_reinicia_entre_llamadas(gestor):
+    # cada llamada al kernel empieza en |0...0> (salvo fase): el resultado no depende de la anterior
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    X = np.random.default_rng(1).uniform(-np.pi, np.pi, (4, 3))
+    angulos, subcapas = sdk_backend.angulos_lote(X, theta, w)
+    sesion = _sesion(gestor, "lineal", subcapas)
+
+    primera = sesion.ejecutar_lote(angulos)
+    comparar_estados(sesion.ejecutar_lote(angulos), primera)
+    comparar_estados(sesion.ejecutar_lote(angulos[::-1])[::-1], primera)
+
+
+@pytest.mark.parametrize("backend", ["intel.qd_sim", "intel.iqs"])
+def test_intel_device_igual_a_default_qubit(gestor, backend):
+    theta, w = parametros(1, CAPAS, qubits=QUBITS)
+    X = np.random.default_rng(2).uniform(-np.pi, np.pi, (3, 3))
+    dev = IntelSDKDevice(wires=QUBITS, backend=backend, gestor=gestor)
+    modelo = circuito_parametrico(CAPAS, QUBITS, "full", device=dev)
+    referencia = circuito_parametrico(CAPAS, QUBITS, "full")
+    for x in X:
+        comparar_estados(modelo(x, theta, w), referencia(x, theta, w))
+
+
+def test_intel_device_lote_de_tapes(gestor):
+    def tape(a, medida):
+        return qml.tape.QuantumScript([qml.Hadamard(0), qml.RY(a, 1), qml.CNOT([1, 2]), qml.RZ(a / 3, 2),
+                                       qml.RX(-a, 0)], [medida])
+
+    angulos = [0.1, 0.7, 2.3]
+    referencia = qml.device("default.qubit", wires=3)
+    dev = IntelSDKDevice(wires=3, gestor=gestor)
+    estados = [tape(a, qml.state()) for a in angulos]
+    comparar_estados(qml.execute(estados, dev), qml.execute(estados, referencia))
+    probs = [tape(a, qml.probs(wires=[0, 2])) for a in angulos]
+    np.testing.assert_allclose(qml.execute(probs, dev), qml.execute(probs, referencia), atol=1e-10)
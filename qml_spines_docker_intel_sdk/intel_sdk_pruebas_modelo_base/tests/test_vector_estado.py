@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from DRU_library.base_functions import circuito_parametrico, parametros, flatten_params
+from DRU_library.lectura import Lectura
+from DRU_library.training import accuracy, predict_proba
+from DRU_library.vector_estado import estados_dru
+
+# complex64 acumula ~1e-7 por compuerta; con unas decenas de compuertas el error queda < 1e-5
+TOL_SINGLE = 1e-5
+TOL_DOUBLE = 1e-10
+
+
+@pytest.mark.parametrize("entrelazamiento", ["No", "lineal", "full", "circular"])
+def test_estados_dru_contra_qnode(entrelazamiento):
+    np.random.seed(0)
+    capas, qubits = 3, 4
+    X = np.random.uniform(-1, 1, (9, 5))
+    theta, w = parametros(2, capas, qubits=qubits)
+    modelo = circuito_parametrico(capas, qubits, entrelazamiento)
+    referencia = np.array([modelo(x, theta, w) for x in X])
+
+    # lote=4 no divide a 9: también se prueba el último bloque incompleto
+    doble = estados_dru(X, theta, w, capas, qubits, entrelazamiento, lote=4)
+    simple = estados_dru(X, theta, w, capas, qubits, entrelazamiento, lote=4, precision="single")
+
+    assert doble.dtype == np.complex128 and simple.dtype == np.complex64
+    np.testing.assert_allclose(doble, referencia, atol=TOL_DOUBLE)
+    np.testing.assert_allclose(simple, doble, atol=TOL_SINGLE)
+    np.testing.assert_allclose(simple, referencia, atol=TOL_SINGLE)
+
+
+def test_accuracy_single_igual_a_double():
+    np.random.seed(1)
+    capas, qubits, C = 2, 4, 3
+    X = np.random.uniform(-1, 1, (200, 3))
+    theta, w = parametros(1, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    lectura = Lectura.clasificacion(C)
+    doble = circuito_parametrico(capas, qubits, precision="double")
+    simple = circuito_parametrico(capas, qubits, precision="single")
+
+    p_doble = predict_proba(X, doble, params_flat, shape_flat, lectura=lectura)
+    p_simple = predict_proba(X, simple, params_flat, shape_flat, lectura=lectura)
+    np.testing.assert_allclose(p_simple, p_doble, atol=TOL_SINGLE)
+
+    # la clase solo puede cambiar donde las dos más probables están a menos de la tolerancia
+    orden = np.sort(p_doble, axis=1)
+    dudosas = orden[:, -1] - orden[:, -2] < 2 * TOL_SINGLE
+    iguales = np.argmax(p_simple, axis=1) == np.argmax(p_doble, axis=1)
+    assert np.all(iguales[~dudosas])
+
+    y = np.random.randint(0, C, len(X))
+    acc_doble = accuracy(X, y, doble, params_flat, shape_flat, lectura=lectura)
+    acc_simple = accuracy(X, y, simple, params_flat, shape_flat, lectura=lectura)
+    assert abs(acc_simple - acc_doble) <= np.mean(dudosas)
+
+
+def test_buffer_reutilizado_entre_llamadas(monkeypatch):
+    from DRU_library import vector_estado
+    np.random.seed(2)
+    capas, qubits = 2, 3
+    X = np.random.uniform(-1, 1, (10, 3))
+    theta, w = parametros(1, capas, qubits=qubits)
+    params_flat, shape_flat = flatten_params([theta, w])
+    modelo = circuito_parametrico(capas, qubits, precision="single")
+    referencia = predict_proba(X, circuito_parametrico(capas, qubits, precision="single"),
+                               params_flat, shape_flat)
+
+    creados = []
+    original = vector_estado.BufferEstado
+    monkeypatch.setattr(vector_estado, "BufferEstado",
+                        lambda *a, **k: creados.append(1) or original(*a, **k))
+    primera = predict_proba(X, modelo, params_flat, shape_flat)
+    buffer = modelo.arquitectura["buffer"]
+    # lotes más chicos o iguales usan los mismos buffers; uno más grande los reemplaza
+    segunda = predict_proba(X, modelo, params_flat, shape_flat)
+    predict_proba(X[:4], modelo, params_flat, shape_flat)
+    assert creados == [1] and modelo.arquitectura["buffer"] is buffer
+    np.testing.assert_array_equal(primera, referencia)
+    np.testing.assert_array_equal(segunda, referencia)
+    predict_proba(np.vstack([X, X]), modelo, params_flat, shape_flat)
+    assert creados == [1, 1] and modelo.arquitectura["buffer"].lote == 20
+
+    # pasado a mano, estados_dru escribe en él y no reserva otro
+    propio = original(qubits, 4, "double")
+    estados = estados_dru(X, theta, w, capas, qubits, lote=4, buffer=propio)
+    assert creados == [1, 1]
+    np.testing.assert_allclose(estados, estados_dru(X, theta, w, capas, qubits), atol=TOL_DOUBLE)
@@ -1,22 +1,23 @@
 import os
-import shutil
+import sys
 import intelqsdk.cbindings
 from openqasm_bridge.v2 import translate
 
+# DRU_library está en intel_sdk_pruebas_modelo_base, junto a esta carpeta
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "intel_sdk_pruebas_modelo_base"))
+from DRU_library.artefactos import Artefactos
+
 # ----------------------------
 # Rutas base
 # ----------------------------
 SDK_BASE = "/opt/intel/quantum-sdk/docker-intel_quantum_sdk_1.1.1.2024-11-15T22_03_32+00_00"
-RUN_DIR = os.path.join(SDK_BASE, "quantum_runs")
 WORKSPACE_DIR = "/workspace/test_simulador"
 
 # ----------------------------
-# Crear carpeta de ejecución si no existe
+# Directorio de trabajo en RAM; solo lo pedido con conservar llega al workspace
 # ----------------------------
-os.makedirs(RUN_DIR, exist_ok=True)
-
-# Cambiar directorio de trabajo a RUN_DIR
-os.chdir(RUN_DIR)
+art = Artefactos(destino=WORKSPACE_DIR, prefijo="ghz_")
+os.chdir(art.directorio)
 
 # Ajustar variables de entorno necesarias
 os.environ["LD_LIBRARY_PATH"] = f"{SDK_BASE}/lib:{SDK_BASE}/virtualenv/lib:{os.environ.get('LD_LIBRARY_PATH','')}"
@@ -40,11 +41,8 @@ cx qubit_register[3],qubit_register[4];
 # Traducir a C++ usando OpenQASM bridge
 translated = translate(qasm_example, kernel_name='my_kernel')
 
-# Guardar el .cpp en RUN_DIR
-cpp_path = os.path.join(RUN_DIR, "ghz.cpp")
-with open(cpp_path, "w", encoding="utf8") as f:
-    for line in translated:
-        f.write(line + "\n")
+# Guardar el .cpp en el directorio de trabajo
+cpp_path = art.escribir("ghz.cpp", translated)
 
 # Nombre del SDK
 sdk_name = "ghz"
@@ -87,13 +85,10 @@ probabilities_2 = iqs_device.getProbabilities(qbit_ref, index_vec, 0.1)
 intelqsdk.cbindings.FullStateSimulator.displayProbabilities(probabilities_2)
 
 # ----------------------------
-# Copiar todos los archivos generados de vuelta a WORKSPACE_DIR
+# Copiar al workspace la fuente y los intermedios legibles; el resto se borra
 # ----------------------------
-for filename in os.listdir(RUN_DIR):
-    src_path = os.path.join(RUN_DIR, filename)
-    dest_path = os.path.join(WORKSPACE_DIR, filename)
-    # Copiar solo archivos (no subcarpetas)
-    if os.path.isfile(src_path):
-        shutil.copy2(src_path, dest_path)
-
-print(f"\nTodos los resultados han sido copiados a: {WORKSPACE_DIR}")
+art.conservar("ghz.cpp", "ghz.ll", "ghz.qs")
+os.chdir(WORKSPACE_DIR)
+art.cerrar()
+
+print(f"\nghz.cpp, ghz.ll y ghz.qs copiados a: {WORKSPACE_DIR}")
@@ -1,20 +1,23 @@
 import os
-import shutil
+import sys
 import intelqsdk.cbindings
 from openqasm_bridge.v2 import translate
 
+# DRU_library está en intel_sdk_pruebas_modelo_base, junto a esta carpeta
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "intel_sdk_pruebas_modelo_base"))
+from DRU_library.artefactos import Artefactos
+
 # ----------------------------
 # Rutas base
 # ----------------------------
 SDK_BASE = "/opt/intel/quantum-sdk/docker-intel_quantum_sdk_1.1.1.2024-11-15T22_03_32+00_00"
-RUN_DIR = os.path.join(SDK_BASE, "quantum_runs")
 WORKSPACE_DIR = "/workspace/test_simulador"
 
 # ----------------------------
 # Preparar entorno
 # ----------------------------
-os.makedirs(RUN_DIR, exist_ok=True)
-os.chdir(RUN_DIR)
+art = Artefactos(destino=WORKSPACE_DIR, prefijo="ghz_")
+os.chdir(art.directorio)
 os.environ["LD_LIBRARY_PATH"] = f"{SDK_BASE}/lib:{SDK_BASE}/virtualenv/lib:{os.environ.get('LD_LIBRARY_PATH','')}"
 compiler_path = os.path.join(SDK_BASE, "intel-quantum-compiler")
 
@@ -34,10 +37,7 @@ cx qubit_register[3],qubit_register[4];
 # Traducir a C++ usando OpenQASM bridge
 translated = translate(qasm_example, kernel_name='my_kernel')
 
-cpp_path = os.path.join(RUN_DIR, "ghz.cpp")
-with open(cpp_path, "w", encoding="utf8") as f:
-    for line in translated:
-        f.write(line + "\n")
+cpp_path = art.escribir("ghz.cpp", translated)
 
 # ----------------------------
 # Compilar y ejecutar
@@ -72,21 +72,10 @@ probabilities_2 = iqs_device.getProbabilities(qbit_ref, index_vec, 0.1)
 intelqsdk.cbindings.FullStateSimulator.displayProbabilities(probabilities_2)
 
 # ----------------------------
-# Copiar resultados al workspace
+# Copiar resultados al workspace y borrar el directorio de trabajo
 # ----------------------------
-for filename in os.listdir(RUN_DIR):
-    src_path = os.path.join(RUN_DIR, filename)
-    dest_path = os.path.join(WORKSPACE_DIR, filename)
-    if os.path.isfile(src_path):
-        shutil.copy2(src_path, dest_path)
-
-print(f"\nTodos los resultados han sido copiados a: {WORKSPACE_DIR}")
+art.conservar("ghz.cpp", "ghz.ll", "ghz.qs")
+os.chdir(WORKSPACE_DIR)
+art.cerrar()
 
-# ----------------------------
-# Limpieza automática
-# ----------------------------
-for filename in os.listdir(RUN_DIR):
-    try:
-        os.remove(os.path.join(RUN_DIR, filename))
-    except Exception:
-        pass
+print(f"\nghz.cpp, ghz.ll y ghz.qs copiados a: {WORKSPACE_DIR}")
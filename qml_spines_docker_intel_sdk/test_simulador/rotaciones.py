@@ -1,20 +1,23 @@
 import os
-import shutil
+import sys
 import intelqsdk.cbindings
 from openqasm_bridge.v2 import translate
 
+# DRU_library está en intel_sdk_pruebas_modelo_base, junto a esta carpeta
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "intel_sdk_pruebas_modelo_base"))
+from DRU_library.artefactos import Artefactos
+
 # ----------------------------
 # Rutas base
 # ----------------------------
 SDK_BASE = "/opt/intel/quantum-sdk/docker-intel_quantum_sdk_1.1.1.2024-11-15T22_03_32+00_00"
-RUN_DIR = os.path.join(SDK_BASE, "quantum_runs")
 WORKSPACE_DIR = "/workspace/test_simulador"
 
 # ----------------------------
 # Preparar entorno
 # ----------------------------
-os.makedirs(RUN_DIR, exist_ok=True)
-os.chdir(RUN_DIR)
+art = Artefactos(prefijo="rotaciones_")
+os.chdir(art.directorio)
 os.environ["LD_LIBRARY_PATH"] = f"{SDK_BASE}/lib:{SDK_BASE}/virtualenv/lib:{os.environ.get('LD_LIBRARY_PATH','')}"
 compiler_path = os.path.join(SDK_BASE, "intel-quantum-compiler")
 
@@ -46,10 +49,7 @@ rz({theta3}) qubit_register[0];
 # ----------------------------
 translated = translate(qasm_example, kernel_name='rotaciones_kernel')
 
-cpp_path = os.path.join(RUN_DIR, "rotaciones.cpp")
-with open(cpp_path, "w", encoding="utf8") as f:
-    for line in translated:
-        f.write(line + "\n")
+cpp_path = art.escribir("rotaciones.cpp", translated)
 
 # ----------------------------
 # Compilar y ejecutar
@@ -81,10 +81,7 @@ intelqsdk.cbindings.FullStateSimulator.displayAmplitudes(amps, qbit_ref)
 
 
 # ----------------------------
-# Limpieza automática
+# Limpieza: se borra el directorio de trabajo entero
 # ----------------------------
-for filename in os.listdir(RUN_DIR):
-    try:
-        os.remove(os.path.join(RUN_DIR, filename))
-    except Exception:
-        pass
+os.chdir(WORKSPACE_DIR)
+art.cerrar()